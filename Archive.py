@@ -0,0 +1,110 @@
+"""
+Static Functionfile
+
+Cold storage for events that have passed, kept as one load in string file per year in a folder,
+        files are only read when a year is asked for
+
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+import os
+from heapq import merge
+from itertools import groupby
+
+import Utility
+
+
+# CONSTANTS
+ARCHIVE_FILE_EXTENSION = ".txt"
+
+
+# FUNCTIONS
+def get_archive_file_path(archive_folder: str, year: str) -> str:
+    """
+    :param archive_folder:
+    :param year: four digit year
+    :return: path of the archive file of the year
+    """
+    return os.path.join(archive_folder, year + ARCHIVE_FILE_EXTENSION)
+
+
+def get_archived_years(archive_folder: str) -> list:
+    """
+    :param archive_folder:
+    :return: [four digit year, ...] of the years with an archive file, in order
+    """
+    if not os.path.isdir(archive_folder):
+        return []
+    return sorted(file_name[:-len(ARCHIVE_FILE_EXTENSION)] for file_name in
+            os.listdir(archive_folder) if file_name.endswith(ARCHIVE_FILE_EXTENSION))
+
+
+def read_archive(archive_folder: str, year: str) -> list:
+    """
+    Read in the archived events of a year
+    :param archive_folder:
+    :param year: four digit year
+    :return: [load in string, ...] in chronological order, empty if the year has no archive file
+    """
+    archive_file_path = get_archive_file_path(archive_folder, year)
+    if not os.path.isfile(archive_file_path):
+        return []
+    return [load_in_string for load_in_string in Utility.read_in_txt_as_list(archive_file_path)
+            if load_in_string]
+
+
+def write_archive(archive_folder: str, load_in_strings: list) -> dict:
+    """
+    Add events to the archive files of their years, only the files of those years are read and
+            rewritten, each stays in chronological order
+    :param archive_folder: created if nonexistent
+    :param load_in_strings: [load in string, ...] in chronological order, as returned by
+            Schedule.archive_events
+    :return: {four digit year:number of events added}
+    """
+    if not os.path.isdir(archive_folder):
+        os.mkdir(archive_folder)
+    added_counts = {}
+    for year, year_load_in_strings in groupby(load_in_strings, key=_get_year):
+        year_load_in_strings = list(year_load_in_strings)
+        Utility.output_list_to_txt(output=list(merge(
+                    (load_in_string + '\n' for load_in_string in
+                        read_archive(archive_folder, year)),
+                    year_load_in_strings, key=_get_sort_key)),
+                output_file_absolute_path=get_archive_file_path(archive_folder, year),
+                overwrite=True)
+        added_counts[year] = len(year_load_in_strings)
+    return added_counts
+
+
+def remove_archive(archive_folder: str, year: str):
+    """
+    Remove the archive file of a year, if it exists
+    :param archive_folder:
+    :param year: four digit year
+    :return: void
+    """
+    archive_file_path = get_archive_file_path(archive_folder, year)
+    if os.path.isfile(archive_file_path):
+        os.remove(archive_file_path)
+
+
+def _get_year(load_in_string: str) -> str:
+    """
+    :param load_in_string: of an ATTENDANCE or DEADLINE event
+    :return: four digit year of the date of the event
+    """
+    return load_in_string.split("|", 2)[1][:4]
+
+
+def _get_sort_key(load_in_string: str) -> (str, str):
+    """
+    :param load_in_string: of an ATTENDANCE or DEADLINE event
+    :return: (date, time), which sort chronologically as the dates and times are zero padded
+    """
+    fields = load_in_string.split("|", 3)
+    return fields[1], fields[2]
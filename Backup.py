@@ -0,0 +1,291 @@
+"""
+Static Functionfile
+
+Incremental backups of the schedule, kept as files in a folder. A full backup holds every load in
+        string of the schedule, a delta backup holds only the load in strings removed since the
+        backup before it, each as '-<load in string>', and those added, each as '+<load in string>',
+        after a first line naming the backup it applies to. A full backup is written every so many
+        deltas, so that restoring any backup replays only a few deltas onto the full backup before
+        them. Backup file names start with their timestamp, so they sort in the order written
+
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+import datetime
+import os
+import re
+from collections import Counter
+from heapq import merge
+
+import Utility
+from Event import ENUM_Event_Type
+
+
+# CONSTANTS
+FULL_FILE_EXTENSION = ".txt"
+DELTA_FILE_EXTENSION = ".delta.txt"
+PARENT_PREFIX = "PARENT|"  # first line of a delta backup, followed by the file name of the backup
+        # it applies to
+TIMESTAMP_FORMAT = "%Y-%m-%d %H.%M.%S.%f"
+TIMESTAMP_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}\.\d{2}\.\d{2}(\.\d+)?")  # also matches
+        # the timestamps of backups written before deltas, which lack the microseconds when 0, and
+        # follow the label rather than lead the name
+FULL_BACKUP_EVERY_DEFAULT = 10  # most delta backups between full backups
+
+
+# VARIABLES
+_latest_backups = {}  # {backups folder:(file name, Counter of the load in strings)} of the
+        # latest backup written to each folder, so the next delta need not replay the backups
+        # before it
+
+
+# FUNCTIONS
+def get_backup_file_names(backups_folder: str) -> list:
+    """
+    :param backups_folder:
+    :return: [file name, ...] of the backups in the folder, in the order written
+    """
+    if not os.path.isdir(backups_folder):
+        return []
+    backup_file_names = [file_name for file_name in os.listdir(backups_folder) if
+            file_name.endswith(FULL_FILE_EXTENSION) and TIMESTAMP_PATTERN.search(file_name)]
+    return sorted(backup_file_names, key=lambda file_name: (_get_timestamp(file_name), file_name))
+
+
+def is_delta_backup(file_name: str) -> bool:
+    """
+    :param file_name: of a backup
+    :return: True if the backup is a delta backup
+    """
+    return file_name.endswith(DELTA_FILE_EXTENSION)
+
+
+def read_backup(backups_folder: str, file_name: str) -> list:
+    """
+    Read in the schedule as it was backed up, replaying the delta backups since the full backup
+            before it
+    :param backups_folder:
+    :param file_name: of the backup
+    :return: [load in string, ...] in the order of an events file, events of the same date and time
+            may be in another order than they were, as ids are not backed up
+    """
+    deltas = []  # [[delta line, ...], ...], latest first
+    while is_delta_backup(file_name):
+        delta_lines = _read_lines(backups_folder, file_name)
+        deltas.append(delta_lines[1:])
+        file_name = _get_parent(file_name, delta_lines[:1])
+    load_in_strings = _read_lines(backups_folder, file_name)
+    for delta_lines in reversed(deltas):
+        load_in_strings = _apply_delta(load_in_strings, delta_lines)
+    return load_in_strings
+
+
+def is_backup_readable(backups_folder: str, file_name: str) -> bool:
+    """
+    Check that every backup a backup is read from exists, reading only the first line of each delta
+    :param backups_folder:
+    :param file_name: of a backup
+    :return: False if a backup it depends on has been removed or damaged
+    """
+    try:
+        while is_delta_backup(file_name):
+            with open(os.path.join(backups_folder, file_name), 'r') as delta_file:
+                file_name = _get_parent(file_name, [delta_file.readline().rstrip('\n')])
+        return os.path.isfile(os.path.join(backups_folder, file_name))
+    except Exception:  # a delta is gone or does not name its backup
+        return False
+
+
+def write_backup(backups_folder: str, load_in_strings: list, label: str="",
+        full_backup_every: int=FULL_BACKUP_EVERY_DEFAULT) -> str:
+    """
+    Back up the schedule, as a delta on the latest backup unless full_backup_every deltas have been
+            written since the latest full backup, or the latest backup can not be read as a backup
+            it depends on has been removed, which starts a new chain of deltas
+    :param backups_folder: created if nonexistent
+    :param load_in_strings: [load in string, ...] of the schedule, as
+            Schedule.list_of_load_in_strings_for_events gives
+    :param label: put in the file name after the timestamp, if given
+    :param full_backup_every: most delta backups between full backups, 0 for only full backups
+    :return: file name of the backup written
+    """
+    if not os.path.isdir(backups_folder):
+        os.mkdir(backups_folder)
+    load_in_strings = [load_in_string.rstrip('\n') for load_in_string in load_in_strings]
+    backup_file_names = get_backup_file_names(backups_folder)
+    file_name_start = _get_file_name_start(backup_file_names, label)
+    delta_count = _get_delta_count(backup_file_names)
+    counts = Counter(load_in_strings)
+    backed_up_counts = None  # of the latest backup, if a delta is to be written on it
+    if backup_file_names and delta_count < full_backup_every:
+        latest_file_name, backed_up_counts = _latest_backups.get(backups_folder, (None, None))
+        if latest_file_name != backup_file_names[-1]:
+            backed_up_counts = Counter(read_backup(backups_folder, backup_file_names[-1])) if \
+                    is_backup_readable(backups_folder, backup_file_names[-1]) else None
+    if backed_up_counts is None:
+        file_name = file_name_start + FULL_FILE_EXTENSION
+        output = [load_in_string + '\n' for load_in_string in load_in_strings]
+    else:
+        file_name = file_name_start + DELTA_FILE_EXTENSION
+        output = [PARENT_PREFIX + backup_file_names[-1] + '\n'] + \
+                ['-' + load_in_string + '\n' for load_in_string in
+                    _get_removed(backed_up_counts, counts)] + \
+                ['+' + load_in_string + '\n' for load_in_string in
+                    _get_removed(counts, backed_up_counts)]
+    Utility.output_list_to_txt(output=output,
+            output_file_absolute_path=os.path.join(backups_folder, file_name), overwrite=True)
+    _latest_backups[backups_folder] = (file_name, counts)
+    return file_name
+
+
+def write_changes_backup(backups_folder: str, parent_file_name: str, removed_load_in_strings: list,
+        added_load_in_strings: list, label: str="",
+        full_backup_every: int=FULL_BACKUP_EVERY_DEFAULT) -> str or None:
+    """
+    Back up the changes made to the schedule since a backup, as a delta on it, without going
+            through the whole schedule as write_backup does. Nothing is written if the backup is
+            not the latest one, can not be read, or a full backup is due, in which case
+            write_backup is to be used instead
+    :param backups_folder:
+    :param parent_file_name: file name of the backup the changes were made since
+    :param removed_load_in_strings: [load in string, ...] of the events deleted, or as they were
+            before being modified, as Schedule.pop_backup_changes gives
+    :param added_load_in_strings: [load in string, ...] of the events added, or as they are after
+            being modified
+    :param label: put in the file name after the timestamp, if given
+    :param full_backup_every: most delta backups between full backups, 0 for only full backups
+    :return: file name of the backup written, None if none was
+    """
+    backup_file_names = get_backup_file_names(backups_folder) if os.path.isdir(backups_folder) \
+            else []
+    if not backup_file_names or backup_file_names[-1] != parent_file_name or \
+            _get_delta_count(backup_file_names) >= full_backup_every or \
+            not is_backup_readable(backups_folder, parent_file_name):
+        return None
+    removed_load_in_strings = sorted((load_in_string.rstrip('\n') for load_in_string in
+            removed_load_in_strings), key=_get_sort_key)
+    added_load_in_strings = sorted((load_in_string.rstrip('\n') for load_in_string in
+            added_load_in_strings), key=_get_sort_key)
+    file_name = _get_file_name_start(backup_file_names, label) + DELTA_FILE_EXTENSION
+    output = [PARENT_PREFIX + parent_file_name + '\n'] + \
+            ['-' + load_in_string + '\n' for load_in_string in removed_load_in_strings] + \
+            ['+' + load_in_string + '\n' for load_in_string in added_load_in_strings]
+    Utility.output_list_to_txt(output=output,
+            output_file_absolute_path=os.path.join(backups_folder, file_name), overwrite=True)
+    latest_file_name, counts = _latest_backups.pop(backups_folder, (None, None))
+    if latest_file_name == parent_file_name:  # kept up to date rather than read back later
+        counts.subtract(removed_load_in_strings)
+        counts.update(added_load_in_strings)
+        for load_in_string in removed_load_in_strings:
+            if counts[load_in_string] <= 0:
+                del counts[load_in_string]
+        _latest_backups[backups_folder] = (file_name, counts)
+    return file_name
+
+
+def _apply_delta(load_in_strings: list, delta_lines: list) -> list:
+    """
+    :param load_in_strings: [load in string, ...] of the backup the delta applies to
+    :param delta_lines: ['-<load in string>' or '+<load in string>', ...] in chronological order
+    :return: [load in string, ...] after the delta, the added ones merged in chronologically
+    """
+    removed_counts = Counter(delta_line[1:] for delta_line in delta_lines if
+            delta_line.startswith('-'))
+    kept_load_in_strings = []
+    for load_in_string in load_in_strings:
+        if removed_counts[load_in_string] > 0:
+            removed_counts[load_in_string] -= 1
+        else:
+            kept_load_in_strings.append(load_in_string)
+    return list(merge(kept_load_in_strings, [delta_line[1:] for delta_line in delta_lines if
+            delta_line.startswith('+')], key=_get_sort_key))
+
+
+def _get_removed(counts: Counter, later_counts: Counter) -> list:
+    """
+    :param counts: {load in string:count}
+    :param later_counts: {load in string:count}
+    :return: [load in string, ...] of those fewer times in later_counts, once per fewer, in
+            chronological order
+    """
+    removed = []
+    for load_in_string, count in counts.items() - later_counts.items():  # compared in C, only
+            # the few changed are looped over
+        removed.extend([load_in_string] * (count - later_counts.get(load_in_string, 0)))
+    return sorted(removed, key=_get_sort_key)
+
+
+def _get_delta_count(backup_file_names: list) -> int:
+    """
+    :param backup_file_names: [file name, ...] oldest first, as get_backup_file_names gives
+    :return: how many delta backups there are since the latest full backup
+    """
+    delta_count = 0
+    for backup_file_name in reversed(backup_file_names):
+        if not is_delta_backup(backup_file_name):
+            break
+        delta_count += 1
+    return delta_count
+
+
+def _get_file_name_start(backup_file_names: list, label: str) -> str:
+    """
+    :param backup_file_names: [file name, ...] oldest first, as get_backup_file_names gives
+    :param label: put after the timestamp, if given
+    :return: file name of a new backup, without its extension, timestamped after every existing
+            backup
+    """
+    timestamp = datetime.datetime.now().strftime(TIMESTAMP_FORMAT)
+    if backup_file_names and timestamp <= _get_timestamp(backup_file_names[-1]):  # within the
+            # same microsecond, or the clock went back, which would put the backup out of order
+        timestamp = (datetime.datetime.strptime(_get_timestamp(backup_file_names[-1]),
+                TIMESTAMP_FORMAT) + datetime.timedelta(microseconds=1)).strftime(TIMESTAMP_FORMAT)
+    return timestamp + (" " + label if label else "")
+
+
+def _get_parent(file_name: str, first_lines: list) -> str:
+    """
+    :param file_name: of a delta backup
+    :param first_lines: [first line] of the delta backup, empty if it is empty
+    :return: file name of the backup the delta applies to
+    """
+    if not first_lines or not first_lines[0].startswith(PARENT_PREFIX):
+        raise Exception("delta backup '" + file_name + "' does not name the backup it applies to")
+    return first_lines[0][len(PARENT_PREFIX):]
+
+
+def _read_lines(backups_folder: str, file_name: str) -> list:
+    """
+    :param backups_folder:
+    :param file_name: of a backup
+    :return: [line, ...] of the backup, without blank lines
+    """
+    backup_file_path = os.path.join(backups_folder, file_name)
+    if not os.path.isfile(backup_file_path):
+        raise Exception("backup '" + file_name + "' does not exist")
+    return [line for line in Utility.read_in_txt_as_list(backup_file_path) if line]
+
+
+def _get_timestamp(file_name: str) -> str:
+    """
+    :param file_name: of a backup
+    :return: timestamp of the backup, with the microseconds, so that timestamps sort in time order
+    """
+    timestamp = TIMESTAMP_PATTERN.search(file_name).group(0)
+    return timestamp if len(timestamp) > 19 else timestamp + ".000000"
+
+
+def _get_sort_key(load_in_string: str) -> tuple:
+    """
+    :param load_in_string:
+    :return: key sorting as an events file is ordered, ATTENDANCE and DEADLINE events by
+            (date, time), as the dates and times are zero padded, then the recurring events
+    """
+    fields = load_in_string.split("|", 3)
+    if fields[0] == ENUM_Event_Type.RCUR:
+        return 1, "", ""
+    return 0, fields[1], fields[2]
@@ -0,0 +1,99 @@
+"""
+Compares the throughput of a Schedule keeping its event order in a Nested_Key_Index against a
+        Flat_Key_Index
+
+Run from the project directory: python Benchmarks/Benchmark_Layout.py [event count]
+
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+import gc
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Benchmark_Memory import DEFAULT_EVENT_COUNT, get_load_in_strings
+from Schedule import Schedule
+
+
+# CONSTANTS
+ITERATE_REPEATS = 5  # full iterations timed per layout, as one is quick
+RANGE_QUERY_COUNT = 2000  # one week iterations timed per layout
+
+
+# FUNCTIONS
+def time_call(function) -> float:
+    """
+    :param function: takes no arguments
+    :return: seconds taken to call the function
+    """
+    gc.collect()
+    start_seconds = time.perf_counter()
+    function()
+    return time.perf_counter() - start_seconds
+
+
+def measure_layout(load_in_strings: list, nested: bool) -> list:
+    """
+    Time the operations of a Schedule using a layout
+    :param load_in_strings:
+    :param nested: passed to the Schedule
+    :return: [(operation name, seconds), ...]
+    """
+    schedule = None
+
+    def load():
+        nonlocal schedule
+        schedule = Schedule(load_in_events=load_in_strings, nested=nested)
+
+    def iterate():
+        for _ in range(ITERATE_REPEATS):
+            for _ in schedule.iter_events():
+                pass
+
+    def query_ranges():
+        for start_date, end_date in week_ranges:
+            for _ in schedule.iter_events(start_date=start_date, end_date=end_date):
+                pass
+
+    def print_schedule():
+        schedule.get_print_str()
+
+    def delete():
+        for event_id in deleted_ids:
+            schedule.delete_event(event_id)
+
+    timings = [("add", time_call(load))]
+    generator = random.Random(0)
+    dates = sorted({event.date for _, event in schedule.iter_events()})
+    week_ranges = [(dates[start], dates[min(start + 6, len(dates) - 1)]) for start in
+            (generator.randrange(len(dates)) for _ in range(RANGE_QUERY_COUNT))]
+    deleted_ids = generator.sample(range(1, len(load_in_strings) + 1), len(load_in_strings) // 2)
+    timings.append(("iterate x" + str(ITERATE_REPEATS), time_call(iterate)))
+    timings.append(("week range x" + str(RANGE_QUERY_COUNT), time_call(query_ranges)))
+    timings.append(("print", time_call(print_schedule)))
+    timings.append(("delete half", time_call(delete)))
+    return timings
+
+
+
+
+
+# MAIN
+if __name__ == '__main__':
+    event_count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_EVENT_COUNT
+    load_in_strings = get_load_in_strings(event_count)
+    print("Events: " + str(event_count))
+    nested_timings = measure_layout(load_in_strings, nested=True)
+    flat_timings = measure_layout(load_in_strings, nested=False)
+    print("operation".ljust(20) + "nested (s)".rjust(12) + "flat (s)".rjust(12))
+    for (operation, nested_seconds), (_, flat_seconds) in zip(nested_timings, flat_timings):
+        print(operation.ljust(20) + ("%.3f" % nested_seconds).rjust(12) +
+                ("%.3f" % flat_seconds).rjust(12))
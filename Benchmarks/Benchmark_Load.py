@@ -0,0 +1,65 @@
+"""
+Compares the time taken to load a Schedule from an events file of load in strings against a binary
+        snapshot of the same events
+
+Run from the project directory: python Benchmarks/Benchmark_Load.py [event count]
+
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+import gc
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Binary_Snapshot
+import Utility
+from Benchmark_Memory import DEFAULT_EVENT_COUNT, get_load_in_strings
+from Event import Base_Event
+from Schedule import Schedule
+
+
+# FUNCTIONS
+def time_call(function) -> float:
+    """
+    :param function: takes no arguments
+    :return: seconds taken to call the function
+    """
+    gc.collect()
+    start_seconds = time.perf_counter()
+    function()
+    return time.perf_counter() - start_seconds
+
+
+
+
+
+# MAIN
+if __name__ == '__main__':
+    event_count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_EVENT_COUNT
+    load_in_strings = Schedule(load_in_events=get_load_in_strings(
+            event_count)).list_of_load_in_strings_for_events()  # in the order saved
+    print("Events: " + str(event_count))
+    with tempfile.TemporaryDirectory() as directory:
+        text_path = os.path.join(directory, "events.txt")
+        binary_path = os.path.join(directory, "events.bin")
+        Utility.output_list_to_txt(output=load_in_strings, output_file_absolute_path=text_path,
+                overwrite=True)
+        Binary_Snapshot.convert_text_to_binary(text_path, binary_path)
+        print("file size:  text " + str(os.path.getsize(text_path)) + " bytes, binary " +
+                str(os.path.getsize(binary_path)) + " bytes")
+        print("parse only: text %.2f s, binary %.2f s" % (
+                time_call(lambda: [Base_Event.from_load_in_string(load_in_string) for
+                    load_in_string in Utility.read_in_txt_as_list(text_path)]),
+                time_call(lambda: Binary_Snapshot.read_events(binary_path))))
+        print("cold load:  text %.2f s, binary %.2f s" % (
+                time_call(lambda: Schedule(load_in_events=Utility.read_in_txt_as_list(
+                    text_path))),
+                time_call(lambda: Schedule(events=Binary_Snapshot.read_events(binary_path)))))
@@ -0,0 +1,102 @@
+"""
+Measures the memory held and the time taken by a Schedule loading many events
+
+Run from the project directory: python Benchmarks/Benchmark_Memory.py [event count]
+
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Date_Time import get_date_str
+from Schedule import Schedule
+
+
+# CONSTANTS
+DEFAULT_EVENT_COUNT = 100000
+FIRST_DAY_ORDINAL = 737791  # 2021-01-01
+DAY_COUNT = 365
+TAGS = ("work", "school", "home", "gym", "family", "health", "errands", "travel")
+
+
+# FUNCTIONS
+def get_load_in_strings(event_count: int) -> list:
+    """
+    Generate the load in strings of a year of events, the same on every run
+    :param event_count:
+    :return: [load in string, ...]
+    """
+    generator = random.Random(0)
+    load_in_strings = []
+    for event_number in range(event_count):
+        date = get_date_str(FIRST_DAY_ORDINAL + generator.randrange(DAY_COUNT))
+        hour = generator.randrange(6, 22)
+        minute = generator.choice((0, 15, 30, 45))
+        tag = generator.choice(TAGS)
+        if event_number % 2:
+            load_in_strings.append("ATND|%s|%02d:%02d|%02d:%02d|%s|meeting %d" % (date, hour,
+                    minute, hour + 1, minute, tag, event_number))
+        else:
+            load_in_strings.append("DDLN|%s|%02d:%02d|%d|%s|deadline %d" % (date, hour, minute,
+                    generator.choice((15, 30, 60, 90)), tag, event_number))
+    return load_in_strings
+
+
+def measure_load(load_in_strings: list, columnar: bool) -> (float, float):
+    """
+    Load a Schedule, tracing its allocations
+    :param load_in_strings:
+    :param columnar: passed to the Schedule
+    :return: First Return Element: bytes held per event once loaded
+    Second Return Element: seconds taken to load
+    """
+    gc.collect()
+    tracemalloc.start()
+    start_seconds = time.perf_counter()
+    schedule = Schedule(load_in_events=load_in_strings, columnar=columnar)
+    load_seconds = time.perf_counter() - start_seconds
+    gc.collect()
+    held_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del schedule
+    return held_bytes / len(load_in_strings), load_seconds
+
+
+def measure_load_time(load_in_strings: list, columnar: bool) -> float:
+    """
+    Time loading a Schedule without tracing, as tracing slows allocation down
+    :param load_in_strings:
+    :param columnar: passed to the Schedule
+    :return: seconds taken to load
+    """
+    gc.collect()
+    start_seconds = time.perf_counter()
+    Schedule(load_in_events=load_in_strings, columnar=columnar)
+    return time.perf_counter() - start_seconds
+
+
+
+
+
+# MAIN
+if __name__ == '__main__':
+    event_count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_EVENT_COUNT
+    load_in_strings = get_load_in_strings(event_count)
+    print("Events: " + str(event_count))
+    for columnar in (False, True):
+        bytes_per_event, _ = measure_load(load_in_strings, columnar)
+        load_seconds = measure_load_time(load_in_strings, columnar)
+        print(("columnar" if columnar else "object  ") + " store: " +
+                ("%.0f" % bytes_per_event).rjust(6) + " bytes/event, load " +
+                ("%.2f" % load_seconds).rjust(6) + " s")
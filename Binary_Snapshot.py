@@ -0,0 +1,190 @@
+"""
+Static Functionfile
+
+A compact binary form of the events file, loaded with little work per event. The file is a header
+        followed by blocks of events, each block being a table of the distinct strings its events
+        use followed by a fixed size record per event that refers to the strings by position, so
+        that loading a block is one decode and split of its string table and one struct unpack of
+        its records, rather than splitting and trying to parse every line. Each block holds a CRC-32
+        of its contents, so a damaged file is refused rather than loaded wrong
+
+File layout, little endian:
+    header: FILE_MAGIC, version (unsigned short)
+    per block: event count, string table bytes (unsigned ints), CRC-32 of the string table and
+            the records (unsigned int), then the string table, the strings joined by '\n' in UTF-8,
+            then the records
+    record: type code (unsigned char), date, time (string positions, unsigned ints), end time
+            string position or duration, -1 if None (int), tag, description (string positions,
+            unsigned ints). Recurring events are rare and are kept whole, as the load in string in
+            the description position
+
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+import os
+import struct
+import zlib
+
+import Utility
+from Event import Base_Event, Attendance_Event, Deadline_Event, ENUM_Event_Type
+
+
+# CONSTANTS
+FILE_MAGIC = b"SCHEDBIN"
+FILE_VERSION = 1
+HEADER_STRUCT = struct.Struct("<8sH")
+BLOCK_HEADER_STRUCT = struct.Struct("<III")
+RECORD_STRUCT = struct.Struct("<BIIiII")
+BLOCK_EVENT_COUNT = 1 << 16  # most events in a block
+TYPE_CODES = {ENUM_Event_Type.ATND: 0, ENUM_Event_Type.DDLN: 1, ENUM_Event_Type.RCUR: 2}
+
+
+# FUNCTIONS
+def to_bytes(events) -> bytes:
+    """
+    :param events: iterable of Event subclass instances, stored in this order
+    :return: the contents of a binary snapshot of the events
+    """
+    chunks = [HEADER_STRUCT.pack(FILE_MAGIC, FILE_VERSION)]
+    block_events = []
+    for event in events:
+        block_events.append(event)
+        if len(block_events) == BLOCK_EVENT_COUNT:
+            chunks.extend(_get_block_chunks(block_events))
+            block_events = []
+    if block_events:
+        chunks.extend(_get_block_chunks(block_events))
+    return b"".join(chunks)
+
+
+def from_bytes(contents: bytes) -> list:
+    """
+    :param contents: of a binary snapshot
+    :return: [Event subclass instance, ...] in the order stored
+    """
+    magic, version = HEADER_STRUCT.unpack_from(contents, 0)
+    if magic != FILE_MAGIC:
+        raise Exception("contents are not a binary snapshot")
+    if version != FILE_VERSION:
+        raise Exception("binary snapshot version " + str(version) + " is not supported")
+    events = []
+    position = HEADER_STRUCT.size
+    while position < len(contents):
+        event_count, string_table_size, checksum = BLOCK_HEADER_STRUCT.unpack_from(contents,
+                position)
+        position += BLOCK_HEADER_STRUCT.size
+        block_end = position + string_table_size + event_count * RECORD_STRUCT.size
+        block = contents[position:block_end]
+        if len(block) != block_end - position or zlib.crc32(block) != checksum:
+            raise Exception("binary snapshot block at byte " + str(position -
+                    BLOCK_HEADER_STRUCT.size) + " is damaged")
+        strings = block[:string_table_size].decode("utf-8").split("\n")
+        for type_code, date, time, third, tag, description in RECORD_STRUCT.iter_unpack(
+                block[string_table_size:]):
+            if type_code == 0:
+                events.append(Attendance_Event(strings[date], strings[time],
+                        None if third < 0 else strings[third], strings[tag], strings[description]))
+            elif type_code == 1:
+                events.append(Deadline_Event(strings[date], strings[time],
+                        None if third < 0 else third, strings[tag], strings[description]))
+            else:
+                events.append(Base_Event.from_load_in_string(strings[description]))
+        position = block_end
+    return events
+
+
+def write_events(file_path: str, events):
+    """
+    Write a binary snapshot file
+    :param file_path:
+    :param events: iterable of Event subclass instances
+    :return: void
+    """
+    with open(file_path, 'wb') as binary_file:
+        binary_file.write(to_bytes(events))
+
+
+def read_events(file_path: str) -> list:
+    """
+    Read a binary snapshot file
+    :param file_path:
+    :return: [Event subclass instance, ...] in the order stored
+    """
+    with open(file_path, 'rb') as binary_file:
+        return from_bytes(binary_file.read())
+
+
+def convert_text_to_binary(text_file_path: str, binary_file_path: str) -> int:
+    """
+    Convert an events file of load in strings to a binary snapshot file
+    :param text_file_path:
+    :param binary_file_path:
+    :return: number of events converted
+    """
+    events = []
+    for load_in_string in Utility.read_in_txt_as_list(text_file_path):
+        if load_in_string:
+            event = Base_Event.from_load_in_string(load_in_string)
+            if event is None:
+                raise Exception("load in string could not be parsed to any subclass of Event")
+            events.append(event)
+    write_events(binary_file_path, events)
+    return len(events)
+
+
+def convert_binary_to_text(binary_file_path: str, text_file_path: str) -> int:
+    """
+    Convert a binary snapshot file to an events file of load in strings
+    :param binary_file_path:
+    :param text_file_path:
+    :return: number of events converted
+    """
+    events = read_events(binary_file_path)
+    Utility.output_list_to_txt(output=[event.to_load_in_string() + '\n' for event in events],
+            output_file_absolute_path=text_file_path, overwrite=True)
+    return len(events)
+
+
+def is_binary_snapshot(file_path: str) -> bool:
+    """
+    :param file_path:
+    :return: True if the file exists and starts as a binary snapshot does
+    """
+    if not os.path.isfile(file_path):
+        return False
+    with open(file_path, 'rb') as binary_file:
+        return binary_file.read(len(FILE_MAGIC)) == FILE_MAGIC
+
+
+def _get_block_chunks(events: list) -> list:
+    """
+    :param events: [Event subclass instance, ...] of a block
+    :return: [block header, string table, records], as bytes
+    """
+    string_positions = {}  # {string:position in the string table}
+    records = []
+    for event in events:
+        type_code = TYPE_CODES[event.event_type]
+        if type_code == 2:
+            records.append(RECORD_STRUCT.pack(type_code, 0, 0, -1, 0, string_positions.setdefault(
+                    event.to_load_in_string(), len(string_positions))))
+            continue
+        if type_code == 0:
+            third = -1 if event.end_time is None else string_positions.setdefault(event.end_time,
+                    len(string_positions))
+        else:
+            third = -1 if event.duration is None else event.duration
+        records.append(RECORD_STRUCT.pack(type_code,
+                string_positions.setdefault(event.date, len(string_positions)),
+                string_positions.setdefault(event.time, len(string_positions)), third,
+                string_positions.setdefault(event.tag, len(string_positions)),
+                string_positions.setdefault(event.description, len(string_positions))))
+    string_table = "\n".join(string_positions).encode("utf-8")  # dicts keep insertion order,
+            # which is the order of the positions
+    records = b"".join(records)
+    return [BLOCK_HEADER_STRUCT.pack(len(events), len(string_table),
+            zlib.crc32(string_table + records)), string_table, records]
@@ -0,0 +1,56 @@
+"""
+Static Functionfile
+
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+from datetime import date as datetime_date
+
+
+# CONSTANTS
+MINUTES_PER_DAY = 1440
+DAY_ORDINAL_MAX = datetime_date.max.toordinal()
+DAY_NAMES_PRINT = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")  # from Monday to Sunday
+
+
+# FUNCTIONS
+def get_day_ordinal(date: str) -> int:
+    """
+    Get the proleptic Gregorian ordinal of a date
+    :param date: a date string of the form given by Input_Parser, like 'YYYY-MM-DD Ddd'
+    :return:
+    """
+    year, month, day = date.partition(" ")[0].split("-")
+    return datetime_date(int(year), int(month), int(day)).toordinal()
+
+
+def get_date_str(day_ordinal: int) -> str:
+    """
+    Get the date string of a proleptic Gregorian ordinal, the inverse of "get_day_ordinal"
+    :param day_ordinal:
+    :return: a date string like 'YYYY-MM-DD Ddd'
+    """
+    date = datetime_date.fromordinal(day_ordinal)
+    return "%04d-%02d-%02d " % (date.year, date.month, date.day) + DAY_NAMES_PRINT[date.weekday()]
+
+
+def get_minutes(time: str) -> int:
+    """
+    Get the number of minutes since midnight of a time
+    :param time: a time string of the form 'HH:MM'
+    :return:
+    """
+    return int(time[:2]) * 60 + int(time[3:5])
+
+
+def get_time_str(minutes: int) -> str:
+    """
+    Get the time string of a number of minutes since midnight, the inverse of "get_minutes"
+    :param minutes: 0 to 1439
+    :return: a time string like 'HH:MM'
+    """
+    return "%02d:%02d" % divmod(minutes, 60)
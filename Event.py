@@ -9,16 +9,30 @@ __author__ = "Cole Anderson"
 
 # IMPORTS
 from abc import ABC, abstractmethod
+from calendar import monthrange
+from datetime import date as datetime_date
+from itertools import islice
+from sys import intern
+
+from Date_Time import DAY_ORDINAL_MAX, get_day_ordinal, get_date_str
 
 
 # ENUMS
 class ENUM_Event_Type:
     ATND = "ATND"  # attendance
     DDLN = "DDLN"  # deadline
+    RCUR = "RCUR"  # recurring
+
+
+class ENUM_Recurrence_Frequency:
+    DAILY = "DAILY"
+    WEEKLY = "WEEKLY"
+    MONTHLY = "MONTHLY"
 
 
 # ABSTRACT CLASS
 class Base_Event(ABC):
+    __slots__ = ()  # subclasses list their fields in __slots__, in constructor argument order
 
     @classmethod
     @abstractmethod
@@ -26,6 +40,8 @@ class Base_Event(ABC):
         event = Attendance_Event.from_load_in_string(load_in_string)
         if event is None:  # load in string was not identified to represent an Attendance event
             event = Deadline_Event.from_load_in_string(load_in_string)
+        if event is None:  # nor a Deadline event
+            event = Recurring_Event.from_load_in_string(load_in_string)
         return event  # could, in an error case where the load_in_string could not be parsed, be
                 # None
 
@@ -33,14 +49,26 @@ class Base_Event(ABC):
     def to_load_in_string(self):
         pass
 
+    def copy_with(self, **field_values):
+        """
+        :param field_values: the fields to change, by field name
+        :return: a new event of the same type, with the fields of this one except those given
+        """
+        fields = {field_name: getattr(self, field_name) for field_name in self.__slots__ if
+                not field_name.startswith("_")}
+        fields.update(field_values)
+        return type(self)(**fields)
+
     def __repr__(self):
-        return str(self.__dict__)
+        return str({field_name: getattr(self, field_name) for field_name in self.__slots__ if
+                not field_name.startswith("_")})
 
 
 # DERIVED CLASSES
 
 class Attendance_Event(Base_Event):
     event_type = ENUM_Event_Type.ATND
+    __slots__ = ("date", "time", "end_time", "tag", "description")
 
     def __init__(self, date: str, time: str, end_time: str or None, tag: str, description: str):
         """
@@ -53,10 +81,11 @@ class Attendance_Event(Base_Event):
                 group them
         :param description: string identifying event
         """
-        self.date = date
-        self.time = time
-        self.end_time = end_time
-        self.tag = tag
+        self.date = intern(date)  # interned, as the same dates, times and tags recur across many
+                # events
+        self.time = intern(time)
+        self.end_time = None if end_time is None else intern(end_time)
+        self.tag = intern(tag)
         self.description = description
 
 
@@ -84,6 +113,7 @@ class Attendance_Event(Base_Event):
 
 class Deadline_Event(Base_Event):
     event_type = ENUM_Event_Type.DDLN
+    __slots__ = ("date", "time", "duration", "tag", "description")
 
     def __init__(self, date: str, time: str, duration: int or None, tag: str, description: str):
         """
@@ -96,10 +126,11 @@ class Deadline_Event(Base_Event):
                 group them
         :param description: string identifying event
         """
-        self.date = date
-        self.time = time
+        self.date = intern(date)  # interned, as the same dates, times and tags recur across many
+                # events
+        self.time = intern(time)
         self.duration = duration
-        self.tag = tag
+        self.tag = intern(tag)
         self.description = description
 
 
@@ -124,3 +155,144 @@ class Deadline_Event(Base_Event):
                 ("" if self.duration is None else str(self.duration)) + "|" + self.tag + "|" + \
                 self.description
 
+
+class Recurring_Event(Base_Event):
+    event_type = ENUM_Event_Type.RCUR
+    __slots__ = ("frequency", "interval", "weekdays", "until", "count", "template", "_last_day")
+
+    def __init__(self, frequency: str, interval: int, weekdays: tuple, until: str or None,
+            count: int or None, template):
+        """
+        An event repeating by a rule, stored once, with its occurrences generated only for the days
+                asked for
+        :param frequency: an ENUM_Recurrence_Frequency value
+        :param interval: at least 1, the number of days, weeks or months from one occurrence to
+                the next
+        :param weekdays: for a WEEKLY rule, the days of the week it occurs on, as 0 to 6 from
+                Monday, if empty the day of the week of the template
+        :param until: if given, the date of the last day an occurrence can be on
+        :param count: if given, at least 1, the most occurrences there are
+        :param template: an Attendance_Event or Deadline_Event that each occurrence is a copy of,
+                with its date being the first day an occurrence can be on
+        """
+        self.frequency = intern(frequency)
+        self.interval = interval
+        self.weekdays = tuple(sorted(set(weekdays)))
+        self.until = None if until is None else intern(until)
+        self.count = count
+        self.template = template
+        self._last_day = None  # day ordinal of the last occurrence, set when first needed
+
+
+    @classmethod
+    def from_load_in_string(cls, load_in_string: str):
+        """
+        Secondary constructor
+        :param load_in_string: of the type returned from to_load_in_string
+        :return:
+            if the event type in the load in string matches this subclass of Event:
+                new Recurring_Event object
+            else:
+                None
+        """
+        params = load_in_string.split("|", 6)
+        if params[0] != cls.event_type:
+            return None
+        template = Base_Event.from_load_in_string(params[6])
+        if template is None or isinstance(template, Recurring_Event):
+            return None
+        return cls(frequency=params[1], interval=int(params[2]),
+                weekdays=tuple(int(weekday) for weekday in params[3].split(",") if weekday),
+                until=params[4] if params[4] else None,
+                count=int(params[5]) if params[5] else None, template=template)
+
+
+    def to_load_in_string(self):
+        return self.event_type + "|" + self.frequency + "|" + str(self.interval) + "|" + \
+                ",".join(str(weekday) for weekday in self.weekdays) + "|" + \
+                ("" if self.until is None else self.until) + "|" + \
+                ("" if self.count is None else str(self.count)) + "|" + \
+                self.template.to_load_in_string()
+
+
+    def get_first_day(self) -> int:
+        """
+        :return: the day ordinal of the template, no occurrence is before it
+        """
+        return get_day_ordinal(self.template.date)
+
+
+    def get_last_day(self) -> int:
+        """
+        :return: the day ordinal of the last day an occurrence can be on, found once and kept
+        """
+        if self._last_day is None:
+            last_day = DAY_ORDINAL_MAX if self.until is None else get_day_ordinal(self.until)
+            if self.count is not None:  # the day of the last counted occurrence, if it exists
+                last_day = min(last_day, next(islice(self._iter_occurrence_days(
+                        self.get_first_day()), self.count - 1, None), DAY_ORDINAL_MAX))
+            self._last_day = last_day
+        return self._last_day
+
+
+    def iter_occurrences(self, start_day: int, end_day: int):
+        """
+        Lazily generate the occurrences within a range of days, the days before the range are
+                skipped over without being generated
+        :param start_day: day ordinal, only occurrences on or after this day are generated
+        :param end_day: day ordinal, only occurrences on or before this day are generated
+        :return: generator of (day ordinal, occurrence), where each occurrence is a new event of
+                the type of the template
+        """
+        end_day = min(end_day, self.get_last_day())
+        fields = {field_name: getattr(self.template, field_name) for field_name in
+                self.template.__slots__}
+        for day in self._iter_occurrence_days(start_day):
+            if day > end_day:
+                return
+            fields["date"] = get_date_str(day)
+            yield day, type(self.template)(**fields)
+
+
+    def _iter_occurrence_days(self, start_day: int):
+        """
+        Lazily generate the days of the occurrences from a day on, ignoring "until" and "count"
+        :param start_day: day ordinal
+        :return: generator of day ordinal, in order
+        """
+        first_day = self.get_first_day()
+        start_day = max(start_day, first_day)
+        if self.frequency == ENUM_Recurrence_Frequency.DAILY:
+            day = first_day - (first_day - start_day) // self.interval * self.interval  # the
+                    # first occurrence on or after the start day
+            while day <= DAY_ORDINAL_MAX:
+                yield day
+                day += self.interval
+        elif self.frequency == ENUM_Recurrence_Frequency.WEEKLY:
+            weekdays = self.weekdays if self.weekdays else ((first_day - 1) % 7,)  # day ordinal
+                    # 1 is a Monday
+            week_length = 7 * self.interval
+            first_week_start = first_day - (first_day - 1) % 7
+            week_start = first_week_start + (start_day - first_week_start) // week_length * \
+                    week_length  # the start of the week holding, or last before, the start day
+            while week_start <= DAY_ORDINAL_MAX:
+                for weekday in weekdays:
+                    day = week_start + weekday
+                    if start_day <= day <= DAY_ORDINAL_MAX:
+                        yield day
+                week_start += week_length
+        else:  # ENUM_Recurrence_Frequency.MONTHLY, on the day of the month of the template, months
+                # without that day are skipped
+            first_date = datetime_date.fromordinal(first_day)
+            start_date = datetime_date.fromordinal(start_day)
+            first_month = first_date.year * 12 + first_date.month - 1  # months since year 0
+            month = first_month + (start_date.year * 12 + start_date.month - 1 - first_month) // \
+                    self.interval * self.interval  # the month holding, or last before, the start day
+            while month // 12 <= datetime_date.max.year:
+                year = month // 12
+                if first_date.day <= monthrange(year, month % 12 + 1)[1]:
+                    day = datetime_date(year, month % 12 + 1, first_date.day).toordinal()
+                    if day >= start_day:
+                        yield day
+                month += self.interval
+
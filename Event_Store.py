@@ -0,0 +1,213 @@
+"""
+Classfile
+
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+from array import array
+
+from Date_Time import MINUTES_PER_DAY, get_day_ordinal, get_date_str, get_minutes, get_time_str
+from Event import Attendance_Event, Deadline_Event, ENUM_Event_Type
+
+
+# CONSTANTS
+_TIME_STRS = tuple(get_time_str(minutes) for minutes in range(MINUTES_PER_DAY))  # time string by
+        # minutes since midnight
+
+
+# CLASSES
+class Object_Event_Store:
+    """
+    Holds events by id as the event objects themselves
+    """
+
+    def __init__(self):
+        self.__events = {}  # {id:event}
+
+
+    def __len__(self):
+        return len(self.__events)
+
+
+    def __contains__(self, event_id: int):
+        return event_id in self.__events
+
+
+    def get(self, event_id: int):
+        """
+        :param event_id:
+        :return: the event, None if no event is held under the id
+        """
+        return self.__events.get(event_id)
+
+
+    def add(self, event_id: int, event):
+        """
+        :param event_id: an id not held
+        :param event: (type is a subclass of Event)
+        :return: void
+        """
+        self.__events[event_id] = event
+
+
+    def replace(self, event_id: int, event):
+        """
+        Hold an event in place of the event held under its id, for after modifying an event gotten
+                from the store
+        :param event_id: an id held
+        :param event: (type is a subclass of Event)
+        :return: void
+        """
+        self.__events[event_id] = event
+
+
+    def remove(self, event_id: int):
+        """
+        :param event_id: an id held
+        :return: the removed event
+        """
+        return self.__events.pop(event_id)
+
+
+class Columnar_Event_Store:
+    """
+    Holds events by id in parallel columns indexed by the id, with tags dictionary encoded and
+            descriptions held in one string heap. Events are rebuilt as new objects whenever they are
+            gotten, so modifications of gotten events must be written back with "replace"
+    """
+    _TYPE_CODES = {ENUM_Event_Type.ATND: 1, ENUM_Event_Type.DDLN: 2}  # 0 for no event
+
+    def __init__(self):
+        self.__type_codes = bytearray()
+        self.__day_ordinals = array('i')
+        self.__start_minutes = array('h')
+        self.__ends = array('i')  # end time in minutes for an ATTENDANCE event, duration for a
+                # DEADLINE event, -1 for None
+        self.__tag_codes = array('I')
+        self.__description_offsets = array('Q')  # of the description in the heap
+        self.__description_lengths = array('I')  # in bytes
+        self.__description_heap = bytearray()  # utf-8 encoded descriptions back to back
+        self.__unused_heap_bytes = 0  # bytes of the heap left behind by removed descriptions
+        self.__tags = []  # tag by tag code
+        self.__tag_codes_by_tag = {}  # {tag:tag code}
+        self.__date_strs = {}  # {day ordinal:date string}, so that rebuilt events share strings
+        self.__event_count = 0
+
+
+    def __len__(self):
+        return self.__event_count
+
+
+    def __contains__(self, event_id: int):
+        return 0 <= event_id < len(self.__type_codes) and self.__type_codes[event_id] != 0
+
+
+    def get(self, event_id: int):
+        """
+        :param event_id:
+        :return: a new event object holding the event, None if no event is held under the id
+        """
+        if event_id not in self:
+            return None
+
+        # rebuild fields
+        day_ordinal = self.__day_ordinals[event_id]
+        date = self.__date_strs.get(day_ordinal)
+        if date is None:
+            date = self.__date_strs[day_ordinal] = get_date_str(day_ordinal)
+        end = self.__ends[event_id]
+        offset = self.__description_offsets[event_id]
+        description = self.__description_heap[
+                offset:offset + self.__description_lengths[event_id]].decode()
+
+        if self.__type_codes[event_id] == self._TYPE_CODES[ENUM_Event_Type.ATND]:
+            return Attendance_Event(date=date, time=_TIME_STRS[self.__start_minutes[event_id]],
+                    end_time=None if end == -1 else _TIME_STRS[end],
+                    tag=self.__tags[self.__tag_codes[event_id]], description=description)
+        return Deadline_Event(date=date, time=_TIME_STRS[self.__start_minutes[event_id]],
+                duration=None if end == -1 else end, tag=self.__tags[self.__tag_codes[event_id]],
+                description=description)
+
+
+    def add(self, event_id: int, event):
+        """
+        :param event_id: an id not held, not negative
+        :param event: (type is a subclass of Event)
+        :return: void
+        """
+
+        # grow the columns to reach the id
+        missing_rows = event_id + 1 - len(self.__type_codes)
+        if missing_rows > 0:
+            self.__type_codes.extend(bytes(missing_rows))
+            for column in (self.__day_ordinals, self.__start_minutes, self.__ends,
+                    self.__tag_codes, self.__description_offsets, self.__description_lengths):
+                column.frombytes(bytes(missing_rows * column.itemsize))
+
+        # encode the tag
+        tag_code = self.__tag_codes_by_tag.get(event.tag)
+        if tag_code is None:
+            tag_code = self.__tag_codes_by_tag[event.tag] = len(self.__tags)
+            self.__tags.append(event.tag)
+
+        # fill in the row
+        if event.event_type == ENUM_Event_Type.ATND:
+            end = -1 if event.end_time is None else get_minutes(event.end_time)
+        else:
+            end = -1 if event.duration is None else event.duration
+        description = event.description.encode()
+        self.__type_codes[event_id] = self._TYPE_CODES[event.event_type]
+        self.__day_ordinals[event_id] = get_day_ordinal(event.date)
+        self.__start_minutes[event_id] = get_minutes(event.time)
+        self.__ends[event_id] = end
+        self.__tag_codes[event_id] = tag_code
+        self.__description_offsets[event_id] = len(self.__description_heap)
+        self.__description_lengths[event_id] = len(description)
+        self.__description_heap += description
+        self.__event_count += 1
+
+
+    def replace(self, event_id: int, event):
+        """
+        Hold an event in place of the event held under its id, for after modifying an event gotten
+                from the store
+        :param event_id: an id held
+        :param event: (type is a subclass of Event)
+        :return: void
+        """
+        self.remove(event_id)
+        self.add(event_id, event)
+
+
+    def remove(self, event_id: int):
+        """
+        :param event_id: an id held
+        :return: the removed event
+        """
+        event = self.get(event_id)
+        self.__type_codes[event_id] = 0
+        self.__unused_heap_bytes += self.__description_lengths[event_id]
+        self.__event_count -= 1
+        if self.__unused_heap_bytes > len(self.__description_heap) // 2:
+            self._compact_description_heap()
+        return event
+
+
+    def _compact_description_heap(self):
+        """
+        Rebuild the description heap from the descriptions of the held events only
+        :return: void
+        """
+        heap = bytearray()
+        for event_id, type_code in enumerate(self.__type_codes):
+            if type_code:
+                offset = self.__description_offsets[event_id]
+                self.__description_offsets[event_id] = len(heap)
+                heap += self.__description_heap[
+                        offset:offset + self.__description_lengths[event_id]]
+        self.__description_heap = heap
+        self.__unused_heap_bytes = 0
@@ -0,0 +1,888 @@
+"""
+Classfile
+
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+import re
+from array import array
+from bisect import bisect_left, insort
+from heapq import heappop, heappush, merge
+
+from sortedcontainers import SortedDict, SortedList
+
+from Date_Time import MINUTES_PER_DAY
+
+
+# CONSTANTS
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_ID_BITS = 40  # bits of a Flat_Key_Index key holding the id, ids must be below 2 ** _ID_BITS
+_ID_MASK = (1 << _ID_BITS) - 1
+_PACKED_ID_BITS = 31  # bits of a Packed_Key_Array key holding the id, so that the key fits in 64
+        # bits, ids must be below 2 ** _PACKED_ID_BITS
+_PACKED_ID_MASK = (1 << _PACKED_ID_BITS) - 1
+_ARRAY_MERGE_SIZE = 1024  # fewest entries added out of order at once to an array backed index for
+        # it to be rebuilt in one merge, rather than have them inserted one by one, as an insert
+        # only moves the array up in C while a merge walks all of it in Python
+
+
+# FUNCTIONS
+def tokenize(text: str) -> list:
+    """
+    Split text into the tokens used by Token_Index, lowercase runs of letters and digits
+    :param text:
+    :return: [token_1, ...], may hold duplicates
+    """
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def get_overlapping_pairs(intervals) -> list:
+    """
+    Get all pairs of intervals that overlap each other, in one sweep
+    :param intervals: iterable of (start, end, id, ...) sorted, any fields after the id are kept
+    :return: [(interval, interval), ...], each pair ordered and the pairs sorted by the start of
+            their second interval
+    """
+    pairs = []
+    active = []  # heap of (end, interval) of the intervals not yet ended at the sweep position
+    for interval in intervals:
+        while active and active[0][0] <= interval[0]:
+            heappop(active)
+        pairs.extend((active_interval, interval) for _, active_interval in
+                sorted(active, key=lambda active_entry: active_entry[1]))
+        heappush(active, (interval[1], interval))
+    return pairs
+
+
+def _get_packed_key(day: int, minutes: int, key_id: int) -> int:
+    """
+    :param day: day ordinal
+    :param minutes: minutes since midnight
+    :param key_id: 0 to 2 ** 31 - 1
+    :return: the key packed into one 64 bit int, see Packed_Key_Array
+    """
+    return ((day * MINUTES_PER_DAY + minutes) << _PACKED_ID_BITS) | key_id
+
+
+def _get_unpacked_key(packed_key: int) -> (int, int, int):
+    """
+    :param packed_key: see _get_packed_key
+    :return: (day ordinal, minutes, id)
+    """
+    day, minutes = divmod(packed_key >> _PACKED_ID_BITS, MINUTES_PER_DAY)
+    return day, minutes, packed_key & _PACKED_ID_MASK
+
+
+# CLASSES
+class Token_Index:
+    """
+    Inverted index from the tokens of texts to the ids of the texts that hold them, tokens are kept
+            sorted so that all tokens starting with a prefix can be found by bisection
+    """
+
+    def __init__(self):
+        self.__ids_by_token = SortedDict()  # {token:{id, ...}}
+
+
+    def add(self, text_id: int, text: str):
+        """
+        Index a text
+        :param text_id:
+        :param text:
+        :return: void
+        """
+        for token in set(tokenize(text)):
+            ids = self.__ids_by_token.get(token)
+            if ids is None:
+                self.__ids_by_token[token] = self._new_ids(text_id)
+            else:
+                self._add_id(ids, text_id)
+
+
+    def add_many(self, id_text_pairs):
+        """
+        Index many texts at once, new tokens are gathered first and put into the sorted tokens in
+                one bulk update
+        :param id_text_pairs: iterable of (id, text)
+        :return: void
+        """
+        new_ids_by_token = {}  # {token:{id, ...}} for tokens not yet held
+        new_ids = self._new_ids
+        add_id = self._add_id
+        for text_id, text in id_text_pairs:
+            for token in set(tokenize(text)):
+                ids = self.__ids_by_token.get(token)
+                if ids is None:
+                    ids = new_ids_by_token.get(token)
+                    if ids is None:
+                        new_ids_by_token[token] = new_ids(text_id)
+                        continue
+                add_id(ids, text_id)
+        self.__ids_by_token.update(new_ids_by_token)
+
+
+    def remove(self, text_id: int, text: str):
+        """
+        Remove a text from the index, the text must be the same as when it was added
+        :param text_id:
+        :param text:
+        :return: void
+        """
+        for token in set(tokenize(text)):
+            ids = self.__ids_by_token[token]
+            self._discard_id(ids, text_id)
+            if not ids:
+                del self.__ids_by_token[token]
+
+
+    @staticmethod
+    def _new_ids(text_id: int) -> set:
+        """
+        :param text_id:
+        :return: the ids of a token first held, holding the id
+        """
+        return {text_id}
+
+
+    @staticmethod
+    def _add_id(ids: set, text_id: int):
+        """
+        :param ids: of a token
+        :param text_id:
+        :return: void
+        """
+        ids.add(text_id)
+
+
+    @staticmethod
+    def _discard_id(ids: set, text_id: int):
+        """
+        :param ids: of a token
+        :param text_id:
+        :return: void
+        """
+        ids.discard(text_id)
+
+
+    def _id_sets_for_prefix(self, prefix: str) -> list:
+        """
+        Get the id sets of all tokens starting with the prefix
+        :param prefix: a token
+        :return: [{id, ...}, ...], sets held by the index, so must not be modified
+        """
+        id_sets = []
+        for token in self.__ids_by_token.irange(minimum=prefix):
+            if not token.startswith(prefix):
+                break
+            id_sets.append(self.__ids_by_token[token])
+        return id_sets
+
+
+    def search(self, query: str) -> set:
+        """
+        Get the ids of the texts that, for every token in the query, hold a token starting with it
+        :param query: text holding the search terms
+        :return: {id, ...}, empty if the query holds no tokens
+        """
+        # start from the term with the fewest matches, then narrow down with the others
+        id_sets_by_term = sorted((self._id_sets_for_prefix(term) for term in set(tokenize(query))),
+                key=lambda id_sets: sum(len(ids) for ids in id_sets))
+        if not id_sets_by_term:
+            return set()
+        matching_ids = set().union(*id_sets_by_term[0])
+        for id_sets in id_sets_by_term[1:]:
+            if not matching_ids:
+                break
+            if len(matching_ids) * len(id_sets) < sum(len(ids) for ids in id_sets):  # cheaper
+                    # to check each remaining id against the sets than to build their union
+                matching_ids = {text_id for text_id in matching_ids if
+                        any(text_id in ids for ids in id_sets)}
+            else:
+                matching_ids.intersection_update(set().union(*id_sets))
+        return matching_ids
+
+
+class _Sorted_Id_Array(array):
+    """
+    Ids held sorted in an array of unsigned ints, found by bisection
+    """
+    __slots__ = ()
+
+    def __contains__(self, text_id: int):
+        position = bisect_left(self, text_id)
+        return position < len(self) and self[position] == text_id
+
+
+class Array_Token_Index(Token_Index):
+    """
+    A Token_Index holding the ids of each token sorted in an array rather than in a set, taking
+            4 bytes an id rather than a set entry, and far less for the many tokens held by a single
+            text, at the cost of adding out of order ids by moving the array up
+    """
+
+    @staticmethod
+    def _new_ids(text_id: int) -> _Sorted_Id_Array:
+        return _Sorted_Id_Array('I', (text_id,))
+
+
+    @staticmethod
+    def _add_id(ids: _Sorted_Id_Array, text_id: int):
+        if not ids or ids[-1] < text_id:  # ids mostly arrive in increasing order
+            ids.append(text_id)
+            return
+        position = bisect_left(ids, text_id)
+        if position == len(ids) or ids[position] != text_id:
+            ids.insert(position, text_id)
+
+
+    @staticmethod
+    def _discard_id(ids: _Sorted_Id_Array, text_id: int):
+        position = bisect_left(ids, text_id)
+        if position < len(ids) and ids[position] == text_id:
+            del ids[position]
+
+
+class Interval_Index:
+    """
+    Half open int intervals [start, end) held sorted by start, also tracking the longest interval
+            held, so that every interval overlapping a query lies among those starting no more
+            than that length before the query start
+    """
+
+    def __init__(self):
+        self.__intervals = SortedList()  # [(start, end, id), ...]
+        self.__lengths = SortedList()  # [end - start, ...], the last is the longest
+
+
+    def __len__(self):
+        return len(self.__intervals)
+
+
+    def add(self, interval_id: int, start: int, end: int):
+        """
+        Add an interval, empty intervals (end <= start) overlap nothing so are not held
+        :param interval_id:
+        :param start:
+        :param end:
+        :return: void
+        """
+        if end > start:
+            self.__intervals.add((start, end, interval_id))
+            self.__lengths.add(end - start)
+
+
+    def add_many(self, intervals: list):
+        """
+        Add many intervals at once, faster than adding them one by one when the input is sorted
+                or large
+        :param intervals: [(id, start, end), ...], empty intervals are not held
+        :return: void
+        """
+        held_intervals = [(start, end, interval_id) for interval_id, start, end in intervals if
+                end > start]
+        self.__intervals.update(held_intervals)
+        self.__lengths.update(end - start for start, end, _ in held_intervals)
+
+
+    def remove(self, interval_id: int, start: int, end: int):
+        """
+        Remove an interval, must be the same as when it was added
+        :param interval_id:
+        :param start:
+        :param end:
+        :return: void
+        """
+        if end > start:
+            self.__intervals.remove((start, end, interval_id))
+            self.__lengths.remove(end - start)
+
+
+    def overlapping(self, start: int, end: int) -> list:
+        """
+        Get the intervals overlapping [start, end)
+        :param start:
+        :param end:
+        :return: [(start, end, id), ...] sorted by start
+        """
+        if end <= start or not self.__intervals:
+            return []
+        return [interval for interval in self.__intervals.irange(
+                minimum=(start - self.__lengths[-1],), maximum=(end,), inclusive=(True, False))
+                if interval[1] > start]
+
+
+    def iter_overlapping_from(self, start: int):
+        """
+        Lazily iterate over the intervals that end after a point
+        :param start:
+        :return: iterator of (start, end, id), sorted by start
+        """
+        if not self.__intervals:
+            return iter(())
+        return (interval for interval in self.__intervals.irange(
+                minimum=(start - self.__lengths[-1],)) if interval[1] > start)
+
+
+    def overlapping_pairs(self, start: int, end: int) -> list:
+        """
+        Get all pairs of held intervals that overlap each other, of the intervals overlapping
+                [start, end), in one sweep
+        :param start:
+        :param end:
+        :return: [((start, end, id), (start, end, id)), ...], each pair ordered and the pairs
+                sorted by the start of their second interval
+        """
+        return get_overlapping_pairs(self.overlapping(start, end))
+
+
+class Array_Interval_Index(Interval_Index):
+    """
+    An Interval_Index holding its intervals in parallel arrays of starts, ends and ids sorted by
+            (start, end, id), taking 20 bytes an interval rather than a tuple of three ints, at the
+            cost of adding out of order intervals by moving the arrays up. The lengths are counted
+            per length, as few lengths are distinct
+    """
+
+    def __init__(self):  # the SortedLists of Interval_Index are not made
+        self.__starts = array('q')
+        self.__ends = array('q')
+        self.__ids = array('I')
+        self.__length_counts = {}  # {end - start:number of intervals of the length}
+        self.__longest = 0  # of the lengths held
+
+
+    def __len__(self):
+        return len(self.__starts)
+
+
+    def add(self, interval_id: int, start: int, end: int):
+        """
+        Add an interval, empty intervals (end <= start) overlap nothing so are not held
+        :param interval_id:
+        :param start:
+        :param end:
+        :return: void
+        """
+        if end > start:
+            position = self._get_position(start, end, interval_id)
+            self.__starts.insert(position, start)
+            self.__ends.insert(position, end)
+            self.__ids.insert(position, interval_id)
+            self._count_length(end - start, 1)
+
+
+    def add_many(self, intervals: list):
+        """
+        Add many intervals at once, appended if they all sort after those held, otherwise inserted
+                one by one if few, or the arrays are rebuilt in one merge
+        :param intervals: [(id, start, end), ...], empty intervals are not held
+        :return: void
+        """
+        held_intervals = sorted((start, end, interval_id) for interval_id, start, end in intervals
+                if end > start)
+        if not held_intervals:
+            return
+        if self.__starts and held_intervals[0] < (self.__starts[-1], self.__ends[-1],
+                self.__ids[-1]):
+            if len(held_intervals) < _ARRAY_MERGE_SIZE:
+                for start, end, interval_id in held_intervals:
+                    self.add(interval_id, start, end)
+                return
+            held_intervals = list(merge(zip(self.__starts, self.__ends, self.__ids),
+                    held_intervals))
+            self.__starts = array('q')
+            self.__ends = array('q')
+            self.__ids = array('I')
+            self.__length_counts = {}
+            self.__longest = 0
+        for start, end, interval_id in held_intervals:
+            self.__starts.append(start)
+            self.__ends.append(end)
+            self.__ids.append(interval_id)
+        for start, end, _ in held_intervals:
+            self._count_length(end - start, 1)
+
+
+    def remove(self, interval_id: int, start: int, end: int):
+        """
+        Remove an interval, must be the same as when it was added
+        :param interval_id:
+        :param start:
+        :param end:
+        :return: void
+        """
+        if end > start:
+            position = self._get_position(start, end, interval_id)
+            if position == len(self.__starts) or self.__ends[position] != end or \
+                    self.__ids[position] != interval_id:
+                raise ValueError("interval " + str((start, end, interval_id)) + " is not held")
+            del self.__starts[position]
+            del self.__ends[position]
+            del self.__ids[position]
+            self._count_length(end - start, -1)
+
+
+    def overlapping(self, start: int, end: int) -> list:
+        """
+        Get the intervals overlapping [start, end)
+        :param start:
+        :param end:
+        :return: [(start, end, id), ...] sorted by start
+        """
+        if end <= start or not self.__starts:
+            return []
+        starts, ends, ids = self.__starts, self.__ends, self.__ids
+        return [(starts[position], ends[position], ids[position]) for position in
+                range(bisect_left(starts, start - self.__longest), bisect_left(starts, end)) if
+                ends[position] > start]
+
+
+    def iter_overlapping_from(self, start: int):
+        """
+        Lazily iterate over the intervals that end after a point
+        :param start:
+        :return: generator of (start, end, id), sorted by start
+        """
+        position = bisect_left(self.__starts, start - self.__longest)
+        while position < len(self.__starts):
+            if self.__ends[position] > start:
+                yield self.__starts[position], self.__ends[position], self.__ids[position]
+            position += 1
+
+
+    def _get_position(self, start: int, end: int, interval_id: int) -> int:
+        """
+        :param start:
+        :param end:
+        :param interval_id:
+        :return: position of the interval in the arrays, where it is held or would be inserted
+        """
+        position = bisect_left(self.__starts, start)
+        while position < len(self.__starts) and self.__starts[position] == start and \
+                (self.__ends[position], self.__ids[position]) < (end, interval_id):
+            position += 1
+        return position
+
+
+    def _count_length(self, length: int, count: int):
+        """
+        :param length: of an interval added or removed
+        :param count: 1 if added, -1 if removed
+        :return: void
+        """
+        length_count = self.__length_counts.get(length, 0) + count
+        if length_count:
+            self.__length_counts[length] = length_count
+        else:
+            del self.__length_counts[length]
+        if count > 0:
+            self.__longest = max(self.__longest, length)
+        elif length == self.__longest and not length_count:
+            self.__longest = max(self.__length_counts, default=0)
+
+
+class Fenwick_Tree:
+    """
+    Sparse Fenwick (binary indexed) tree of int values at positions 1 to a size, giving sums over
+            ranges of positions, only nodes holding non-zero sums are stored
+    """
+
+    def __init__(self, size: int):
+        """
+        :param size: the highest position
+        """
+        self.__size = size
+        self.__nodes = {}  # {position:sum of the values at the positions the node covers}
+
+
+    def add(self, position: int, value: int):
+        """
+        Add to the value at a position
+        :param position: 1 to the size
+        :param value:
+        :return: void
+        """
+        while position <= self.__size:
+            node_sum = self.__nodes.get(position, 0) + value
+            if node_sum:
+                self.__nodes[position] = node_sum
+            else:
+                self.__nodes.pop(position, None)
+            position += position & -position
+
+
+    def prefix_sum(self, position: int) -> int:
+        """
+        Get the sum of the values at positions 1 to a position
+        :param position: 0 to the size
+        :return:
+        """
+        total = 0
+        while position > 0:
+            total += self.__nodes.get(position, 0)
+            position -= position & -position
+        return total
+
+
+    def range_sum(self, start: int, end: int) -> int:
+        """
+        Get the sum of the values at positions start to end, inclusive
+        :param start: 1 to the size
+        :param end: 0 to the size
+        :return:
+        """
+        return self.prefix_sum(end) - self.prefix_sum(start - 1) if end >= start else 0
+
+
+class Nested_Key_Index:
+    """
+    Ids ordered by (day, minutes, id) in nested containers, a sorted dict of days holding a sorted
+            dict of times holding a sorted list of ids
+    """
+
+    def __init__(self):
+        self.__ids = SortedDict()  # {day:SortedDict{minutes:[id, ...]}}
+
+
+    def add(self, day: int, minutes: int, key_id: int):
+        """
+        :param day: day ordinal
+        :param minutes: minutes since midnight
+        :param key_id:
+        :return: void
+        """
+        time_dict = self.__ids.get(day)
+        if time_dict is None:
+            time_dict = self.__ids[day] = SortedDict()
+        event_ids = time_dict.get(minutes)
+        if event_ids is None:
+            time_dict[minutes] = [key_id]
+        else:
+            insort(event_ids, key_id)
+
+
+    def add_sorted(self, keys: list):
+        """
+        Add many ids at once
+        :param keys: [(day, minutes, id), ...] sorted
+        :return: void
+        """
+        time_dict = event_ids = None
+        last_day = last_minutes = None
+        for day, minutes, key_id in keys:
+            if day != last_day:
+                time_dict = self.__ids.get(day)
+                if time_dict is None:
+                    time_dict = self.__ids[day] = SortedDict()
+                last_day = day
+                last_minutes = None
+            if minutes != last_minutes:
+                event_ids = time_dict.get(minutes)
+                if event_ids is None:
+                    event_ids = time_dict[minutes] = []
+                last_minutes = minutes
+            if not event_ids or event_ids[-1] < key_id:  # sorted input arrives in id order
+                event_ids.append(key_id)
+            else:
+                insort(event_ids, key_id)
+
+
+    def remove(self, day: int, minutes: int, key_id: int):
+        """
+        Remove an id, the day and minutes must be the same as when it was added
+        :param day:
+        :param minutes:
+        :param key_id:
+        :return: void
+        """
+        time_dict = self.__ids[day]
+        event_ids = time_dict[minutes]
+        event_ids.remove(key_id)
+
+        # remove now empty containers
+        if not event_ids:
+            del time_dict[minutes]
+            if not time_dict:
+                del self.__ids[day]
+
+
+    def remove_before(self, day: int):
+        """
+        Remove every id before a day at once
+        :param day: ids on or after this day are kept
+        :return: void
+        """
+        for removed_day in list(self.__ids.islice(stop=self.__ids.bisect_left(day))):
+            del self.__ids[removed_day]
+
+
+    def iter_ids(self, start_day: int=None, end_day: int=None):
+        """
+        Lazily iterate over the ids in order, only the days in the range are visited
+        :param start_day: if given, only ids on or after this day are yielded
+        :param end_day: if given, only ids on or before this day are yielded
+        :return: generator of id
+        """
+        for day in self.__ids.irange(minimum=start_day, maximum=end_day):
+            for event_ids in self.__ids[day].values():
+                yield from event_ids
+
+
+class Flat_Key_Index:
+    """
+    Ids ordered by (day, minutes, id) in one sorted list, with each key packed into a single int so
+            that keys compare as fast as ints do
+    """
+
+    def __init__(self):
+        self.__keys = SortedList()  # [((day * minutes per day + minutes) << id bits) | id, ...]
+
+
+    def add(self, day: int, minutes: int, key_id: int):
+        """
+        :param day: day ordinal
+        :param minutes: minutes since midnight
+        :param key_id: 0 to 2 ** 40 - 1
+        :return: void
+        """
+        self.__keys.add(((day * MINUTES_PER_DAY + minutes) << _ID_BITS) | key_id)
+
+
+    def add_sorted(self, keys: list):
+        """
+        Add many ids at once, the packed keys keep the order of the input, which the sort inside
+                SortedList.update gets through in one linear pass
+        :param keys: [(day, minutes, id), ...] sorted
+        :return: void
+        """
+        self.__keys.update([((day * MINUTES_PER_DAY + minutes) << _ID_BITS) | key_id for
+                day, minutes, key_id in keys])
+
+
+    def remove(self, day: int, minutes: int, key_id: int):
+        """
+        Remove an id, the day and minutes must be the same as when it was added
+        :param day:
+        :param minutes:
+        :param key_id:
+        :return: void
+        """
+        self.__keys.remove(((day * MINUTES_PER_DAY + minutes) << _ID_BITS) | key_id)
+
+
+    def remove_before(self, day: int):
+        """
+        Remove every id before a day at once, the keys before it are a prefix of the list
+        :param day: ids on or after this day are kept
+        :return: void
+        """
+        del self.__keys[:self.__keys.bisect_left((day * MINUTES_PER_DAY) << _ID_BITS)]
+
+
+    def iter_ids(self, start_day: int=None, end_day: int=None):
+        """
+        Lazily iterate over the ids in order, only the keys in the range are visited
+        :param start_day: if given, only ids on or after this day are yielded
+        :param end_day: if given, only ids on or before this day are yielded
+        :return: generator of id
+        """
+        for key in self.__keys.irange(
+                minimum=None if start_day is None else
+                        (start_day * MINUTES_PER_DAY) << _ID_BITS,
+                maximum=None if end_day is None else
+                        (((end_day + 1) * MINUTES_PER_DAY) << _ID_BITS) - 1):
+            yield key & _ID_MASK
+
+
+class Packed_Key_Array:
+    """
+    (day ordinal, minutes, id) keys held sorted in one array of 64 bit ints, each key packed as a
+            Flat_Key_Index packs it but with fewer bits for the id, taking 8 bytes a key rather than
+            a tuple of three ints. Offers the part of the SortedList interface that Schedule uses
+            on its tag and type indexes. Out of order keys are inserted by moving the array up
+    """
+
+    def __init__(self):
+        self.__keys = array('Q')  # [((day * minutes per day + minutes) << packed id bits) | id,
+                # ...]
+
+
+    def __len__(self):
+        return len(self.__keys)
+
+
+    def __delitem__(self, index):
+        del self.__keys[index]
+
+
+    def update(self, keys):
+        """
+        Add keys, appended if they all sort after those held, otherwise inserted one by one if few,
+                or the array is rebuilt in one merge
+        :param keys: iterable of (day ordinal, minutes, id), ids 0 to 2 ** 31 - 1
+        :return: void
+        """
+        packed_keys = sorted(_get_packed_key(*key) for key in keys)
+        if not packed_keys:
+            return
+        if not self.__keys or packed_keys[0] > self.__keys[-1]:
+            self.__keys.extend(packed_keys)
+        elif len(packed_keys) < _ARRAY_MERGE_SIZE:
+            for packed_key in packed_keys:
+                self.__keys.insert(bisect_left(self.__keys, packed_key), packed_key)
+        else:
+            self.__keys = array('Q', merge(self.__keys, packed_keys))
+
+
+    def remove(self, key: tuple):
+        """
+        :param key: (day ordinal, minutes, id) held
+        :return: void
+        """
+        packed_key = _get_packed_key(*key)
+        position = bisect_left(self.__keys, packed_key)
+        if position == len(self.__keys) or self.__keys[position] != packed_key:
+            raise ValueError(str(key) + " is not held")
+        del self.__keys[position]
+
+
+    def bisect_left(self, key: tuple) -> int:
+        """
+        :param key: (day ordinal,), (day ordinal, minutes) or (day ordinal, minutes, id)
+        :return: position of the first key held not before the key
+        """
+        return bisect_left(self.__keys, _get_packed_key(*(key + (0, 0))[:3]))
+
+
+    def islice(self, start: int=None, stop: int=None):
+        """
+        :param start: position
+        :param stop: position
+        :return: generator of (day ordinal, minutes, id) of the keys between the positions
+        """
+        keys = self.__keys
+        for position in range(*slice(start, stop).indices(len(keys))):  # rather than copying the
+                # slice, as often only the first keys are taken
+            yield _get_unpacked_key(keys[position])
+
+
+    def islice_ids(self, start: int=None, stop: int=None):
+        """
+        :param start: position
+        :param stop: position
+        :return: generator of the ids of the keys between the positions, in order
+        """
+        keys = self.__keys
+        for position in range(*slice(start, stop).indices(len(keys))):  # rather than copying the
+                # slice, as often only the first keys are taken
+            yield keys[position] & _PACKED_ID_MASK
+
+
+class Array_Key_Index:
+    """
+    Ids ordered by (day, minutes, id) in a Packed_Key_Array, the interface of Flat_Key_Index in 8
+            bytes a key
+    """
+
+    def __init__(self):
+        self.__keys = Packed_Key_Array()
+
+
+    def add(self, day: int, minutes: int, key_id: int):
+        """
+        :param day: day ordinal
+        :param minutes: minutes since midnight
+        :param key_id: 0 to 2 ** 31 - 1
+        :return: void
+        """
+        self.__keys.update(((day, minutes, key_id),))
+
+
+    def add_sorted(self, keys: list):
+        """
+        Add many ids at once
+        :param keys: [(day, minutes, id), ...] sorted
+        :return: void
+        """
+        self.__keys.update(keys)
+
+
+    def remove(self, day: int, minutes: int, key_id: int):
+        """
+        Remove an id, the day and minutes must be the same as when it was added
+        :param day:
+        :param minutes:
+        :param key_id:
+        :return: void
+        """
+        self.__keys.remove((day, minutes, key_id))
+
+
+    def remove_before(self, day: int):
+        """
+        Remove every id before a day at once, the keys before it are a prefix of the array
+        :param day: ids on or after this day are kept
+        :return: void
+        """
+        del self.__keys[:self.__keys.bisect_left((day,))]
+
+
+    def iter_ids(self, start_day: int=None, end_day: int=None):
+        """
+        Lazily iterate over the ids in order, only the keys in the range are visited
+        :param start_day: if given, only ids on or after this day are yielded
+        :param end_day: if given, only ids on or before this day are yielded
+        :return: generator of id
+        """
+        return self.__keys.islice_ids(
+                None if start_day is None else self.__keys.bisect_left((start_day,)),
+                None if end_day is None else self.__keys.bisect_left((end_day + 1,)))
+
+
+class Array_Location_Map:
+    """
+    {id:(day ordinal, minutes)} held in two arrays indexed by the id, used as the dict would be,
+            taking 6 bytes an id for ids dense from 1 up, as Schedule ids are. Day ordinal 0, which
+            no date has, marks an id not held
+    """
+
+    def __init__(self):
+        self.__days = array('i')
+        self.__minutes = array('h')
+
+
+    def __contains__(self, location_id: int):
+        return 0 <= location_id < len(self.__days) and self.__days[location_id] != 0
+
+
+    def __getitem__(self, location_id: int) -> (int, int):
+        if location_id not in self:
+            raise KeyError(location_id)
+        return self.__days[location_id], self.__minutes[location_id]
+
+
+    def __setitem__(self, location_id: int, location: (int, int)):
+        missing_rows = location_id + 1 - len(self.__days)
+        if missing_rows > 0:
+            self.__days.frombytes(bytes(missing_rows * self.__days.itemsize))
+            self.__minutes.frombytes(bytes(missing_rows * self.__minutes.itemsize))
+        self.__days[location_id], self.__minutes[location_id] = location
+
+
+    def __delitem__(self, location_id: int):
+        if location_id not in self:
+            raise KeyError(location_id)
+        self.__days[location_id] = 0
+
+
+    def get(self, location_id: int, default=None):
+        """
+        :param location_id:
+        :param default:
+        :return: (day ordinal, minutes) of the id, the default if not held
+        """
+        return self[location_id] if location_id in self else default
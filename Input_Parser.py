@@ -12,6 +12,9 @@ __author__ = "Cole Anderson"
 # IMPORTS
 from datetime import datetime, timedelta
 
+from Date_Time import get_date_str
+from Event import ENUM_Recurrence_Frequency
+
 
 # ENUMS
 class ENUM_Input_Type:  # see help print string for information on arg input types
@@ -174,6 +177,95 @@ def parse(raw_inputs: list, demanded_input_form: list) -> list or str:
     return parsed_inputs
 
 
+def parse_keyword_args(raw_inputs: list, keywords: list) -> dict or str:
+    """
+    Take distinct inputs from the user of the form 'keyword=value' and collect them by keyword
+    :param raw_inputs: [arg_1_input, ...]. All strings.
+    :param keywords: [keyword_1, ...], the keywords that are accepted, each at most once
+    :return:
+        If parse is successful:
+            dict: {keyword:value}, holding only the keywords that were given, values are strings
+        If parse is not successful:
+            str: A message for the user
+    """
+    parsed_inputs = {}
+    for raw_input in raw_inputs:
+        keyword, delimiter, value = raw_input.partition('=')
+        if not delimiter or not value:
+            return "Command Failure: arg: '" + raw_input + "' is not of the form 'keyword=value'"
+        if keyword not in keywords:
+            return "Command Failure: keyword: '" + keyword + "' not recognized, expected one of: " + \
+                    ", ".join(keywords)
+        if keyword in parsed_inputs:
+            return "Command Failure: keyword: '" + keyword + "' given more than once"
+        parsed_inputs[keyword] = value
+    return parsed_inputs
+
+
+RECURRENCE_KEYWORDS = ["repeat", "every", "on", "until", "count"]  # for "parse_keyword_args"
+def parse_recurrence(keyword_args: dict) -> tuple or str:
+    """
+    Parse the values of recurrence rule args collected by "parse_keyword_args" with the
+            RECURRENCE_KEYWORDS:
+                'repeat': required, 'daily', 'weekly' or 'monthly'
+                'every': the number of days, weeks or months from one occurrence to the next
+                'on': only for 'weekly', days of the week separated by ',' like 'm,w,f' or 'mon,wed,fri'
+                'until': the date of the last day an occurrence can be on
+                'count': the most occurrences there are
+    :param keyword_args: {keyword:value}
+    :return:
+        If parse is successful:
+            tuple: (ENUM_Recurrence_Frequency value, interval, (weekday, ...) as 0 to 6 from Monday,
+                    until date str or None, count or None)
+        If parse is not successful:
+            str: A message for the user
+    """
+    if "repeat" not in keyword_args:
+        return "Command Failure: a 'repeat=<daily, weekly or monthly>' arg is required"
+    frequency = keyword_args["repeat"].upper()
+    if frequency not in (ENUM_Recurrence_Frequency.DAILY, ENUM_Recurrence_Frequency.WEEKLY,
+            ENUM_Recurrence_Frequency.MONTHLY):
+        return "Command Failure: repeat: '" + keyword_args["repeat"] + "' is not one of: daily, " \
+                "weekly, monthly"
+
+    interval = 1
+    if "every" in keyword_args:
+        interval = _parse_unsigned_int(keyword_args["every"])
+        if not interval:
+            return "Command Failure: every: '" + keyword_args["every"] + "' is not a number of at " \
+                    "least 1"
+
+    weekdays = ()
+    if "on" in keyword_args:
+        if frequency != ENUM_Recurrence_Frequency.WEEKLY:
+            return "Command Failure: 'on' can only be given with 'repeat=weekly'"
+        weekdays = []
+        for day_name in keyword_args["on"].split(","):
+            if day_name in _parse_date_MINIMUM_DAY_NAMES_LOWERCASE:
+                weekdays.append(_parse_date_MINIMUM_DAY_NAMES_LOWERCASE.index(day_name))
+            elif day_name in _parse_date_SHORT_DAY_NAMES_LOWERCASE:
+                weekdays.append(_parse_date_SHORT_DAY_NAMES_LOWERCASE.index(day_name))
+            else:
+                return "Command Failure: on: '" + day_name + "' is not a day of the week"
+        weekdays = tuple(weekdays)
+
+    until = None
+    if "until" in keyword_args:
+        until = _parse_date(keyword_args["until"])
+        if until is None:
+            return "Command Failure: until: '" + keyword_args["until"] + "' could not be parsed " \
+                    "to a date"
+
+    count = None
+    if "count" in keyword_args:
+        count = _parse_unsigned_int(keyword_args["count"])
+        if not count:
+            return "Command Failure: count: '" + keyword_args["count"] + "' is not a number of at " \
+                    "least 1"
+
+    return frequency, interval, weekdays, until, count
+
+
 
 # PRIVATE FUNCTIONS
 def _parse_unsigned_int(value: str) -> int or None:
@@ -191,9 +283,6 @@ def _parse_unsigned_int(value: str) -> int or None:
 
 _parse_date_MINIMUM_DAY_NAMES_LOWERCASE = ["m", "tu", "w", "th", "f", "sa", "su"]  # from Monday to Sunday
 _parse_date_SHORT_DAY_NAMES_LOWERCASE = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]  # from Monday to Sunday
-_parse_date_SHORT_DAY_NAMES_PRINT = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]  # from Monday to Sunday,
-        # with capital first letter
-_parse_date_YEAR_MONTH_DAY_FORMAT_STR = "%Y-%m-%d"  # str for strftime for formatting the year month and day together
 def _parse_date(value: str, today_datetime: datetime=None) -> str or None:
     # noinspection SpellCheckingInspection
     """
@@ -331,8 +420,8 @@ def _parse_date(value: str, today_datetime: datetime=None) -> str or None:
                 datetime_of_parsed_date = today_datetime + timedelta(days=days_to_first_correct_weekday + (n_count * 7))
 
     return None if datetime_of_parsed_date is None else \
-            datetime_of_parsed_date.strftime(_parse_date_YEAR_MONTH_DAY_FORMAT_STR) + " " + \
-            _parse_date_SHORT_DAY_NAMES_PRINT[datetime_of_parsed_date.weekday()]
+            get_date_str(datetime_of_parsed_date.toordinal())  # formatted the same way as the
+                    # Schedule renders dates, zero padding the year on every platform
 
 
 def _parse_time(value: str) -> str or None:
@@ -0,0 +1,111 @@
+"""
+Static Functionfile
+
+An append only journal of the changes saved since the events file was last written in full. The
+        first line of a journal is the signature of the events file it applies to, so that a
+        journal left over from an interrupted compaction is never replayed onto the compacted file.
+        The signature is taken from the file system rather than the contents, as the sidecar index
+        of Mapped_Events_File is, so that opening the events file never reads it all
+
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+import os
+
+
+# ENUMS
+class ENUM_Journal_Record_Type:
+    BASE = "BASE"  # signature of the events file the journal applies to
+    PUT = "PUT"  # an event added or replaced under an id
+    DELETE = "DEL"  # an event deleted
+
+
+
+# FUNCTIONS
+def get_file_signature(file_path: str) -> str:
+    """
+    :param file_path:
+    :return: the size and modification time in nanoseconds of the file, which change whenever
+            compaction replaces it, as if empty if it does not exist
+    """
+    if not os.path.isfile(file_path):
+        return "0:0"
+    file_stat = os.stat(file_path)
+    return str(file_stat.st_size) + ":" + str(file_stat.st_mtime_ns)
+
+
+def get_journal_size(journal_path: str) -> int:
+    """
+    :param journal_path:
+    :return: bytes in the journal, 0 if it does not exist
+    """
+    return os.path.getsize(journal_path) if os.path.isfile(journal_path) else 0
+
+
+def read_changes(journal_path: str, events_path: str) -> list:
+    """
+    Read the changes saved in a journal since the events file was written
+    :param journal_path:
+    :param events_path:
+    :return: [(id, load in string or None if deleted), ...] in the order saved, empty if there is
+            no journal or it does not apply to the events file
+    """
+    if not os.path.isfile(journal_path):
+        return []
+    with open(journal_path, 'r') as journal_file:
+        lines = journal_file.readlines()
+    if not lines or lines[0] != ENUM_Journal_Record_Type.BASE + "|" + \
+            get_file_signature(events_path) + "\n":  # stale
+        return []
+    changes = []
+    for line in lines[1:]:
+        if not line.endswith("\n"):  # only partly written before an interruption
+            break
+        fields = line[:-1].split("|", 2)
+        changes.append((int(fields[1]),
+                fields[2] if fields[0] == ENUM_Journal_Record_Type.PUT else None))
+    return changes
+
+
+def append_changes(journal_path: str, events_path: str, changes: list):
+    """
+    Append changes to a journal, making sure that they are on disk before returning, the journal is
+            started for the events file if it does not exist
+    :param journal_path:
+    :param events_path:
+    :param changes: [(id, load in string or None if deleted), ...]
+    :return: void
+    """
+    records = [] if os.path.isfile(journal_path) else \
+            [ENUM_Journal_Record_Type.BASE + "|" + get_file_signature(events_path) + "\n"]
+    records.extend(ENUM_Journal_Record_Type.DELETE + "|" + str(event_id) + "\n" if
+            load_in_string is None else
+            ENUM_Journal_Record_Type.PUT + "|" + str(event_id) + "|" + load_in_string + "\n"
+            for event_id, load_in_string in changes)
+    with open(journal_path, 'a') as journal_file:
+        journal_file.writelines(records)
+        journal_file.flush()
+        os.fsync(journal_file.fileno())
+
+
+def compact(journal_path: str, events_path: str, contents: bytes):
+    """
+    Fold the journal into the events file by writing the whole schedule to it, the new events file
+            replaces the old one only once it is fully on disk, after which the journal is removed
+    :param journal_path:
+    :param events_path:
+    :param contents: of the events file, holding the whole schedule
+    :return: void
+    """
+    new_events_path = events_path + ".new"
+    with open(new_events_path, 'wb') as events_file:
+        events_file.write(contents)
+        events_file.flush()
+        os.fsync(events_file.fileno())
+    os.replace(new_events_path, events_path)
+    if os.path.isfile(journal_path):
+        os.remove(journal_path)
@@ -0,0 +1,226 @@
+"""
+Classfile
+
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+import mmap
+import os
+import struct
+from bisect import bisect_left, bisect_right
+from itertools import chain
+
+from Date_Time import get_day_ordinal
+from Event import ENUM_Event_Type
+from Schedule import Schedule
+
+
+# CONSTANTS
+INDEX_MAGIC = b"SCHEDIDX"
+INDEX_HEADER_STRUCT = struct.Struct("<8sQQBII")  # magic, events file size, events file
+        # modification time in nanoseconds, 1 if the events of the file are in date order, number of
+        # date entries, number of recurring entries
+DATE_ENTRY_STRUCT = struct.Struct("<iQQI")  # day ordinal, start byte, end byte, line number of the
+        # first event of the date
+RECURRING_ENTRY_STRUCT = struct.Struct("<QQI")  # start byte, end byte, line number
+
+
+# CLASS
+class Mapped_Events_File:
+    """
+    A read only view of an events file of load in strings, which is memory mapped rather than read,
+            along with a sidecar index of the byte range of the events of each date, itself memory
+            mapped and bisected in place. Only the lines of the dates asked for are ever read and
+            parsed, so a week is read in a few KB whatever the size of the file. The events keep
+            the ids a Schedule loaded from the whole file would give them, their line numbers
+    """
+
+    def __init__(self, events_file_path: str, index_file_path: str):
+        """
+        :param events_file_path: of an events file of load in strings
+        :param index_file_path: of the sidecar index, which is built, or rebuilt if it does not
+                match the events file
+        """
+        self.__events_file = open(events_file_path, 'rb')
+        events_file_stat = os.fstat(self.__events_file.fileno())
+        self.__events_map = mmap.mmap(self.__events_file.fileno(), 0, access=mmap.ACCESS_READ) if \
+                events_file_stat.st_size else b""
+        if not self._is_index_current(index_file_path, events_file_stat):
+            self._write_index(index_file_path, events_file_stat)
+        self.__index_file = open(index_file_path, 'rb')
+        self.__index_map = mmap.mmap(self.__index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        _, _, _, in_date_order, self.__date_entry_count, self.__recurring_entry_count = \
+                INDEX_HEADER_STRUCT.unpack_from(self.__index_map, 0)
+        self.__in_date_order = bool(in_date_order)
+
+
+    def close(self):
+        """
+        Unmap and close the events file and the index
+        :return: void
+        """
+        if self.__events_map:
+            self.__events_map.close()
+        self.__events_file.close()
+        self.__index_map.close()
+        self.__index_file.close()
+
+
+    def is_in_date_order(self) -> bool:
+        """
+        :return: True if the events of the file are in date order, as the Schedule writes them,
+                only then can dates be read on their own
+        """
+        return self.__in_date_order
+
+
+    def iter_load_in_strings(self, start_date: str=None, end_date: str=None):
+        """
+        Read the events of a date range, and only them, from the file
+        :param start_date: only events on or after this date are read
+        :param end_date: only events on or before this date are read
+        :return: generator of (id, load in string), in chronological order
+        """
+        if not self.__in_date_order:
+            raise Exception("events file is not in date order")
+        days = _Index_Days(self.__index_map, self.__date_entry_count)
+        first_position = 0 if start_date is None else bisect_left(days, get_day_ordinal(start_date))
+        end_position = self.__date_entry_count if end_date is None else \
+                bisect_right(days, get_day_ordinal(end_date))
+        if first_position >= end_position:
+            return
+        _, start_byte, _, first_line_number = self._get_date_entry(first_position)
+        end_byte = self._get_date_entry(end_position - 1)[2]
+        yield from enumerate(self.__events_map[start_byte:end_byte].decode("utf-8").splitlines(),
+                first_line_number)
+
+
+    def iter_recurring_load_in_strings(self):
+        """
+        Read the recurring events from the file
+        :return: generator of (id, load in string), in id order
+        """
+        entries_start = INDEX_HEADER_STRUCT.size + self.__date_entry_count * DATE_ENTRY_STRUCT.size
+        for start_byte, end_byte, line_number in RECURRING_ENTRY_STRUCT.iter_unpack(
+                self.__index_map[entries_start:entries_start + self.__recurring_entry_count *
+                    RECURRING_ENTRY_STRUCT.size]):
+            yield line_number, self.__events_map[start_byte:end_byte].decode("utf-8").rstrip(
+                    "\r\n")
+
+
+    def get_schedule(self, start_date: str=None, end_date: str=None, changes=()) -> Schedule:
+        """
+        Make a Schedule of only the events of a date range, and the recurring events, under their
+                ids, which prints and queries the same as the whole Schedule within the range
+        :param start_date: only events on or after this date are held
+        :param end_date: only events on or before this date are held
+        :param changes: iterable of (id, load in string, or None if deleted), changes made since
+                the file was written, such as ones read from a journal, applied after, events
+                they put outside the range are held too
+        :return: a Schedule
+        """
+        schedule = Schedule()
+        schedule.apply_changes(chain(self.iter_load_in_strings(start_date, end_date),
+                self.iter_recurring_load_in_strings(), changes))
+        return schedule
+
+
+    def _get_date_entry(self, position: int) -> tuple:
+        """
+        :param position: of the date entry in the index
+        :return: (day ordinal, start byte, end byte, line number of the first event of the date)
+        """
+        return DATE_ENTRY_STRUCT.unpack_from(self.__index_map, INDEX_HEADER_STRUCT.size +
+                position * DATE_ENTRY_STRUCT.size)
+
+
+    def _is_index_current(self, index_file_path: str, events_file_stat) -> bool:
+        """
+        :param index_file_path:
+        :param events_file_stat: os.stat_result of the events file
+        :return: True if the index exists and was written for the events file as it is
+        """
+        if not os.path.isfile(index_file_path):
+            return False
+        with open(index_file_path, 'rb') as index_file:
+            header = index_file.read(INDEX_HEADER_STRUCT.size)
+        if len(header) != INDEX_HEADER_STRUCT.size:
+            return False
+        magic, events_file_size, events_file_modified, _, _, _ = INDEX_HEADER_STRUCT.unpack(header)
+        return magic == INDEX_MAGIC and events_file_size == events_file_stat.st_size and \
+                events_file_modified == events_file_stat.st_mtime_ns
+
+
+    def _write_index(self, index_file_path: str, events_file_stat):
+        """
+        Build the index in one pass over the events file, splitting off only the type and date of
+                each line, and write it
+        :param index_file_path:
+        :param events_file_stat: os.stat_result of the events file
+        :return: void
+        """
+        date_entries = []  # [[day ordinal, start byte, end byte, first line number], ...]
+        recurring_entries = []  # [(start byte, end byte, line number), ...]
+        in_date_order = True
+        day_ordinals = {}  # {date:day ordinal}, as dates repeat across many events
+        recurring_type = ENUM_Event_Type.RCUR.encode("utf-8")
+        events_map = self.__events_map
+        events_file_size = len(events_map)
+        start_byte = 0
+        line_number = 0
+        while start_byte < events_file_size:  # only a line at a time is copied out of the map
+            newline_byte = events_map.find(b"\n", start_byte)
+            end_byte = events_file_size if newline_byte == -1 else newline_byte + 1
+            line_number += 1
+            fields = events_map[start_byte:end_byte].split(b"|", 2)
+            if fields[0] == recurring_type:
+                recurring_entries.append((start_byte, end_byte, line_number))
+            elif recurring_entries:  # the recurring events must come last, as the Schedule writes
+                    # them, for the lines of a date range to be read as one
+                in_date_order = False
+            else:
+                day = day_ordinals.get(fields[1])
+                if day is None:
+                    day = day_ordinals[fields[1]] = get_day_ordinal(fields[1].decode("utf-8"))
+                if date_entries and date_entries[-1][0] == day:  # the date continues
+                    date_entries[-1][2] = end_byte
+                elif date_entries and date_entries[-1][0] >= day:  # out of date order
+                    in_date_order = False
+                else:
+                    date_entries.append([day, start_byte, end_byte, line_number])
+            start_byte = end_byte
+        if not in_date_order:
+            date_entries = []
+        with open(index_file_path, 'wb') as index_file:
+            index_file.write(INDEX_HEADER_STRUCT.pack(INDEX_MAGIC, events_file_stat.st_size,
+                    events_file_stat.st_mtime_ns, in_date_order, len(date_entries),
+                    len(recurring_entries)))
+            index_file.writelines(DATE_ENTRY_STRUCT.pack(*date_entry) for date_entry in
+                    date_entries)
+            index_file.writelines(RECURRING_ENTRY_STRUCT.pack(*recurring_entry) for
+                    recurring_entry in recurring_entries)
+
+
+
+class _Index_Days:
+    """
+    The day ordinals of the date entries of a memory mapped index, as a sequence that can be
+            bisected without reading the other entries
+    """
+
+    def __init__(self, index_map, date_entry_count: int):
+        self.__index_map = index_map
+        self.__date_entry_count = date_entry_count
+
+
+    def __len__(self):
+        return self.__date_entry_count
+
+
+    def __getitem__(self, position: int) -> int:
+        return DATE_ENTRY_STRUCT.unpack_from(self.__index_map, INDEX_HEADER_STRUCT.size +
+                position * DATE_ENTRY_STRUCT.size)[0]
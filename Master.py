@@ -12,6 +12,8 @@ import traceback
 import logging
 import sys
 import datetime
+import itertools
+import shutil
 
 
 # CHANGE DIRECTORY TO PROJECT DIRECTORY
@@ -57,45 +59,165 @@ try:
 
     # PROJECT IMPORTS
     import Utility
+    import Archive
+    import Backup
+    from Storage import Text_Storage, SQLite_Storage, ENUM_Storage_Backend
     from Input_Parser import parse as input_parser_parse
+    from Input_Parser import parse_keyword_args as input_parser_parse_keyword_args
+    from Input_Parser import parse_recurrence as input_parser_parse_recurrence
+    from Input_Parser import RECURRENCE_KEYWORDS
     from Input_Parser import PARAM_Arg_Form, ENUM_Input_Type, ENUM_Demanded_Value_Type
-    from Schedule import Schedule
+    from Schedule import Schedule, iter_schedule_print_chunks, get_event_print_str
+    from Schedule import get_duration_print_str, get_recurring_print_str
+    from Date_Time import get_day_ordinal, get_date_str, get_minutes
     from Event import ENUM_Event_Type
 
 
     # HARDCODED VARIABLES
+    STORAGE_BACKEND = ENUM_Storage_Backend.TEXT  # how the schedule is kept, see Storage, the
+            # schedule is converted on startup from any other backend that holds it
     LOAD_IN_EVENTS_FILE_NAME = "events.txt"
+    LOAD_IN_EVENTS_BINARY_FILE_NAME = "events.bin"
+    LOAD_IN_EVENTS_DATABASE_FILE_NAME = "events.db"
+    LOAD_IN_EVENTS_LAZY = False  # if True, and the storage can read a date range on its own (not a
+            # binary events file), the schedule is not loaded on startup, prints with a date are
+            # answered by reading only the events of their dates, until a command first needs the
+            # whole schedule. A storage that answers range queries itself (SQLite) is always opened
+            # so, and keeps answering prints with a date once the schedule is loaded
+    LOAD_IN_EVENTS_INDEX_FILE_NAME = "events_index.bin"  # the byte ranges of the dates of the
+            # events file, for LOAD_IN_EVENTS_LAZY
+    LAZY_COMMANDS = ('help', 'blanks', 'b', 'print', 'p', 'backups', 'quit', 'q',
+            'quit_without_saving')  # the commands that do not load the whole schedule in, for
+            # LOAD_IN_EVENTS_LAZY
+    LOAD_IN_EVENTS_JOURNAL_FILE_NAME = "events_journal.txt"  # the changes saved since the events
+            # file was last written in full
+    JOURNAL_COMPACTION_SIZE = 1 << 20  # bytes the journal reaches before it is folded into the
+            # events file, which is done on startup and quit, as the ids of events are only kept
+            # through the journal and are renumbered when the events file is next loaded
     LOAD_IN_EVENTS_BACKUPS_FOLDER = "backups"
+    FULL_BACKUP_EVERY = 10  # most backups kept as only the changes since the backup before them,
+            # between backups of the whole schedule, see Backup
+    LOAD_IN_EVENTS_ARCHIVE_FOLDER = "archive"
+    ARCHIVE_AFTER_DAYS = None  # if a number, events more than this many days before today are
+            # archived on every save, so that the events file only holds the active events
     BLANKS_DEFAULT = 100
     BLANKS_MAX = 10000
+    FREE_SLOTS_COUNT = 5  # number of free slots found by the 'free' command
+    SEARCH_RESULTS_MAX = 100  # most events printed by the 'search' command, the first in order
+    OCCUPANCY_DEFAULT_DAYS = 7  # number of days shown by the 'occupancy' command with no to date
+    UNDO_HISTORY_DEPTH = 100  # number of changes that can be undone with the 'undo' command
+
+
+    # FUNCTIONS
+    def get_storage(storage_backend):
+        """
+        :param storage_backend: an ENUM_Storage_Backend value
+        :return: the storage of the backend
+        """
+        if storage_backend == ENUM_Storage_Backend.SQLITE:
+            return SQLite_Storage(LOAD_IN_EVENTS_DATABASE_FILE_NAME)
+        return Text_Storage(LOAD_IN_EVENTS_BINARY_FILE_NAME if
+                    storage_backend == ENUM_Storage_Backend.BINARY else LOAD_IN_EVENTS_FILE_NAME,
+                LOAD_IN_EVENTS_JOURNAL_FILE_NAME, LOAD_IN_EVENTS_INDEX_FILE_NAME,
+                binary=storage_backend == ENUM_Storage_Backend.BINARY,
+                compaction_size=JOURNAL_COMPACTION_SIZE)
 
 
     # FUNCTIONS USING 'schedule'
     def load_in_schedule():
         """
-        Load in the schedule from the file
+        Load in the schedule from the storage
         :return: void
         """
         global schedule
-        schedule = Schedule(load_in_events=Utility.read_in_txt_as_list(LOAD_IN_EVENTS_FILE_NAME))
+        schedule = storage.load(UNDO_HISTORY_DEPTH)
 
 
-    def backup_schedule(file_name_start=""):
+    def load_in_schedule_if_lazy():
         """
-        Backup the schedule
+        Load in the whole schedule if it has not been yet, see LOAD_IN_EVENTS_LAZY
         :return: void
         """
-        Utility.output_list_to_txt(output=schedule.list_of_load_in_strings_for_events(), output_file_absolute_path=LOAD_IN_EVENTS_BACKUPS_FOLDER + "/" +
-                file_name_start + (" " if file_name_start else "") + str(datetime.datetime.now()).replace(':', '.'), overwrite=True)  # save backup
+        if schedule is None:
+            load_in_schedule()
 
 
-    def save_schedule():
+    def backup_schedule(label="", load_in_strings=None, only_if_changed=False):
         """
-        Save the schedule
+        Backup the schedule, as only its changes since the latest backup if that was of the same
+                schedule, otherwise as compared with the latest backup, see Backup
+        :param label: put in the backup file name after the timestamp, if given
+        :param load_in_strings: if given, the load in strings of the schedule, saving getting them
+                again if they are needed
+        :param only_if_changed: if True, no backup is taken if the schedule has not changed since
+                the latest backup, or since it was loaded
+        :return: file name of the backup, None if none was taken
+        """
+        global latest_backup
+        removed_load_in_strings, added_load_in_strings = schedule.pop_backup_changes()
+        if only_if_changed and not removed_load_in_strings and not added_load_in_strings:
+            return None
+        file_name = None
+        if latest_backup is not None and latest_backup[0] is schedule:
+            file_name = Backup.write_changes_backup(LOAD_IN_EVENTS_BACKUPS_FOLDER,
+                    latest_backup[1], removed_load_in_strings, added_load_in_strings, label,
+                    FULL_BACKUP_EVERY)
+        if file_name is None:  # a full backup is due, or the changes are not of the latest backup
+            if load_in_strings is None:
+                load_in_strings = schedule.snapshot().list_of_load_in_strings_for_events()
+            file_name = Backup.write_backup(LOAD_IN_EVENTS_BACKUPS_FOLDER, load_in_strings, label,
+                    FULL_BACKUP_EVERY)
+        latest_backup = (schedule, file_name)
+        return file_name
+
+
+    def print_attendance_conflicts(event_id):
+        """
+        Print a warning listing the ATTENDANCE events that overlap an ATTENDANCE event, if any
+        :param event_id:
         :return: void
         """
-        Utility.output_list_to_txt(output=schedule.list_of_load_in_strings_for_events(), output_file_absolute_path=LOAD_IN_EVENTS_FILE_NAME, overwrite=True)
-        backup_schedule()
+        conflicts = schedule.get_attendance_conflicts(event_id)
+        if conflicts:
+            print("WARNING: Event " + str(event_id) + " Overlaps:")
+            for conflict_id, conflict_event in conflicts:
+                print("\t" + conflict_event.date + " " +
+                        get_event_print_str(conflict_id, conflict_event))
+
+
+    def archive_schedule(before_date):
+        """
+        Move the events before a date from the schedule into the archive files, the schedule must
+                be saved afterwards so that they are not loaded in again
+        :param before_date:
+        :return: {four digit year:number of events archived}
+        """
+        return Archive.write_archive(LOAD_IN_EVENTS_ARCHIVE_FOLDER,
+                schedule.archive_events(before_date))
+
+
+    def save_schedule(archive_passed=True):
+        """
+        Save the changes made to the schedule since the last save, and back them up
+        :param archive_passed: if False, events are not archived even if ARCHIVE_AFTER_DAYS is set
+        :return: void
+        """
+        if archive_passed and ARCHIVE_AFTER_DAYS is not None:
+            archive_schedule(get_date_str(datetime.date.today().toordinal() - ARCHIVE_AFTER_DAYS))
+        storage.save(schedule)
+        backup_schedule(only_if_changed=True)
+
+
+    def compact_schedule():
+        """
+        Save the schedule in full, and back it up if it changed since its latest backup, or since
+                it was loaded as saves are backed up. The ids of the events may change when the
+                schedule is next loaded, so this is only done when the schedule is about to be
+                loaded in again or left
+        :return: void
+        """
+        backup_schedule(load_in_strings=storage.compact(
+                schedule).list_of_load_in_strings_for_events(), only_if_changed=True)
 
 
     # INIT MESSAGE TO USER
@@ -110,24 +232,50 @@ try:
 
     # SETUP
 
-    # deal with events
-    if os.path.isfile(LOAD_IN_EVENTS_FILE_NAME):  # if the events file exists
-        load_in_schedule()
-        print("Schedule Loaded\n")
-    else:
-        print("\nEVENTS FILE: '" + LOAD_IN_EVENTS_FILE_NAME + "' DOES NOT EXIST, WILL BE CREATED UPON NEXT SAVE. \n")
-        schedule = Schedule()
-
     # create backups folder if nonexistent
     if not os.path.isdir(LOAD_IN_EVENTS_BACKUPS_FOLDER):
         os.mkdir(LOAD_IN_EVENTS_BACKUPS_FOLDER)
 
+    # deal with events
+    storage = get_storage(STORAGE_BACKEND)
+    schedule = None  # while the whole schedule is not loaded in, see LOAD_IN_EVENTS_LAZY
+    latest_backup = None  # (schedule, file name) of the latest backup written, the changes made to
+            # that schedule since are all the next backup of it needs to hold
+    if storage.exists():
+        if storage.needs_compaction():  # fold it, before any ids have been shown
+            load_in_schedule()
+            compact_schedule()
+            load_in_schedule()
+            print("Schedule Loaded\n")
+        elif (LOAD_IN_EVENTS_LAZY or storage.answers_range_queries) and storage.open_ranges():
+            print("Schedule Opened, Events Are Loaded When Needed\n")
+        else:
+            load_in_schedule()
+            print("Schedule Loaded\n")
+    else:
+        for other_storage in [get_storage(storage_backend) for storage_backend in
+                (ENUM_Storage_Backend.TEXT, ENUM_Storage_Backend.BINARY,
+                    ENUM_Storage_Backend.SQLITE) if storage_backend != STORAGE_BACKEND]:
+            if other_storage.exists():  # convert it
+                schedule = other_storage.load(UNDO_HISTORY_DEPTH)
+                compact_schedule()
+                backup_schedule()  # as it was not saved through this storage
+                other_storage.remove()
+                load_in_schedule()
+                print("Schedule Loaded, Converted From '" + other_storage.get_name() + "'\n")
+                break
+        else:
+            print("\nEVENTS FILE: '" + storage.get_name() + "' DOES NOT EXIST, WILL BE CREATED UPON NEXT SAVE. \n")
+            schedule = Schedule(history_depth=UNDO_HISTORY_DEPTH)
+
 
     # SCRIPT ARGUMENTS
     if len(sys.argv) >= 2 and sys.argv[1].strip().lower() == "print":  # start run with a print command, this is for the Windows Task Scheduler to use so that it can show
             # the schedule from the command line when desired
+        load_in_schedule_if_lazy()
         # noinspection PyUnboundLocalVariable
-        print(schedule)
+        Utility.write_chunks(schedule.iter_print_chunks())
+        print()
 
 
     # MAIN
@@ -136,6 +284,8 @@ try:
         # logging.info("INFO: user_input: " + str(user_input))
 
         parsed_args = None  # reset for debugging
+        if user_input and user_input[0] not in LAZY_COMMANDS:
+            load_in_schedule_if_lazy()
         if not user_input:
             pass
         elif user_input[0] == 'help':
@@ -157,13 +307,45 @@ try:
     Commands:
     help                            :   print this help page
     blanks, b                       :   print blank lines, default: """ + str(BLANKS_DEFAULT) + ", max: " + str(BLANKS_MAX) + """ (command args: opt:number)
-    print, p                        :   print schedule
+    print, p                        :   print schedule (command args: opt:from date, opt:to date, opt:tag=<tag>, opt:type=<atnd or ddln>,
+                                            opt:--head <number>, opt:--page)
+                                            (dates bound the print inclusively, 'tag=' and 'type=' args filter it and can be given anywhere,
+                                            recurring events are printed as occurrences when a to date is given and as their rules otherwise,
+                                            '--head <number>' only prints the first events, '--page' prints a screen at a time,
+                                            the print is written out a date at a time as it is made)
+    search                          :   print events whose descriptions hold words starting with every search term (command args: end:search terms)
+                                            (only the first """ + str(SEARCH_RESULTS_MAX) + """ events are printed, then every matching recurring event)
     add_attendance, aa              :   add a new ATTENDANCE event (command args: date, time, opt:end time, tag, end:description)
     add_deadline, ad                :   add a new DEADLINE event (command args: date, time, opt:duration, tag, end:description)
+    add_recurring_attendance, ara   :   add a new recurring ATTENDANCE event (command args: rule args, date, time, opt:end time, tag, end:description)
+    add_recurring_deadline, ard     :   add a new recurring DEADLINE event (command args: rule args, date, time, opt:duration, tag, end:description)
+                                            (rule args come first: repeat=<daily, weekly or monthly>, opt:every=<number>,
+                                            opt:on=<days of the week, like m,w,f or mon,wed,fri, weekly only>, opt:until=<date>, opt:count=<number>,
+                                            the date is the first date an occurrence can be on)
     modify_attendance, ma           :   modify an ATTENDANCE event (command args: event id, opt:date, opt:time, opt:end time !(can type 'none' to set value to None), opt:tag, opt&end:description)
     modify_deadline, md             :   modify a DEADLINE event (command args: event id, opt:date, opt:time, opt:duration !(can type 'none' to set value to None), opt:tag, opt&end:description)
+    free                            :   find the earliest free slots of at least a duration (command args: duration, opt:from date, opt:to date)
+                                            (searches from now if no from date is given, 'between <time>-<time>' can be given anywhere to
+                                            only count time between those times of each day)
+    totals                          :   print the number of events and their total durations by event type (command args: opt:from date, opt:to date, opt:tag=<tag>)
+    occupancy                       :   print a heatmap of how booked each hour of each day is (command args: opt:from date, opt:to date)
+                                            (from today and for """ + str(OCCUPANCY_DEFAULT_DAYS) + """ days by default)
+    conflicts                       :   list all pairs of overlapping ATTENDANCE events (command args: opt:from date, opt:to date)
     delete, d                       :   delete an event (command args: end:event ids)
-    save, s                         :   save changes
+    undo                            :   undo the latest adds, deletes and modifications, up to """ + str(UNDO_HISTORY_DEPTH) + """ back (command args: opt:number)
+    redo                            :   redo the latest undone changes, until a new change is made (command args: opt:number)
+    archive                         :   move the events before a date into per year archive files and save (command args: opt:before date)
+                                            (before today by default, archived events are not loaded in on start, recurring events are
+                                            never archived""" + ("" if ARCHIVE_AFTER_DAYS is None else ", events more than " +
+                                            str(ARCHIVE_AFTER_DAYS) + " days old are also archived on every save") + """)
+    archived                        :   list the archived years, or print the archived events of a year (command args: opt:year)
+    restore                         :   move the archived events of a year back into the schedule and save (command args: year)
+    backups                         :   list the backups, taken on each save or quit that changed the schedule, numbered oldest first
+                                            (all but every """ + str(FULL_BACKUP_EVERY + 1) + """th backup only hold the changes since the backup before them)
+    restore_backup                  :   replace the schedule with a backup and save (command args: backup number)
+    save, s                         :   save changes and back them up (only the changes are written: to '""" + LOAD_IN_EVENTS_JOURNAL_FILE_NAME + """' for an events file,
+                                            which is folded into the events file on startup and quit once large,
+                                            and to '""" + LOAD_IN_EVENTS_DATABASE_FILE_NAME + """' for the SQLite storage, which also commits every change as it is made)
     save_and_print, sp              :   save changes and print new schedule
     reload                          :   reload schedule
     quit, q                         :   save changes and quit the application
@@ -185,7 +367,76 @@ try:
                 print("\n" * (BLANKS_DEFAULT if parsed_args[0] is None else parsed_args[0]),
                         end='')
         elif user_input[0] == 'print' or user_input[0] == 'p':
-            print(schedule)
+            print_args = user_input[1:]
+            head_args = None  # [number str] if given
+            if '--head' in print_args:
+                head_position = print_args.index('--head')
+                head_args = print_args[head_position + 1:head_position + 2]
+                print_args = print_args[:head_position] + print_args[head_position + 2:]
+            page = '--page' in print_args
+            print_args = [in_arg for in_arg in print_args if in_arg != '--page']
+            parsed_head_args = None if head_args is None else input_parser_parse(head_args,
+                    [PARAM_Arg_Form(input_type=ENUM_Input_Type.REGULAR,
+                        demanded_value_type=ENUM_Demanded_Value_Type.UNSIGNED_INT)])
+            parsed_args = input_parser_parse([in_arg for in_arg in print_args if
+                    '=' not in in_arg],
+                    [PARAM_Arg_Form(input_type=ENUM_Input_Type.OPTIONAL,
+                        demanded_value_type=ENUM_Demanded_Value_Type.DATE),
+                    PARAM_Arg_Form(input_type=ENUM_Input_Type.OPTIONAL,
+                        demanded_value_type=ENUM_Demanded_Value_Type.DATE)])
+            parsed_keyword_args = input_parser_parse_keyword_args([in_arg for in_arg in
+                    print_args if '=' in in_arg], ["tag", "type"])
+            if type(parsed_args) == str or type(parsed_keyword_args) == str or \
+                    type(parsed_head_args) == str:  # bad args
+                print(parsed_args if type(parsed_args) == str else parsed_keyword_args if
+                        type(parsed_keyword_args) == str else "'--head' " + parsed_head_args)
+                print("Command: 'print': (command args: opt:from date, opt:to date, "
+                        "opt:tag=<tag>, opt:type=<atnd or ddln>, opt:--head <number>, opt:--page)")
+            elif parsed_head_args is not None and parsed_head_args[0] == 0:
+                print("Command Failure: '--head' must be at least 1")
+            elif "type" in parsed_keyword_args and parsed_keyword_args["type"].upper() not in \
+                    (ENUM_Event_Type.ATND, ENUM_Event_Type.DDLN):  # not an event type
+                print("Command Failure: type: '" + parsed_keyword_args["type"] + "' is not an "
+                        "event type, expected 'atnd' or 'ddln'")
+            else:  # execute command
+                if parsed_args[0] is None and parsed_args[1] is None:  # the whole schedule
+                    load_in_schedule_if_lazy()
+                    printed_schedule = schedule
+                elif schedule is None or (storage.answers_range_queries and
+                        storage.open_ranges()):  # read only the events of the dates
+                    printed_schedule = storage.get_schedule(parsed_args[0], parsed_args[1],
+                            tag=parsed_keyword_args.get("tag"),
+                            event_type=parsed_keyword_args["type"].upper() if "type" in
+                                parsed_keyword_args else None)
+                else:
+                    printed_schedule = schedule
+                print_chunks = printed_schedule.iter_print_chunks(
+                        tag=parsed_keyword_args.get("tag"),
+                        event_type=parsed_keyword_args["type"].upper() if "type" in
+                            parsed_keyword_args else None,
+                        start_date=parsed_args[0], end_date=parsed_args[1],
+                        head=None if parsed_head_args is None else parsed_head_args[0])
+                if page:
+                    Utility.page_chunks(print_chunks, shutil.get_terminal_size().lines - 1)
+                else:
+                    Utility.write_chunks(print_chunks)
+                print()
+        elif user_input[0] == 'search':
+            parsed_args = input_parser_parse(user_input[1:],
+                    [PARAM_Arg_Form(input_type=ENUM_Input_Type.END,
+                        demanded_value_type=ENUM_Demanded_Value_Type.STR)])
+            if type(parsed_args) == str:  # bad args
+                print(parsed_args)
+                print("Command: 'search': (command args: end:search terms)")
+            else:  # execute command
+                search_results = schedule.search_events(parsed_args[0],
+                        head=SEARCH_RESULTS_MAX + 1)  # one more to know if there are more
+                recurring_results = [(event_id, event) for event_id, event in search_results if
+                        event.event_type == ENUM_Event_Type.RCUR]
+                print("".join(iter_schedule_print_chunks(search_results[:len(search_results) -
+                        len(recurring_results)], empty_message="No events match the search.",
+                        head=SEARCH_RESULTS_MAX)) +
+                        (get_recurring_print_str(recurring_results) if recurring_results else ""))
         elif user_input[0] == 'add_attendance' or user_input[0] == 'aa':
             parsed_args = input_parser_parse(user_input[1:],
                     [PARAM_Arg_Form(input_type=ENUM_Input_Type.REGULAR,
@@ -207,6 +458,7 @@ try:
                         end_time=parsed_args[2], tag=parsed_args[3],
                         description=parsed_args[4])  # (id, string representation of new event)
                 print("New Event Added:\nID:", str(temp[0]) + ", Event:", temp[1])
+                print_attendance_conflicts(temp[0])
         elif user_input[0] == 'add_deadline' or user_input[0] == 'ad':
             parsed_args = input_parser_parse(user_input[1:],
                     [PARAM_Arg_Form(input_type=ENUM_Input_Type.REGULAR,
@@ -228,6 +480,62 @@ try:
                         duration=parsed_args[2], tag=parsed_args[3],
                         description=parsed_args[4])  # (id, string representation of new event)
                 print("New Event Added:\nID:", str(temp[0]) + ", Event:", temp[1])
+        elif user_input[0] == 'add_recurring_attendance' or user_input[0] == 'ara':
+            rule_arg_count = len(list(itertools.takewhile(lambda in_arg: '=' in in_arg,
+                    user_input[1:])))
+            parsed_recurrence = input_parser_parse_keyword_args(user_input[1:1 + rule_arg_count],
+                    RECURRENCE_KEYWORDS)
+            if type(parsed_recurrence) != str:
+                parsed_recurrence = input_parser_parse_recurrence(parsed_recurrence)
+            parsed_args = input_parser_parse(user_input[1 + rule_arg_count:],
+                    [PARAM_Arg_Form(input_type=ENUM_Input_Type.REGULAR,
+                        demanded_value_type=ENUM_Demanded_Value_Type.DATE),
+                    PARAM_Arg_Form(input_type=ENUM_Input_Type.REGULAR,
+                        demanded_value_type=ENUM_Demanded_Value_Type.TIME),
+                    PARAM_Arg_Form(input_type=ENUM_Input_Type.OPTIONAL,
+                        demanded_value_type=ENUM_Demanded_Value_Type.TIME),
+                    PARAM_Arg_Form(input_type=ENUM_Input_Type.REGULAR,
+                        demanded_value_type=ENUM_Demanded_Value_Type.STR),
+                    PARAM_Arg_Form(input_type=ENUM_Input_Type.END,
+                        demanded_value_type=ENUM_Demanded_Value_Type.STR)])
+            if type(parsed_recurrence) == str or type(parsed_args) == str:  # bad args
+                print(parsed_recurrence if type(parsed_recurrence) == str else parsed_args)
+                print("Command: 'add_recurring_attendance': (command args: rule args, date, time, "
+                        "opt:end time, tag, end:description)")
+            else:  # execute command
+                temp = schedule.add_recurring_attendance_event(*parsed_recurrence,
+                        date=parsed_args[0], time=parsed_args[1], end_time=parsed_args[2],
+                        tag=parsed_args[3], description=parsed_args[4])  # (id, string
+                        # representation of new event)
+                print("New Event Added:\nID:", str(temp[0]) + ", Event:", temp[1])
+        elif user_input[0] == 'add_recurring_deadline' or user_input[0] == 'ard':
+            rule_arg_count = len(list(itertools.takewhile(lambda in_arg: '=' in in_arg,
+                    user_input[1:])))
+            parsed_recurrence = input_parser_parse_keyword_args(user_input[1:1 + rule_arg_count],
+                    RECURRENCE_KEYWORDS)
+            if type(parsed_recurrence) != str:
+                parsed_recurrence = input_parser_parse_recurrence(parsed_recurrence)
+            parsed_args = input_parser_parse(user_input[1 + rule_arg_count:],
+                    [PARAM_Arg_Form(input_type=ENUM_Input_Type.REGULAR,
+                        demanded_value_type=ENUM_Demanded_Value_Type.DATE),
+                    PARAM_Arg_Form(input_type=ENUM_Input_Type.REGULAR,
+                        demanded_value_type=ENUM_Demanded_Value_Type.TIME),
+                    PARAM_Arg_Form(input_type=ENUM_Input_Type.OPTIONAL,
+                        demanded_value_type=ENUM_Demanded_Value_Type.DURATION),
+                    PARAM_Arg_Form(input_type=ENUM_Input_Type.REGULAR,
+                        demanded_value_type=ENUM_Demanded_Value_Type.STR),
+                    PARAM_Arg_Form(input_type=ENUM_Input_Type.END,
+                        demanded_value_type=ENUM_Demanded_Value_Type.STR)])
+            if type(parsed_recurrence) == str or type(parsed_args) == str:  # bad args
+                print(parsed_recurrence if type(parsed_recurrence) == str else parsed_args)
+                print("Command: 'add_recurring_deadline': (command args: rule args, date, time, "
+                        "opt:duration, tag, end:description)")
+            else:  # execute command
+                temp = schedule.add_recurring_deadline_event(*parsed_recurrence,
+                        date=parsed_args[0], time=parsed_args[1], duration=parsed_args[2],
+                        tag=parsed_args[3], description=parsed_args[4])  # (id, string
+                        # representation of new event)
+                print("New Event Added:\nID:", str(temp[0]) + ", Event:", temp[1])
         elif user_input[0] == 'delete' or user_input[0] == 'd':
             parsed_args = input_parser_parse(user_input[1:],
                     [PARAM_Arg_Form(input_type=ENUM_Input_Type.END,
@@ -273,13 +581,14 @@ try:
                         set_end_time_to_none=set_end_time_to_none,
                         end_time=None if set_end_time_to_none else parsed_args[3],
                         tag=parsed_args[4], description=parsed_args[5])  #
-                        # (id, string representation of new event OR failure message)
+                        # (id, string representation of modified event OR failure message)
                 if temp[0] == -1:
                     print(("Event " + str(parsed_args[0]) + " Could Not Be Modified: "
                             "Error Message: " + temp[1]))
                 else:
-                    print("Event Successfully Modified\nNew Event ID: " + str(temp[0]) +
-                        "\nNew Event: " + temp[1])
+                    print("Event Successfully Modified\nEvent ID: " + str(temp[0]) +
+                        "\nModified Event: " + temp[1])
+                    print_attendance_conflicts(temp[0])
         elif user_input[0] == 'modify_deadline' or user_input[0] == 'md':
             set_duration_to_none = False
             try:
@@ -313,13 +622,236 @@ try:
                         set_duration_to_none=set_duration_to_none,
                         duration=None if set_duration_to_none else parsed_args[3],
                         tag=parsed_args[4], description=parsed_args[5])  #
-                        # (id, string representation of new event OR failure message)
+                        # (id, string representation of modified event OR failure message)
                 if temp[0] == -1:
                     print(("Event " + str(parsed_args[0]) + " Could Not Be Modified: "
                             "Error Message: " + temp[1]))
                 else:
-                    print("Event Successfully Modified\nNew Event ID: " + str(temp[0]) +
-                        "\nNew Event: " + temp[1])
+                    print("Event Successfully Modified\nEvent ID: " + str(temp[0]) +
+                        "\nModified Event: " + temp[1])
+        elif user_input[0] == 'free':
+            between_args = None  # [earliest time, latest time] strs if given
+            free_args = user_input[1:]
+            if 'between' in free_args:
+                between_position = free_args.index('between')
+                between_args = free_args[between_position + 1:between_position + 2]
+                between_args = between_args[0].split('-') if between_args else []
+                free_args = free_args[:between_position] + free_args[between_position + 2:]
+            parsed_args = input_parser_parse(free_args,
+                    [PARAM_Arg_Form(input_type=ENUM_Input_Type.REGULAR,
+                        demanded_value_type=ENUM_Demanded_Value_Type.DURATION),
+                    PARAM_Arg_Form(input_type=ENUM_Input_Type.OPTIONAL,
+                        demanded_value_type=ENUM_Demanded_Value_Type.DATE),
+                    PARAM_Arg_Form(input_type=ENUM_Input_Type.OPTIONAL,
+                        demanded_value_type=ENUM_Demanded_Value_Type.DATE)])
+            parsed_between_args = None if between_args is None else \
+                    input_parser_parse(between_args,
+                        [PARAM_Arg_Form(input_type=ENUM_Input_Type.REGULAR,
+                            demanded_value_type=ENUM_Demanded_Value_Type.TIME),
+                        PARAM_Arg_Form(input_type=ENUM_Input_Type.REGULAR,
+                            demanded_value_type=ENUM_Demanded_Value_Type.TIME)])
+            if type(parsed_args) == str or type(parsed_between_args) == str:  # bad args
+                print(parsed_args if type(parsed_args) == str else
+                        "'between' " + parsed_between_args)
+                print("Command: 'free': (command args: duration, opt:from date, opt:to date, "
+                        "opt:between <time>-<time>)")
+            elif parsed_args[0] == 0:
+                print("Command Failure: duration must be greater than 0")
+            elif parsed_between_args is not None and parsed_args[0] > \
+                    get_minutes(parsed_between_args[1]) - get_minutes(parsed_between_args[0]):
+                print("Command Failure: the 'between' times must be in order and at least the "
+                        "duration apart")
+            else:  # execute command
+                now = datetime.datetime.now()
+                free_slots = list(itertools.islice(schedule.iter_free_slots(
+                        duration=parsed_args[0],
+                        start_date=input_parser_parse(["today"],
+                            [PARAM_Arg_Form(input_type=ENUM_Input_Type.REGULAR,
+                                demanded_value_type=ENUM_Demanded_Value_Type.DATE)])[0]
+                            if parsed_args[1] is None else parsed_args[1],
+                        start_time=now.strftime("%H:%M") if parsed_args[1] is None else "00:00",
+                        end_date=parsed_args[2], between_times=parsed_between_args),
+                    FREE_SLOTS_COUNT))
+                if free_slots:
+                    print("FREE:")
+                    for start_date, start_time, end_date, end_time in free_slots:
+                        print("\t" + start_date + " " + start_time + " - " +
+                                ("onwards" if end_date is None else end_date + " " + end_time))
+                else:
+                    print("No Free Slots Found")
+        elif user_input[0] == 'totals':
+            parsed_args = input_parser_parse([in_arg for in_arg in user_input[1:] if
+                    '=' not in in_arg],
+                    [PARAM_Arg_Form(input_type=ENUM_Input_Type.OPTIONAL,
+                        demanded_value_type=ENUM_Demanded_Value_Type.DATE),
+                    PARAM_Arg_Form(input_type=ENUM_Input_Type.OPTIONAL,
+                        demanded_value_type=ENUM_Demanded_Value_Type.DATE)])
+            parsed_keyword_args = input_parser_parse_keyword_args([in_arg for in_arg in
+                    user_input[1:] if '=' in in_arg], ["tag"])
+            if type(parsed_args) == str or type(parsed_keyword_args) == str:  # bad args
+                print(parsed_args if type(parsed_args) == str else parsed_keyword_args)
+                print("Command: 'totals': (command args: opt:from date, opt:to date, "
+                        "opt:tag=<tag>)")
+            else:  # execute command
+                totals = schedule.get_totals(start_date=parsed_args[0], end_date=parsed_args[1],
+                        tag=parsed_keyword_args.get("tag"))
+                totals["ALL"] = tuple(sum(type_totals) for type_totals in zip(*totals.values()))
+                print("TOTALS:")
+                for totals_type, (event_count, total_duration) in totals.items():
+                    print("\t" + totals_type.ljust(4) + ": " + str(event_count).rjust(6) +
+                            " event" + (" " if event_count == 1 else "s") + ", " +
+                            get_duration_print_str(total_duration))
+        elif user_input[0] == 'occupancy':
+            parsed_args = input_parser_parse(user_input[1:],
+                    [PARAM_Arg_Form(input_type=ENUM_Input_Type.OPTIONAL,
+                        demanded_value_type=ENUM_Demanded_Value_Type.DATE),
+                    PARAM_Arg_Form(input_type=ENUM_Input_Type.OPTIONAL,
+                        demanded_value_type=ENUM_Demanded_Value_Type.DATE)])
+            if type(parsed_args) == str:  # bad args
+                print(parsed_args)
+                print("Command: 'occupancy': (command args: opt:from date, opt:to date)")
+            else:  # execute command
+                occupancy_start_date = input_parser_parse(["today"],
+                        [PARAM_Arg_Form(input_type=ENUM_Input_Type.REGULAR,
+                            demanded_value_type=ENUM_Demanded_Value_Type.DATE)])[0] \
+                        if parsed_args[0] is None else parsed_args[0]
+                print(schedule.get_occupancy_print_str(start_date=occupancy_start_date,
+                        end_date=get_date_str(get_day_ordinal(occupancy_start_date) +
+                            OCCUPANCY_DEFAULT_DAYS - 1) if parsed_args[1] is None else
+                            parsed_args[1]))
+        elif user_input[0] == 'conflicts':
+            parsed_args = input_parser_parse(user_input[1:],
+                    [PARAM_Arg_Form(input_type=ENUM_Input_Type.OPTIONAL,
+                        demanded_value_type=ENUM_Demanded_Value_Type.DATE),
+                    PARAM_Arg_Form(input_type=ENUM_Input_Type.OPTIONAL,
+                        demanded_value_type=ENUM_Demanded_Value_Type.DATE)])
+            if type(parsed_args) == str:  # bad args
+                print(parsed_args)
+                print("Command: 'conflicts': (command args: opt:from date, opt:to date)")
+            else:  # execute command
+                conflicts = schedule.get_all_attendance_conflicts(start_date=parsed_args[0],
+                        end_date=parsed_args[1])
+                if conflicts:
+                    for (first_id, first_event), (second_id, second_event) in conflicts:
+                        print("CONFLICT:\n\t" + first_event.date + " " +
+                                get_event_print_str(first_id, first_event) + "\n\t" +
+                                second_event.date + " " +
+                                get_event_print_str(second_id, second_event))
+                else:
+                    print("No Conflicts Found")
+        elif user_input[0] == 'undo' or user_input[0] == 'redo':
+            parsed_args = input_parser_parse(user_input[1:],
+                    [PARAM_Arg_Form(ENUM_Input_Type.OPTIONAL,
+                        demanded_value_type=ENUM_Demanded_Value_Type.UNSIGNED_INT)])
+            if type(parsed_args) == str:  # bad args
+                print(parsed_args)
+                print("Command: '" + user_input[0] + "': (command args: opt:number)")
+            else:  # execute command
+                operations = (schedule.undo if user_input[0] == 'undo' else schedule.redo)(
+                        1 if parsed_args[0] is None else parsed_args[0])
+                for operation_type, event_id in operations:
+                    print(("Undone: " if user_input[0] == 'undo' else "Redone: ") +
+                            operation_type + " of Event " + str(event_id))
+                if not operations:
+                    print("Nothing To " + user_input[0].capitalize())
+        elif user_input[0] == 'archive':
+            parsed_args = input_parser_parse(user_input[1:],
+                    [PARAM_Arg_Form(input_type=ENUM_Input_Type.OPTIONAL,
+                        demanded_value_type=ENUM_Demanded_Value_Type.DATE)])
+            if type(parsed_args) == str:  # bad args
+                print(parsed_args)
+                print("Command: 'archive': (command args: opt:before date)")
+            else:  # execute command
+                archived_counts = archive_schedule(input_parser_parse(["today"],
+                        [PARAM_Arg_Form(input_type=ENUM_Input_Type.REGULAR,
+                            demanded_value_type=ENUM_Demanded_Value_Type.DATE)])[0]
+                        if parsed_args[0] is None else parsed_args[0])
+                save_schedule()
+                if archived_counts:
+                    print("ARCHIVED:")
+                    for year, event_count in archived_counts.items():
+                        print("	" + year + ": " + str(event_count) + " event" +
+                                ("" if event_count == 1 else "s"))
+                else:
+                    print("No Events To Archive")
+                print("Save Complete")
+        elif user_input[0] == 'archived':
+            parsed_args = input_parser_parse(user_input[1:],
+                    [PARAM_Arg_Form(input_type=ENUM_Input_Type.OPTIONAL,
+                        demanded_value_type=ENUM_Demanded_Value_Type.UNSIGNED_INT)])
+            if type(parsed_args) == str:  # bad args
+                print(parsed_args)
+                print("Command: 'archived': (command args: opt:year)")
+            elif parsed_args[0] is None:  # execute command, list the years
+                archived_years = Archive.get_archived_years(LOAD_IN_EVENTS_ARCHIVE_FOLDER)
+                print("ARCHIVED YEARS: " + (", ".join(archived_years) if archived_years else
+                        "none"))
+            else:  # execute command, print a year
+                archived_load_in_strings = Archive.read_archive(LOAD_IN_EVENTS_ARCHIVE_FOLDER,
+                        str(parsed_args[0]).zfill(4))
+                if archived_load_in_strings:
+                    print(Schedule(load_in_events=archived_load_in_strings))
+                    print("(ids above are only positions within the archive)")
+                else:
+                    print("No Archived Events In " + str(parsed_args[0]))
+        elif user_input[0] == 'restore':
+            parsed_args = input_parser_parse(user_input[1:],
+                    [PARAM_Arg_Form(input_type=ENUM_Input_Type.REGULAR,
+                        demanded_value_type=ENUM_Demanded_Value_Type.UNSIGNED_INT)])
+            if type(parsed_args) == str:  # bad args
+                print(parsed_args)
+                print("Command: 'restore': (command args: year)")
+            else:  # execute command
+                restored_year = str(parsed_args[0]).zfill(4)
+                restored_ids = schedule.restore_events(
+                        Archive.read_archive(LOAD_IN_EVENTS_ARCHIVE_FOLDER, restored_year))
+                if restored_ids:
+                    save_schedule(archive_passed=False)  # save before removing the archive file
+                            # so that the events are always in one of the files
+                    Archive.remove_archive(LOAD_IN_EVENTS_ARCHIVE_FOLDER, restored_year)
+                    print("Restored " + str(len(restored_ids)) + " Event" +
+                            ("" if len(restored_ids) == 1 else "s") + " From " + restored_year +
+                            ", IDs " + str(restored_ids[0]) + " - " + str(restored_ids[-1]))
+                    print("Save Complete")
+                else:
+                    print("No Archived Events In " + restored_year)
+        elif user_input[0] == 'backups':
+            backup_file_names = Backup.get_backup_file_names(LOAD_IN_EVENTS_BACKUPS_FOLDER)
+            if backup_file_names:
+                print("BACKUPS:")
+                for backup_number, backup_file_name in enumerate(backup_file_names, 1):
+                    print("\t" + str(backup_number) + ": " + backup_file_name)
+            else:
+                print("No Backups")
+        elif user_input[0] == 'restore_backup':
+            parsed_args = input_parser_parse(user_input[1:],
+                    [PARAM_Arg_Form(input_type=ENUM_Input_Type.REGULAR,
+                        demanded_value_type=ENUM_Demanded_Value_Type.UNSIGNED_INT)])
+            backup_file_names = Backup.get_backup_file_names(LOAD_IN_EVENTS_BACKUPS_FOLDER)
+            if type(parsed_args) == str:  # bad args
+                print(parsed_args)
+                print("Command: 'restore_backup': (command args: backup number)")
+            elif not 1 <= parsed_args[0] <= len(backup_file_names):
+                print("No Backup " + str(parsed_args[0]) + ", Type 'backups' To List Them")
+            elif not Backup.is_backup_readable(LOAD_IN_EVENTS_BACKUPS_FOLDER,
+                    backup_file_names[parsed_args[0] - 1]):
+                print("Command Failure: Backup " + str(parsed_args[0]) + " Can Not Be Restored, "
+                        "A Backup It Is Kept As Changes On Has Been Removed Or Damaged")
+            elif input("Are you sure that you want to replace the schedule with backup '" +
+                    backup_file_names[parsed_args[0] - 1] + "' and save (y/n)? ").strip().lower() \
+                    == 'y':
+                restored_load_in_strings = Backup.read_backup(LOAD_IN_EVENTS_BACKUPS_FOLDER,
+                        backup_file_names[parsed_args[0] - 1])
+                backup_schedule("RESTORE_BACKUP")
+                schedule = Schedule(load_in_events=restored_load_in_strings,
+                        history_depth=UNDO_HISTORY_DEPTH)
+                compact_schedule()  # its ids start over, as they would when loaded in again
+                print("Save Complete")
+                print("Restored " + str(len(restored_load_in_strings)) + " Event" +
+                        ("" if len(restored_load_in_strings) == 1 else "s") + " From Backup " +
+                        str(parsed_args[0]))
+            else:
+                print("Backup Restore Not Performed")
         elif user_input[0] == 'save' or user_input[0] == 's':
             save_schedule()
             print("Save Complete")
@@ -327,14 +859,19 @@ try:
             save_schedule()
             print("Save Complete")
             print()
-            print(schedule)
+            Utility.write_chunks(schedule.iter_print_chunks())
+            print()
             print()
             print("Above Represents Print After Save")
         elif user_input[0] == 'reload':
             load_in_schedule()
-            print("Schedule Reloaded; Changes Since Last Save Discarded")
+            print("Schedule Reloaded" if storage.saves_every_change else  # nothing is unsaved
+                    "Schedule Reloaded; Changes Since Last Save Discarded")
         elif user_input[0] == 'quit' or user_input[0] == 'q':
-            save_schedule()
+            if schedule is not None:  # otherwise nothing has changed
+                save_schedule()
+                if storage.needs_compaction():
+                    compact_schedule()
             print("Save Complete")
             quit()
         elif user_input[0] == 'quit_without_saving':
@@ -343,14 +880,18 @@ try:
             if input("Are you sure that you want to remove all events from the schedule and save "
                     "(y/n)? ").strip().lower() == 'y':
                 backup_schedule("WIPE_SCHEDULE")
-                schedule = Schedule()  # create a new, empty, schedule as the schedule
-                save_schedule()
+                schedule = Schedule(history_depth=UNDO_HISTORY_DEPTH)  # create a new, empty,
+                        # schedule as the schedule
+                compact_schedule()  # its ids start over, as they would when loaded in again
                 print("Save Complete")
                 print("Schedule Successfully Wiped")
             else:
                 print("Schedule Wipe Not Performed")
         else:
             print("Command '" + user_input[0] + "' not recognized. Type 'help' for help")
+        if storage.saves_every_change and schedule is not None:  # commit the changes of each
+                # command as it is done
+            storage.save(schedule)
         print()
 except SystemExit:  # for quit() calls
     pass
@@ -8,12 +8,88 @@ __author__ = "Cole Anderson"
 
 
 # IMPORTS
-from sortedcontainers import SortedDict
+from collections import OrderedDict, deque
+from heapq import merge, nsmallest
+from itertools import islice
+from weakref import WeakSet
 
-from Event import Base_Event, Attendance_Event, Deadline_Event, ENUM_Event_Type
+from sortedcontainers import SortedList
+
+from Date_Time import MINUTES_PER_DAY, DAY_ORDINAL_MAX, DAY_NAMES_PRINT, get_day_ordinal, \
+        get_date_str, get_minutes, get_time_str
+from Event import Base_Event, Attendance_Event, Deadline_Event, Recurring_Event, ENUM_Event_Type, \
+        ENUM_Recurrence_Frequency
+from Event_Store import Object_Event_Store, Columnar_Event_Store
+from Indexes import Token_Index, Array_Token_Index, Interval_Index, Array_Interval_Index, \
+        Fenwick_Tree, Nested_Key_Index, Flat_Key_Index, Packed_Key_Array, Array_Key_Index, \
+        Array_Location_Map, get_overlapping_pairs
+
+
+# ENUMS
+class ENUM_Operation_Type:  # kinds of the operations in the undo history of a Schedule
+    ADD = "ADD"
+    DELETE = "DELETE"
+    MODIFY = "MODIFY"
+
+
+# CONSTANTS
+OCCUPANCY_PRINT_CHARS = (".", "-", "=", "+", "*", "#")  # for the share of an hour booked:
+        # none, under a quarter, under a half, under three quarters, not all, all
+RECURRENCE_UNIT_PRINT_STRS = {ENUM_Recurrence_Frequency.DAILY: "day",
+        ENUM_Recurrence_Frequency.WEEKLY: "week", ENUM_Recurrence_Frequency.MONTHLY: "month"}
+OCCURRENCE_CACHE_SIZE = 32  # number of expanded windows of recurring event occurrences kept
+OCCURRENCE_WINDOW_DAYS = 64  # days of recurring event occurrences expanded at a time by the
+        # queries that read them lazily
+HISTORY_DEPTH_DEFAULT = 100  # number of operations that can be undone
 
 
 # FUNCTIONS
+def get_booked_minutes(occupancy: int, start_minutes: int=0,
+        end_minutes: int=MINUTES_PER_DAY) -> int:
+    """
+    Count the booked minutes of part of a day
+    :param occupancy: occupancy bitmap of the day, see Schedule.get_day_occupancy
+    :param start_minutes: first minute of the day counted
+    :param end_minutes: minute of the day after the last minute counted
+    :return:
+    """
+    return bin((occupancy >> start_minutes) & ((1 << (end_minutes - start_minutes)) - 1)).count("1")
+
+
+def get_attendance_interval(event, start: int=None) -> (int, int) or None:
+    """
+    Get the span of an ATTENDANCE event on a timeline of minutes counted from the first day of the
+            proleptic Gregorian calendar, an end time earlier than the time is taken to be on the
+            next day
+    :param event: an Attendance_Event
+    :param start: if given, the minute of the date and time of the event on the timeline, saving
+            parsing them again
+    :return: (start minute, end minute), None if the event has no end time
+    """
+    if event.end_time is None:
+        return None
+    if start is None:
+        start = get_day_ordinal(event.date) * MINUTES_PER_DAY + get_minutes(event.time)
+    length = get_minutes(event.end_time) - start % MINUTES_PER_DAY
+    return start, start + (length if length >= 0 else length + MINUTES_PER_DAY)
+
+
+def get_deadline_interval(event, start: int=None) -> (int, int) or None:
+    """
+    Get the span of a DEADLINE event on the timeline of "get_attendance_interval", a DEADLINE event
+            is taken to be busy for its duration from its time
+    :param event: a Deadline_Event
+    :param start: if given, the minute of the date and time of the event on the timeline, saving
+            parsing them again
+    :return: (start minute, end minute), None if the event has no duration
+    """
+    if not event.duration:
+        return None
+    if start is None:
+        start = get_day_ordinal(event.date) * MINUTES_PER_DAY + get_minutes(event.time)
+    return start, start + event.duration
+
+
 def get_duration_print_str(duration: int or None) -> str:
     """
     Get a print string that represents a duration
@@ -32,45 +108,742 @@ def get_duration_print_str(duration: int or None) -> str:
             )
 
 
+def get_event_print_str(event_id: int, event) -> str:
+    """
+    Get the print string for a single event, as a line of a Schedule print
+    :param event_id:
+    :param event: (type is a subclass of Event)
+    :return:
+    """
+    if type(event) == Attendance_Event:
+        return event.time + " - " + ("/////" if event.end_time is None else event.end_time) + \
+                " : (" + event.event_type + "): " + str(event_id) + ": " + event.tag + ": " + \
+                event.description
+    elif type(event) == Deadline_Event:
+        return event.time + " (" + get_duration_print_str(event.duration) + "): (" + \
+                event.event_type + "): " + str(event_id) + ": " + event.tag + ": " + \
+                event.description
+    elif type(event) == Recurring_Event:
+        return get_recurrence_print_str(event) + ": " + get_event_print_str(event_id,
+                event.template)
+    else:
+        raise Exception("FAILURE IN get_event_print_str, could not identify event_type of event")
+
+
+def get_recurrence_print_str(event) -> str:
+    """
+    Get a print string that describes the rule of a recurring event
+    :param event: a Recurring_Event
+    :return: like 'every 2 weeks on Mon, Wed from 2021-01-04 Mon until 2021-06-30 Wed, 10 times'
+    """
+    unit = RECURRENCE_UNIT_PRINT_STRS[event.frequency]
+    repr_s = "every " + (unit if event.interval == 1 else str(event.interval) + " " + unit + "s")
+    if event.weekdays:
+        repr_s += " on " + ", ".join(DAY_NAMES_PRINT[weekday] for weekday in event.weekdays)
+    repr_s += " from " + event.template.date
+    if event.until is not None:
+        repr_s += " until " + event.until
+    if event.count is not None:
+        repr_s += ", " + str(event.count) + (" time" if event.count == 1 else " times")
+    return repr_s
+
+
+def get_schedule_print_str(id_event_pairs, empty_message: str="Schedule is empty.") -> str:
+    """
+    Get the print string for a group of events, with the events listed under their dates
+    :param id_event_pairs: iterable of (id, event) in chronological order
+    :param empty_message: message printed in place of events if there are no events
+    :return:
+    """
+    return "".join(iter_schedule_print_chunks(id_event_pairs, empty_message=empty_message))
+
+
+def get_date_print_chunk(id_event_pairs) -> str:
+    """
+    Get the print chunk of the events of a single date, as "iter_schedule_print_chunks" makes
+    :param id_event_pairs: sequence of (id, event) in chronological order, all on the same date
+    :return:
+    """
+    return "\n" + id_event_pairs[0][1].date + ":" + "".join("\n\t\t" +
+            get_event_print_str(event_id, event) for event_id, event in id_event_pairs)
+
+
+def get_head_note_str(head: int) -> str:
+    """
+    :param head: the number of events printed
+    :return: the note ending a print that was cut short after some events
+    """
+    return "\n\t\t... (only the first " + str(head) + " event" + ("" if head == 1 else "s") + \
+            " are shown)"
+
+
+def iter_schedule_print_chunks(id_event_pairs, empty_message: str="Schedule is empty.",
+        head: int=None):
+    """
+    Lazily get the print string of "get_schedule_print_str" a date at a time, so that it can be
+            written out as it is made, only the events printed are read
+    :param id_event_pairs: iterable of (id, event) in chronological order
+    :param empty_message: message printed in place of events if there are no events
+    :param head: if given, only the first this many events are printed, followed by a note if
+            there are more
+    :return: generator of str, the heading and then a chunk per date
+    """
+    yield "SCHEDULE:\n"
+    if head is not None:
+        id_event_pairs = islice(id_event_pairs, head + 1)  # one more to know if there are more
+    event_count = 0
+    current_date = None
+    lines = []  # of the current date
+    for event_id, event in id_event_pairs:
+        event_count += 1
+        if head is not None and event_count > head:
+            yield "".join(lines) + get_head_note_str(head)
+            return
+        if event.date != current_date:
+            if lines:
+                yield "".join(lines)
+                lines = []
+            current_date = event.date
+            lines.append("\n" + current_date + ":")
+        lines.append("\n\t\t" + get_event_print_str(event_id, event))
+    if lines:
+        yield "".join(lines)
+    if current_date is None:
+        yield "\n" + empty_message
+
+
+def get_recurring_print_str(id_event_pairs) -> str:
+    """
+    Get the print string that lists recurring events by their rules, for the end of a Schedule print
+    :param id_event_pairs: iterable of (id, Recurring_Event) in id order
+    :return:
+    """
+    return "\n\nRECURRING:\n" + "".join("\n\t\t" + get_event_print_str(event_id, event) for
+            event_id, event in id_event_pairs)
+
+
+def _iter_gap_slots(gap_start: int, gap_end: int or float, duration: int,
+        window: (int, int) or None):
+    """
+    Lazily get the parts of a free gap that are long enough for a duration, for "iter_free_slots"
+    :param gap_start: minute on the "get_attendance_interval" timeline
+    :param gap_end: minute on the "get_attendance_interval" timeline, may be infinite
+    :param duration: number of minutes
+    :param window: if given, (start minute, end minute) within each day outside of which time is
+            not free
+    :return: generator of (start date, start time, end date or None, end time or None)
+    """
+    if window is None:
+        if gap_end - gap_start >= duration:
+            start_day, start_minutes = divmod(gap_start, MINUTES_PER_DAY)
+            if gap_end == float("inf"):
+                yield get_date_str(start_day), get_time_str(start_minutes), None, None
+            else:
+                end_day, end_minutes = divmod(gap_end, MINUTES_PER_DAY)
+                yield get_date_str(start_day), get_time_str(start_minutes), \
+                        get_date_str(end_day), get_time_str(end_minutes)
+        return
+    day = gap_start // MINUTES_PER_DAY
+    while day * MINUTES_PER_DAY + window[0] < gap_end:
+        slot_start = max(gap_start, day * MINUTES_PER_DAY + window[0])
+        slot_end = min(gap_end, day * MINUTES_PER_DAY + window[1])
+        if slot_end - slot_start >= duration:
+            yield get_date_str(day), get_time_str(slot_start - day * MINUTES_PER_DAY), \
+                    get_date_str(day), get_time_str(slot_end - day * MINUTES_PER_DAY)
+        day += 1
+
+
+def _get_occupancy_print_char(booked_minutes: int) -> str:
+    """
+    Get the heatmap char for an hour, for "get_occupancy_print_str"
+    :param booked_minutes: 0 to 60
+    :return: one of OCCUPANCY_PRINT_CHARS
+    """
+    if booked_minutes == 0:
+        return OCCUPANCY_PRINT_CHARS[0]
+    if booked_minutes == 60:
+        return OCCUPANCY_PRINT_CHARS[-1]
+    return OCCUPANCY_PRINT_CHARS[1 + booked_minutes * 4 // 60]
+
+
 # CLASS
 class Schedule:
 
-    def __init__(self, load_in_events=None):
+    def __init__(self, load_in_events=None, columnar: bool=False, nested: bool=False,
+            history_depth: int=HISTORY_DEPTH_DEFAULT, events=None):
         """
         :param load_in_events: (list) optional input, used to load in events where each event is
                 represented by a string parseable by the Event class
+        :param columnar: if True, events are held in a Columnar_Event_Store, and the event order,
+                locations and secondary indexes in arrays (see Indexes), which takes far less
+                memory for very large schedules but rebuilds an event object on every access and
+                moves arrays up to add events out of order
+        :param nested: if True, the event order is kept in a Nested_Key_Index rather than a
+                Flat_Key_Index, see Benchmarks/Benchmark_Layout.py
+        :param history_depth: the most operations kept to be undone, older ones are forgotten
+        :param events: (list) optional input, used to load in events already parsed into Event
+                subclass instances, such as those read from a binary snapshot, after any
+                load_in_events
         """
-        self.__events = SortedDict()  # {date:{time:{id:event}}}, where the id is a unique number
-                # across the dict always > 0
+        self.__event_keys = Nested_Key_Index() if nested else Array_Key_Index() if columnar else \
+                Flat_Key_Index()  # event ids in chronological order, keyed by (day ordinal,
+                # minutes since midnight, id), where each id is a unique number always > 0, dates
+                # and times are only kept as strings in the events themselves, for rendering
+        self.__event_store = Columnar_Event_Store() if columnar else Object_Event_Store()  # holds
+                # the event of each id
         self.__highest_event_id = 0
+        self.__event_locations = Array_Location_Map() if columnar else {}  # {id:(day ordinal,
+                # minutes)}, giving the key of each event in self.__event_keys so that events can
+                # be found and removed without a full walk
+        self.__key_list_type = Packed_Key_Array if columnar else SortedList  # of the values of
+                # the tag and type indexes
+        self.__tag_index = {}  # {tag:SortedList((day ordinal, minutes, id))}
+        self.__type_index = {}  # {event type:SortedList((day ordinal, minutes, id))}
+        self.__description_index = Array_Token_Index() if columnar else Token_Index()  # tokens
+                # of event descriptions to event ids
+        interval_index_type = Array_Interval_Index if columnar else Interval_Index
+        self.__attendance_intervals = interval_index_type()  # spans of the ATTENDANCE events, see
+                # get_attendance_interval
+        self.__deadline_intervals = interval_index_type()  # spans of the DEADLINE events, see
+                # get_deadline_interval
+        self.__totals = {}  # {(tag or None, event type):(Fenwick_Tree of event count by day
+                # ordinal, Fenwick_Tree of total span length by day ordinal)}, a tag of None covers
+                # the events of all tags
+        self.__day_occupancies = {}  # {day ordinal:bitmap}, bit n of a bitmap is set if minute n of
+                # the day is in the span of any event, days with no set bits are not held
+        self.__recurring_events = {}  # {id:Recurring_Event}, held apart from the other events and
+                # left out of all of the above but the description index, their occurrences are
+                # generated per window for each query instead
+        self.__occurrence_cache = OrderedDict()  # {(start day ordinal, end day ordinal):
+                # [((day ordinal, minutes, id), occurrence), ...]}, least recently used first
+        self.__undo_log = deque(maxlen=history_depth)  # [(ENUM_Operation_Type value, id, event or
+                # {field name:value}), ...] of the adds, deletes and modifications made, latest last,
+                # each holding what is needed to invert it
+        self.__redo_log = []  # the same, of the operations undone since the last new operation
+        self.__print_chunk_cache = {}  # {day ordinal:(print chunk of the day, number of events)},
+                # filled by unfiltered prints and dropped for a day whenever its events change
+        self.__snapshots = WeakSet()  # the Schedule_Snapshots taken and still in use, each is given
+                # the events of a day, or the recurring events, just before they first change
+        self.__unsaved_event_ids = set()  # ids of the events added, deleted or modified since the
+                # last "pop_unsaved_changes"
+        self.__unbacked_up_events = {}  # {id:event as it was, or None if it did not exist} of the
+                # events added, deleted or modified since the last "pop_backup_changes"
 
         if load_in_events is not None:
-            for load_in_event in load_in_events:
-                self._add_event_from_load_in_str(event_str=load_in_event)
+            self.add_many(self._event_from_load_in_str(event_str=load_in_event) for load_in_event
+                    in load_in_events)
+        if events is not None:
+            self.add_many(events)
+        self.__unsaved_event_ids.clear()  # the loaded events are already saved
+        self.__unbacked_up_events.clear()  # and are what any backup taken next is relative to
 
 
     def __repr__(self):
-        repr_s = "SCHEDULE:\n"
-        if bool(self.__events):
-            for date, time_dict in self.__events.items():
-                repr_s += "\n" + date + ":"
-                for time, id_dict in time_dict.items():
-                    for id_, event in id_dict.items():
-                        if type(event) == Attendance_Event:
-                            repr_s += "\n\t\t" + time + " - " + \
-                                    ("/////" if event.end_time is None else event.end_time) + \
-                                    " : (" + event.event_type + "): " + str(id_) + ": " + \
-                                    event.tag + ": " + event.description
-                        elif type(event) == Deadline_Event:
-                            repr_s += "\n\t\t" + time + " (" + \
-                                    get_duration_print_str(event.duration) + "): (" + \
-                                    event.event_type + "): " + str(id_) + ": " + event.tag + \
-                                    ": " + event.description
-                        else:
-                            raise Exception("FAILURE IN SCHEDULE __repr__, could not identify "
-                                    "event_type of event")
+        return self.get_print_str()
+
+
+    def get_print_str(self, tag: str=None, event_type: str=None, start_date: str=None,
+            end_date: str=None) -> str:
+        """
+        Get the print string of the Schedule, optionally only including some events
+        :param tag: if given, only events with this tag are included
+        :param event_type: if given, an ENUM_Event_Type value, only events of this type are
+                included
+        :param start_date: if given, only events on or after this date are included
+        :param end_date: if given, only events on or before this date are included
+        :return:
+        """
+        return "".join(self.iter_print_chunks(tag=tag, event_type=event_type,
+                start_date=start_date, end_date=end_date))
+
+
+    def iter_print_chunks(self, tag: str=None, event_type: str=None, start_date: str=None,
+            end_date: str=None, head: int=None):
+        """
+        Lazily get the print string of "get_print_str" a date at a time, see
+                "iter_schedule_print_chunks"
+        :param tag:
+        :param event_type:
+        :param start_date:
+        :param end_date:
+        :param head: if given, only the first this many events are printed
+        :return: generator of str
+        """
+        if tag is None and event_type is None:
+            id_event_pairs = self.iter_events(start_date=start_date, end_date=end_date)
+            empty_message = "Schedule is empty." if start_date is None and end_date is None else \
+                    "No events in the date range."
+        else:
+            id_event_pairs = self.iter_filtered_events(tag=tag, event_type=event_type,
+                    start_date=start_date, end_date=end_date)
+            empty_message = "No events match the filters."
+
+        # recurring events have their occurrences merged in when the print has an end, otherwise
+        # they are listed by their rules, as they could occur endlessly
+        if self.__recurring_events and end_date is not None:
+            locations = self.__event_locations
+            yield from iter_schedule_print_chunks((id_event_pair for _, id_event_pair in merge(
+                    ((locations[event_id] + (event_id,), (event_id, event)) for event_id, event in
+                        id_event_pairs),
+                    ((key, (key[2], occurrence)) for key, occurrence in
+                        self._get_keyed_occurrences(start_date, end_date) if
+                        (tag is None or occurrence.tag == tag) and
+                        (event_type is None or occurrence.event_type == event_type)),
+                    key=lambda keyed_pair: keyed_pair[0])), empty_message=empty_message, head=head)
+            return
+        if tag is None and event_type is None:
+            yield from self._iter_cached_print_chunks(
+                    start_day=1 if start_date is None else get_day_ordinal(start_date),
+                    end_day=DAY_ORDINAL_MAX if end_date is None else get_day_ordinal(end_date),
+                    empty_message=empty_message, head=head)
+        else:
+            yield from iter_schedule_print_chunks(id_event_pairs, empty_message=empty_message,
+                    head=head)
+        if self.__recurring_events:
+            yield get_recurring_print_str((event_id, event) for event_id, event in
+                    sorted(self.__recurring_events.items()) if
+                    (tag is None or event.template.tag == tag) and
+                    (event_type is None or event.template.event_type == event_type))
+
+
+    def _iter_cached_print_chunks(self, start_day: int, end_day: int, empty_message: str,
+            head: int or None):
+        """
+        Lazily get the print chunks of all of the events in a range of days, as
+                "iter_schedule_print_chunks" makes them, reusing the chunk of each day that has not
+                changed since it was last printed
+        :param start_day: day ordinal
+        :param end_day: day ordinal
+        :param empty_message:
+        :param head:
+        :return: generator of str
+        """
+        yield "SCHEDULE:\n"
+        event_count = 0
+        day = self._get_next_day(start_day)
+        while day is not None and day <= end_day:
+            cached = self.__print_chunk_cache.get(day)
+            if cached is None:
+                id_event_pairs = self._get_day_id_event_pairs(day)
+                cached = self.__print_chunk_cache[day] = (get_date_print_chunk(id_event_pairs),
+                        len(id_event_pairs))
+            chunk, day_event_count = cached
+            if head is not None and event_count + day_event_count > head:  # cut short in the day
+                shown_count = head - event_count
+                yield (get_date_print_chunk(self._get_day_id_event_pairs(day)[:shown_count]) if
+                        shown_count else "") + get_head_note_str(head)
+                return
+            yield chunk
+            event_count += day_event_count
+            day = self._get_next_day(day + 1)
+        if not event_count:
+            yield "\n" + empty_message
+
+
+    def get_occurrences(self, start_date: str=None, end_date: str=None) -> list:
+        """
+        Get the occurrences of the recurring events in a date range
+        :param start_date: if given, only occurrences on or after this date are included
+        :param end_date: only occurrences on or before this date are included
+        :return: [(id of the recurring event, occurrence), ...] in chronological order, the
+                occurrences are shared with a cache so must not be modified
+        """
+        return [(key[2], occurrence) for key, occurrence in
+                self._get_keyed_occurrences(start_date, end_date)]
+
+
+    def _get_keyed_occurrences(self, start_date: str or None, end_date: str) -> list:
+        """
+        Get the occurrences of the recurring events in a date range, generating them only for the
+                range, and keeping the most recently used ranges in a bounded cache
+        :param start_date: if None, from the first occurrence
+        :param end_date:
+        :return: [((day ordinal, minutes, id of the recurring event), occurrence), ...] sorted
+        """
+        window = (1 if start_date is None else get_day_ordinal(start_date),
+                get_day_ordinal(end_date))
+        keyed_occurrences = self.__occurrence_cache.get(window)
+        if keyed_occurrences is not None:
+            self.__occurrence_cache.move_to_end(window)
+            return keyed_occurrences
+
+        keyed_occurrences = self._expand_occurrences(*window)
+        self.__occurrence_cache[window] = keyed_occurrences
+        if len(self.__occurrence_cache) > OCCURRENCE_CACHE_SIZE:
+            self.__occurrence_cache.popitem(last=False)
+        return keyed_occurrences
+
+
+    def _expand_occurrences(self, start_day: int, end_day: int) -> list:
+        """
+        Generate the occurrences of the recurring events in a range of days
+        :param start_day: day ordinal
+        :param end_day: day ordinal
+        :return: [((day ordinal, minutes, id of the recurring event), occurrence), ...] sorted
+        """
+        keyed_occurrences = []
+        for event_id, event in self.__recurring_events.items():
+            minutes = get_minutes(event.template.time)
+            keyed_occurrences.extend(((day, minutes, event_id), occurrence) for day, occurrence in
+                    event.iter_occurrences(start_day, end_day))
+        keyed_occurrences.sort(key=lambda keyed_occurrence: keyed_occurrence[0])
+        return keyed_occurrences
+
+
+    def _iter_keyed_occurrences(self, start_day: int, end_day: int):
+        """
+        Lazily generate the occurrences of the recurring events in a range of days,
+                OCCURRENCE_WINDOW_DAYS days at a time, so that a range without an end is only
+                expanded as far as it is read
+        :param start_day: day ordinal
+        :param end_day: day ordinal, may be DAY_ORDINAL_MAX
+        :return: generator of ((day ordinal, minutes, id of the recurring event), occurrence), sorted
+        """
+        if not self.__recurring_events:
+            return
+        start_day = max(start_day, min(event.get_first_day() for event in
+                self.__recurring_events.values()))
+        end_day = min(end_day, max(event.get_last_day() for event in
+                self.__recurring_events.values()))
+        while start_day <= end_day:
+            window_end_day = min(start_day + OCCURRENCE_WINDOW_DAYS - 1, end_day)
+            yield from self._expand_occurrences(start_day, window_end_day)
+            start_day = window_end_day + 1
+
+
+    def _iter_occurrence_intervals(self, start: int or float, end: int or float,
+            event_type: str=None):
+        """
+        Lazily get the spans of the occurrences of the recurring events that overlap [start, end),
+                as the interval indexes give the spans of the stored events
+        :param start: minute on the "get_attendance_interval" timeline, may be -inf
+        :param end: minute on the "get_attendance_interval" timeline, may be inf
+        :param event_type: if given, an ENUM_Event_Type value, only occurrences of this type are
+                included
+        :return: generator of (start, end, id of the recurring event, occurrence), sorted
+        """
+        longest = 0  # of the spans of the occurrences, each is as long as the span of its template
+        last_day = 0  # of the occurrences with spans, so that recurring events without spans are
+                # not read endlessly
+        for event_id, event in self.__recurring_events.items():
+            if event_type is not None and event.template.event_type != event_type:
+                continue
+            interval = self._get_interval_index_and_interval(event.template,
+                    (event.get_first_day(), get_minutes(event.template.time), event_id))[1]
+            if interval is not None and interval[1] > interval[0]:
+                longest = max(longest, interval[1] - interval[0])
+                last_day = max(last_day, event.get_last_day())
+
+        # the occurrences come in order of their starts, those of a day are sorted by their ends
+        day_intervals = []  # of the occurrences on the day being read
+        day = None
+        for key, occurrence in self._iter_keyed_occurrences(
+                1 if start == float("-inf") else int(start - longest) // MINUTES_PER_DAY,
+                last_day if end == float("inf") else
+                    min(last_day, int(end - 1) // MINUTES_PER_DAY)):
+            if key[0] != day:
+                day_intervals.sort()
+                yield from day_intervals
+                day_intervals = []
+                day = key[0]
+            if event_type is not None and occurrence.event_type != event_type:
+                continue
+            interval = self._get_interval_index_and_interval(occurrence, key)[1]
+            if interval is not None and interval[1] > max(interval[0], start) and interval[0] < end:
+                day_intervals.append(interval + (key[2], occurrence))
+        day_intervals.sort()
+        yield from day_intervals
+
+
+    def _get_interval_id_event_pair(self, interval: tuple) -> tuple:
+        """
+        :param interval: (start, end, id) of a stored event, as the interval indexes hold, or
+                (start, end, id, occurrence) of an occurrence, as "_iter_occurrence_intervals" gives
+        :return: (id, event), where the event of an occurrence is the occurrence
+        """
+        return interval[2], interval[3] if len(interval) > 3 else \
+                self.__event_store.get(interval[2])
+
+
+    def _get_open_end_day(self) -> int:
+        """
+        Get the day up to which the occurrences of the recurring events are read by queries given
+                no end date, as they may occur endlessly
+        :return: day ordinal of the last day of a stored event or of the last occurrence of a
+                recurring event that ends, whichever is later, 0 if there is neither
+        """
+        last_days = [event.get_last_day() for event in self.__recurring_events.values() if
+                event.get_last_day() < DAY_ORDINAL_MAX]
+        for keys in self.__type_index.values():
+            last_days.append(next(keys.islice(len(keys) - 1))[0])
+        return max(last_days, default=0)
+
+
+    def iter_events(self, start_date: str=None, end_date: str=None):
+        """
+        Lazily iterate in chronological order over the events in a date range, only the dates in
+                the range are visited
+        :param start_date: if given, only events on or after this date are yielded
+        :param end_date: if given, only events on or before this date are yielded
+        :return: generator of (id, event)
+        """
+        get_event = self.__event_store.get
+        for event_id in self.__event_keys.iter_ids(
+                start_day=None if start_date is None else get_day_ordinal(start_date),
+                end_day=None if end_date is None else get_day_ordinal(end_date)):
+            yield event_id, get_event(event_id)
+
+
+    def iter_filtered_events(self, tag: str=None, event_type: str=None, start_date: str=None,
+            end_date: str=None):
+        """
+        Iterate in chronological order over the events that have the given tag and or type, only
+                the events matching the more selective of the filters are visited
+        :param tag: if given, only events with this tag are yielded
+        :param event_type: if given, an ENUM_Event_Type value, only events of this type are
+                yielded
+        :param start_date: if given, only events on or after this date are yielded
+        :param end_date: if given, only events on or before this date are yielded
+        :return: generator of (id, event)
+        """
+        if tag is None and event_type is None:  # no filters
+            yield from self.iter_events(start_date=start_date, end_date=end_date)
+            return
+
+        # get the positions of the events in the date range in each index that is filtered on
+        start_key = None if start_date is None else (get_day_ordinal(start_date),)
+        end_key = None if end_date is None else (get_day_ordinal(end_date) + 1,)  # the first key
+                # after the range
+        index_ranges = []  # [(keys, start position, end position), ...]
+        for index, index_value in ((self.__tag_index, tag), (self.__type_index, event_type)):
+            if index_value is not None:
+                keys = index.get(index_value)
+                if keys is None:  # no events match this filter
+                    return
+                index_ranges.append((keys,
+                        0 if start_key is None else keys.bisect_left(start_key),
+                        len(keys) if end_key is None else keys.bisect_left(end_key)))
+
+        # walk the smaller index, the other filter is checked per event
+        keys, start_position, end_position = min(index_ranges,
+                key=lambda index_range: index_range[2] - index_range[1])
+        for _, _, event_id in keys.islice(start_position, end_position):
+            event = self.__event_store.get(event_id)
+            if (tag is None or event.tag == tag) and \
+                    (event_type is None or event.event_type == event_type):
+                yield event_id, event
+
+
+    def search_events(self, query: str, head: int=None) -> list:
+        """
+        Find the events whose descriptions hold, for every term of the query, a word starting with
+                that term, recurring events are found by the description and tag of their template
+        :param query: search terms separated by spaces or punctuation, case insensitive
+        :param head: if given, only the first this many stored events are given, so that a broad
+                query does not read every event it matches
+        :return: [(id, event), ...] of the stored events in chronological order, then of the
+                recurring events in id order
+        """
+        matching_ids = self.__description_index.search(query)
+        recurring_ids = sorted(matching_ids.intersection(self.__recurring_events))
+        stored_ids = matching_ids.difference(recurring_ids)
+        if head is not None and head * len(self.__event_store) < len(stored_ids) ** 2:  # so many
+                # events match that the first ones are found sooner going through the events in
+                # order than by ordering every match
+            stored_ids = list(islice((event_id for event_id in self.__event_keys.iter_ids() if
+                    event_id in stored_ids), head))
         else:
-            repr_s += "\nSchedule is empty."
+            stored_ids = sorted(stored_ids)  # in id order, which the stable ordering by location
+                    # keeps among events at the same time
+            stored_ids = sorted(stored_ids, key=self.__event_locations.__getitem__) if \
+                    head is None else nsmallest(head, stored_ids,
+                    key=self.__event_locations.__getitem__)
+        return [(event_id, self._get_event(event_id)) for event_id in stored_ids + recurring_ids]
+
+
+    def get_attendance_conflicts(self, event_id: int) -> list:
+        """
+        Get the ATTENDANCE events, and occurrences of recurring ATTENDANCE events, whose spans
+                overlap the span of an ATTENDANCE event
+        :param event_id:
+        :return: [(id, event), ...] in chronological order, where an occurrence is given as (id of
+                its recurring event, occurrence), empty if the event does not exist or has no span
+        """
+        event = self._get_event(event_id)
+        if event is None or event.event_type != ENUM_Event_Type.ATND:
+            return []
+        interval = get_attendance_interval(event)
+        if interval is None:
+            return []
+        return [self._get_interval_id_event_pair(conflict) for conflict in
+                merge(self.__attendance_intervals.overlapping(*interval),
+                    self._iter_occurrence_intervals(*interval, event_type=ENUM_Event_Type.ATND))
+                if conflict[2] != event_id]
+
+
+    def get_all_attendance_conflicts(self, start_date: str=None, end_date: str=None) -> list:
+        """
+        Get every pair of ATTENDANCE events, or occurrences of recurring ATTENDANCE events, with
+                overlapping spans, of those whose spans overlap a date range
+        :param start_date: if given, spans ending on or before the start of this date are excluded
+        :param end_date: if given, spans starting after the end of this date are excluded,
+                otherwise occurrences after the day of "_get_open_end_day" are
+        :return: [((id, event), (id, event)), ...], chronological within and across the pairs,
+                where an occurrence is given as (id of its recurring event, occurrence)
+        """
+        start = float("-inf") if start_date is None else \
+                get_day_ordinal(start_date) * MINUTES_PER_DAY
+        end = float("inf") if end_date is None else \
+                (get_day_ordinal(end_date) + 1) * MINUTES_PER_DAY
+        occurrences_end = (self._get_open_end_day() + 1) * MINUTES_PER_DAY if end_date is None \
+                else end
+        return [(self._get_interval_id_event_pair(first), self._get_interval_id_event_pair(second))
+                for first, second in get_overlapping_pairs(merge(
+                    self.__attendance_intervals.overlapping(start, end),
+                    self._iter_occurrence_intervals(start, occurrences_end,
+                        event_type=ENUM_Event_Type.ATND)))]
+
+
+    def iter_free_slots(self, duration: int, start_date: str, start_time: str="00:00",
+            end_date: str=None, between_times: (str, str)=None):
+        """
+        Lazily find, earliest first, the free stretches of time at least as long as a duration,
+                time is busy during the spans of ATTENDANCE and DEADLINE events and of the
+                occurrences of recurring events (see get_attendance_interval and
+                get_deadline_interval)
+        :param duration: positive number of minutes
+        :param start_date: date to start looking from
+        :param start_time: time on the start date to start looking from
+        :param end_date: if given, the last date to look in, otherwise the search is unbounded
+        :param between_times: if given, (earliest time, latest time), only time between these times
+                of each day is counted as free, the latest time must be after the earliest
+        :return: generator of (start date, start time, end date or None, end time or None) for
+                each free stretch, an end of None meaning the stretch has no end
+        """
+        search_start = get_day_ordinal(start_date) * MINUTES_PER_DAY + get_minutes(start_time)
+        search_end = float("inf") if end_date is None else \
+                (get_day_ordinal(end_date) + 1) * MINUTES_PER_DAY
+        window = None if between_times is None else \
+                (get_minutes(between_times[0]), get_minutes(between_times[1]))
+
+        # sweep the busy spans in order of their starts, each gap between them is free
+        free_from = search_start
+        for busy_start, busy_end, *_ in merge(
+                self.__attendance_intervals.iter_overlapping_from(search_start),
+                self.__deadline_intervals.iter_overlapping_from(search_start),
+                self._iter_occurrence_intervals(search_start, search_end)):
+            if busy_start >= search_end:
+                break
+            if busy_start > free_from:
+                yield from _iter_gap_slots(free_from, busy_start, duration, window)
+            free_from = max(free_from, busy_end)
+        if free_from < search_end:
+            yield from _iter_gap_slots(free_from, search_end, duration, window)
+
+
+    def get_totals(self, start_date: str=None, end_date: str=None, tag: str=None) -> dict:
+        """
+        Get the number of events and the total length of their spans, by event type, for the
+                events and occurrences of recurring events in a date range, each counts entirely
+                towards its own date
+        :param start_date: if given, only events on or after this date are counted
+        :param end_date: if given, only events on or before this date are counted, otherwise
+                only occurrences up to the day of "_get_open_end_day" are
+        :param tag: if given, only events with this tag are counted
+        :return: {event type:(number of events, total span length in minutes)}, for every event
+                type
+        """
+        start_day = 1 if start_date is None else get_day_ordinal(start_date)
+        end_day = DAY_ORDINAL_MAX if end_date is None else get_day_ordinal(end_date)
+        totals = {}
+        for event_type in (ENUM_Event_Type.ATND, ENUM_Event_Type.DDLN):
+            trees = self.__totals.get((tag, event_type))
+            totals[event_type] = [0, 0] if trees is None else \
+                    [tree.range_sum(start_day, end_day) for tree in trees]
+        for key, occurrence in self._iter_keyed_occurrences(start_day,
+                self._get_open_end_day() if end_date is None else end_day):
+            if tag is None or occurrence.tag == tag:
+                interval = self._get_interval_index_and_interval(occurrence, key)[1]
+                totals[occurrence.event_type][0] += 1
+                totals[occurrence.event_type][1] += 0 if interval is None else \
+                        interval[1] - interval[0]
+        return {event_type: tuple(total) for event_type, total in totals.items()}
+
+
+    def get_day_occupancy(self, date: str) -> int:
+        """
+        Get the occupancy bitmap of a day
+        :param date:
+        :return: bitmap where bit n is set if minute n of the day is in the span of any event or
+                occurrence of a recurring event
+        """
+        day = get_day_ordinal(date)
+        return self.__day_occupancies.get(day, 0) | \
+                self._get_occurrence_occupancies(day, day).get(day, 0)
+
+
+    def _get_occurrence_occupancies(self, start_day: int, end_day: int) -> dict:
+        """
+        Get the occupancy bitmaps of a range of days from the spans of the occurrences of the
+                recurring events alone, as the held bitmaps only cover the stored events
+        :param start_day: day ordinal
+        :param end_day: day ordinal
+        :return: {day ordinal:bitmap}, days with no set bits are left out
+        """
+        occupancies = {}
+        for start, end, _, _ in self._iter_occurrence_intervals(start_day * MINUTES_PER_DAY,
+                (end_day + 1) * MINUTES_PER_DAY):
+            for day in range(max(start // MINUTES_PER_DAY, start_day),
+                    min((end - 1) // MINUTES_PER_DAY, end_day) + 1):
+                day_start = day * MINUTES_PER_DAY
+                span_start = max(start, day_start) - day_start
+                span_end = min(end, day_start + MINUTES_PER_DAY) - day_start
+                occupancies[day] = occupancies.get(day, 0) | \
+                        (((1 << (span_end - span_start)) - 1) << span_start)
+        return occupancies
+
+
+    def is_time_free(self, date: str, start_time: str, end_time: str) -> bool:
+        """
+        Check whether a stretch of a day is clear of the spans of all events
+        :param date:
+        :param start_time:
+        :param end_time: must be after the start time
+        :return:
+        """
+        start_minutes = get_minutes(start_time)
+        return not (self.get_day_occupancy(date) >> start_minutes) & \
+                ((1 << (get_minutes(end_time) - start_minutes)) - 1)
+
+
+    def get_occupancy_print_str(self, start_date: str, end_date: str) -> str:
+        """
+        Get a heatmap of how booked each hour of each day in a date range is, with the share of
+                each day and of the whole range that is booked
+        :param start_date:
+        :param end_date:
+        :return:
+        """
+        start_day = get_day_ordinal(start_date)
+        end_day = get_day_ordinal(end_date)
+        repr_s = "OCCUPANCY:\n\n" + " " * 15 + "".join(
+                str(hour).center(3) if hour % 3 == 0 else "   " for hour in range(24))
+        total_booked_minutes = 0
+        occurrence_occupancies = self._get_occurrence_occupancies(start_day, end_day)
+        for day in range(start_day, end_day + 1):
+            occupancy = self.__day_occupancies.get(day, 0) | occurrence_occupancies.get(day, 0)
+            booked_minutes = get_booked_minutes(occupancy)
+            total_booked_minutes += booked_minutes
+            repr_s += "\n" + get_date_str(day) + " " + "".join(_get_occupancy_print_char(
+                    get_booked_minutes(occupancy, hour * 60, hour * 60 + 60)).center(3)
+                    for hour in range(24)) + " " + \
+                    str(round(100 * booked_minutes / MINUTES_PER_DAY)).rjust(3) + "%"
+        days = max(end_day - start_day + 1, 0)
+        repr_s += "\n\nBooked: " + (str(round(100 * total_booked_minutes /
+                (days * MINUTES_PER_DAY))) + "%" if days else "-") + " of " + str(days) + \
+                " day" + ("" if days == 1 else "s") + "\n(share of each hour booked: " + ", ".join(
+                char + " " + share for char, share in zip(OCCUPANCY_PRINT_CHARS,
+                ("none", "<1/4", "<1/2", "<3/4", "<all", "all"))) + ")"
         return repr_s
 
 
@@ -108,16 +881,74 @@ class Schedule:
         return self._add_event_instance(new_event), str(new_event)
 
 
-    def _add_event_from_load_in_str(self, event_str: str) -> int:
+    def add_recurring_attendance_event(self, frequency: str, interval: int, weekdays: tuple,
+            until: str or None, count: int or None, date: str, time: str, end_time: str,
+            tag: str, description: str) -> (int, str):
         """
-        Add an event from an event load in string that can be parsed into a subclass of Event
+        Add a recurring event of ATTENDANCE events from args, see Recurring_Event for the rule args
+        :param frequency:
+        :param interval:
+        :param weekdays:
+        :param until:
+        :param count:
+        :param date: the first date an occurrence can be on
+        :param time:
+        :param end_time:
+        :param tag:
+        :param description:
+        :return: First Return Element: the id of the new event
+        Second Return Element: the string representation of the new event
+        """
+        new_event = Recurring_Event(frequency=frequency, interval=interval, weekdays=weekdays,
+                until=until, count=count, template=Attendance_Event(date=date, time=time,
+                    end_time=end_time, tag=tag, description=description))
+        return self._add_event_instance(new_event), str(new_event)
+
+
+    def add_recurring_deadline_event(self, frequency: str, interval: int, weekdays: tuple,
+            until: str or None, count: int or None, date: str, time: str, duration: int,
+            tag: str, description: str) -> (int, str):
+        """
+        Add a recurring event of DEADLINE events from args, see Recurring_Event for the rule args
+        :param frequency:
+        :param interval:
+        :param weekdays:
+        :param until:
+        :param count:
+        :param date: the first date an occurrence can be on
+        :param time:
+        :param duration:
+        :param tag:
+        :param description:
+        :return: First Return Element: the id of the new event
+        Second Return Element: the string representation of the new event
+        """
+        new_event = Recurring_Event(frequency=frequency, interval=interval, weekdays=weekdays,
+                until=until, count=count, template=Deadline_Event(date=date, time=time,
+                    duration=duration, tag=tag, description=description))
+        return self._add_event_instance(new_event), str(new_event)
+
+
+    @staticmethod
+    def _event_from_load_in_str(event_str: str) -> Base_Event:
+        """
+        Parse an event load in string into a subclass of Event
         :param event_str:
-        :return: the id of the new event
+        :return: the event
         """
         event = Base_Event.from_load_in_string(event_str)
         if event is None:
             raise Exception("load in string could not be parsed to any subclass of Event")
-        return self._add_event_instance(event)
+        return event
+
+
+    def _add_event_from_load_in_str(self, event_str: str) -> int:
+        """
+        Add an event from an event load in string that can be parsed into a subclass of Event
+        :param event_str:
+        :return: the id of the new event
+        """
+        return self._add_event_instance(self._event_from_load_in_str(event_str))
 
 
     def _add_event_instance(self, event) -> int:
@@ -126,23 +957,296 @@ class Schedule:
         :param event: (type is a subclass of Event)
         :return: the id of the new event
         """
+        event_id = self.add_many((event,))[0]
+        self._record_operation(ENUM_Operation_Type.ADD, event_id, event)
+        return event_id
+
 
-        # add entries for the date and time of the new event if they do not yet exist
-        if event.date not in self.__events:
-            self.__events[event.date] = SortedDict()
-        if event.time not in self.__events[event.date]:
-            self.__events[event.date][event.time] = SortedDict()
+    def add_many(self, events) -> list:
+        """
+        Add many Event subclass instances to the Schedule at once, far faster than adding them one
+                by one as the indexes are built in bulk. Input in chronological order, as written
+                by "list_of_load_in_strings_for_events", is built in one pass, other input is
+                sorted first
+        :param events: iterable of Event subclass instances, given ids in this order
+        :return: [id, ...] of the new events, in the order given
+        """
+        first_event_id = self.__highest_event_id + 1
+        day_ordinals = {}  # {date:day ordinal}, as dates repeat across many events
+        minutes_by_time = {}  # {time:minutes}, as do times
+        keyed_events = []  # [((day ordinal, minutes, id), event), ...]
+        for event_id, event in enumerate(events, first_event_id):
+            self.__highest_event_id = event_id
+            if event.event_type == ENUM_Event_Type.RCUR:
+                self._hold_recurring_event(event_id, event)
+                continue
+            day = day_ordinals.get(event.date)
+            if day is None:
+                day = day_ordinals[event.date] = get_day_ordinal(event.date)
+            minutes = minutes_by_time.get(event.time)
+            if minutes is None:
+                minutes = minutes_by_time[event.time] = get_minutes(event.time)
+            keyed_events.append(((day, minutes, event_id), event))
+        if keyed_events:
+            self._place_events(keyed_events)
+        return list(range(first_event_id, self.__highest_event_id + 1))
 
-        # get the new id for the new event
-        event_id = self.__highest_event_id + 1
 
-        # add the new event
-        self.__events[event.date][event.time][event_id] = event
+    def _place_event(self, event_id: int, event):
+        """
+        Put an event into the Schedule under the given id, according to its date and time
+        :param event_id: an id not currently held by any event in the Schedule
+        :param event: (type is a subclass of Event)
+        :return: void
+        """
+        self._place_events([((get_day_ordinal(event.date), get_minutes(event.time), event_id),
+                event)])
 
-        # adjust the highest event id
-        self.__highest_event_id = event_id
 
-        return event_id
+    def _place_events(self, keyed_events: list):
+        """
+        Put events into the Schedule under their keys
+        :param keyed_events: [((day ordinal, minutes, id), event), ...], where each id is not
+                currently held by any event in the Schedule, sorted in place by key if not yet
+                sorted
+        :return: void
+        """
+        if any(keyed_events[position][0] > keyed_events[position + 1][0] for position in
+                range(len(keyed_events) - 1)):
+            keyed_events.sort(key=lambda keyed_event: keyed_event[0])
+        self._before_days_change({key[0] for key, _ in keyed_events})
+        self.__event_keys.add_sorted([key for key, _ in keyed_events])
+        for key, event in keyed_events:
+            self.__event_store.add(key[2], event)
+            self.__event_locations[key[2]] = key[:2]
+            self._note_change(key[2], None)
+        self._index_events(keyed_events)
+
+
+    def _unplace_event(self, event_id: int) -> Base_Event or None:
+        """
+        Take an event out of the Schedule, the inverse of "_place_event"
+        :param event_id:
+        :return: the removed event if it existed, otherwise None
+        """
+        location = self.__event_locations.get(event_id)
+        if location is None:  # no such event
+            return None
+        self._before_days_change((location[0],))
+        self.__event_keys.remove(*location, event_id)
+        rtn = self.__event_store.remove(event_id)
+        self._unindex_event(event_id, rtn)
+        del self.__event_locations[event_id]
+        self._note_change(event_id, rtn)
+        return rtn
+
+
+    def _index_event(self, event_id: int, event):
+        """
+        Add an event to the secondary indexes, done whenever an event is placed or modified
+        :param event_id: an id with a location in the Schedule
+        :param event: (type is a subclass of Event)
+        :return: void
+        """
+        self._index_events([(self.__event_locations[event_id] + (event_id,), event)])
+
+
+    def _index_events(self, keyed_events: list):
+        """
+        Add events to the secondary indexes, gathering the entries of each index first so that each
+                is updated once
+        :param keyed_events: [((day ordinal, minutes, id), event), ...] sorted by key
+        :return: void
+        """
+        keys_by_index_value = ({}, {})  # for the tag and type indexes, {value:[key, ...]}
+        intervals_by_index = {self.__attendance_intervals: [], self.__deadline_intervals: []}
+        totals = {}  # {(tag, event type, day ordinal):[count, total span length]}
+        for key, event in keyed_events:
+            keys_by_index_value[0].setdefault(event.tag, []).append(key)
+            keys_by_index_value[1].setdefault(event.event_type, []).append(key)
+            interval_index, interval = self._get_interval_index_and_interval(event, key)
+            totals_entry = totals.setdefault((event.tag, event.event_type, key[0]), [0, 0])
+            totals_entry[0] += 1
+            if interval is not None:
+                intervals_by_index[interval_index].append((key[2],) + interval)
+                self._update_day_occupancies(*interval, added=True)
+                totals_entry[1] += interval[1] - interval[0]
+
+        self.__description_index.add_many((key[2], event.description) for key, event in
+                keyed_events)
+        for index, keys_by_value in zip((self.__tag_index, self.__type_index),
+                keys_by_index_value):
+            for index_value, keys in keys_by_value.items():
+                if index_value not in index:
+                    index[index_value] = self.__key_list_type()
+                index[index_value].update(keys)
+        for interval_index, intervals in intervals_by_index.items():
+            if intervals:
+                interval_index.add_many(intervals)
+        for (tag, event_type, day_ordinal), (count, span_length) in totals.items():
+            self._update_totals(tag, event_type, day_ordinal, count, span_length)
+
+
+    def _unindex_event(self, event_id: int, event):
+        """
+        Remove an event from the secondary indexes, the inverse of "_index_event"
+        :param event_id: an id with a location in the Schedule
+        :param event: (type is a subclass of Event)
+        :return: void
+        """
+        key = self.__event_locations[event_id] + (event_id,)
+        for index, index_value in ((self.__tag_index, event.tag),
+                (self.__type_index, event.event_type)):
+            keys = index[index_value]
+            keys.remove(key)
+            if not keys:
+                del index[index_value]
+        self.__description_index.remove(event_id, event.description)
+        interval_index, interval = self._get_interval_index_and_interval(event, key)
+        if interval is not None:
+            interval_index.remove(event_id, *interval)
+            self._update_day_occupancies(*interval, added=False)
+        self._update_totals(event.tag, event.event_type, key[0], -1,
+                0 if interval is None else interval[0] - interval[1])
+
+
+    def _get_interval_index_and_interval(self, event, key: tuple) -> \
+            (Interval_Index, (int, int) or None):
+        """
+        Get the span of an event and the interval index that holds the spans of its type
+        :param event: (type is a subclass of Event)
+        :param key: (day ordinal, minutes, id) of the event
+        :return: First Return Element: the interval index for the type of the event
+        Second Return Element: the span of the event, None if it has no span
+        """
+        start = key[0] * MINUTES_PER_DAY + key[1]
+        if event.event_type == ENUM_Event_Type.ATND:
+            return self.__attendance_intervals, get_attendance_interval(event, start=start)
+        return self.__deadline_intervals, get_deadline_interval(event, start=start)
+
+
+    def _update_day_occupancies(self, start: int, end: int, added: bool):
+        """
+        Update the occupancy bitmaps of the days touched by a span that was just added to or
+                removed from the interval indexes. Only the bits within the span are changed, on a
+                removal they are rebuilt from the spans overlapping it
+        :param start: minute on the "get_attendance_interval" timeline
+        :param end: minute on the "get_attendance_interval" timeline
+        :param added: True if the span was added, False if it was removed
+        :return: void
+        """
+        for day in range(start // MINUTES_PER_DAY, (end - 1) // MINUTES_PER_DAY + 1):
+            day_start = day * MINUTES_PER_DAY
+            changed_start = max(start, day_start)
+            changed_end = min(end, day_start + MINUTES_PER_DAY)
+            changed_bits = ((1 << (changed_end - changed_start)) - 1) << (changed_start - day_start)
+            occupancy = self.__day_occupancies.get(day, 0)
+            if added:
+                occupancy |= changed_bits
+            else:
+                occupancy &= ~changed_bits
+                for interval_index in (self.__attendance_intervals, self.__deadline_intervals):
+                    for span_start, span_end, _ in interval_index.overlapping(changed_start,
+                            changed_end):
+                        span_start = max(span_start, changed_start) - day_start
+                        span_end = min(span_end, changed_end) - day_start
+                        occupancy |= ((1 << (span_end - span_start)) - 1) << span_start
+            if occupancy:
+                self.__day_occupancies[day] = occupancy
+            else:
+                self.__day_occupancies.pop(day, None)
+
+
+    def _update_totals(self, tag: str, event_type: str, day_ordinal: int, count: int,
+            span_length: int):
+        """
+        Count events of a tag and type on a day in, or out of, the totals
+        :param tag:
+        :param event_type: an ENUM_Event_Type value
+        :param day_ordinal:
+        :param count: the number of events, negative to count them out
+        :param span_length: the total length of their spans, negative to count them out
+        :return: void
+        """
+        for totals_key in ((None, event_type), (tag, event_type)):
+            if totals_key not in self.__totals:
+                self.__totals[totals_key] = (Fenwick_Tree(DAY_ORDINAL_MAX),
+                        Fenwick_Tree(DAY_ORDINAL_MAX))
+            count_tree, span_length_tree = self.__totals[totals_key]
+            count_tree.add(day_ordinal, count)
+            if span_length:
+                span_length_tree.add(day_ordinal, span_length)
+
+
+    def snapshot(self):
+        """
+        Take a frozen view of the events of the Schedule, in constant time. The view shares the
+                containers of the Schedule rather than copying them, and is only given its own copy
+                of the events of a day, or of the recurring events, when the Schedule is about to
+                change them, so later changes to the Schedule never show in the view
+        :return: a Schedule_Snapshot
+        """
+        snapshot = Schedule_Snapshot(self)
+        self.__snapshots.add(snapshot)
+        return snapshot
+
+
+    def _before_days_change(self, day_ordinals):
+        """
+        To be done just before the events of days change. Drops the cached print chunks of the
+                days, and gives each snapshot that does not yet have its own copy of the events of a
+                day a copy
+        :param day_ordinals: collection of day ordinal
+        :return: void
+        """
+        for day in day_ordinals:
+            self.__print_chunk_cache.pop(day, None)
+        if not self.__snapshots:
+            return
+        for day in day_ordinals:
+            id_event_pairs = None
+            for snapshot in self.__snapshots:
+                if not snapshot._has_day(day):
+                    if id_event_pairs is None:
+                        id_event_pairs = self._get_day_id_event_pairs(day)
+                    snapshot._preserve_day(day, id_event_pairs)
+
+
+    def _preserve_recurring_events(self):
+        """
+        Give each snapshot that does not yet have its own copy of the recurring events a copy, to be
+                done just before the recurring events change
+        :return: void
+        """
+        for snapshot in self.__snapshots:
+            if not snapshot._has_recurring_events():
+                snapshot._preserve_recurring_events(dict(self.__recurring_events))
+
+
+    def _get_day_id_event_pairs(self, day_ordinal: int) -> tuple:
+        """
+        :param day_ordinal:
+        :return: ((id, event), ...) of the events on the day, in chronological order
+        """
+        get_event = self.__event_store.get
+        return tuple((event_id, get_event(event_id)) for event_id in
+                self.__event_keys.iter_ids(start_day=day_ordinal, end_day=day_ordinal))
+
+
+    def _get_next_day(self, day_ordinal: int) -> int or None:
+        """
+        :param day_ordinal:
+        :return: the first day on or after the day that has events, None if there is none
+        """
+        event_id = next(self.__event_keys.iter_ids(start_day=day_ordinal), None)
+        return None if event_id is None else self.__event_locations[event_id][0]
+
+
+    def _get_recurring_events(self) -> dict:
+        """
+        :return: {id:Recurring_Event}, the container itself, which must not be changed
+        """
+        return self.__recurring_events
 
 
     def _get_event(self, event_id: int) -> Base_Event or None:
@@ -152,12 +1256,9 @@ class Schedule:
         :param event_id:
         :return: the event if it exists, otherwise None
         """
-        for date, time_dict in self.__events.items():
-            for time, id_dict in time_dict.items():
-                for id_ in id_dict.keys():
-                    if event_id == id_:  # found
-                        return id_dict[event_id]
-        return None
+        if event_id in self.__recurring_events:
+            return self.__recurring_events[event_id]
+        return self.__event_store.get(event_id)
 
 
     def delete_event(self, event_id: int):
@@ -166,29 +1267,321 @@ class Schedule:
         :param event_id:
         :return: "deleted" Event subclass instance if event was deleted, None otherwise
         """
-        for date, time_dict in self.__events.items():
-            for time, id_dict in time_dict.items():
-                for id_ in id_dict.keys():
-                    if event_id == id_:  # if we found the id of the event that we are looking to
-                            # delete
-                        rtn = id_dict[event_id]
-                        del id_dict[event_id]
-
-                        # remove now empty dicts
-                        if not id_dict:
-                            del time_dict[time]
-                            if not time_dict:
-                                del self.__events[date]
-
-                        return rtn
-        return None
+        rtn = self._take_event(event_id)
+        if rtn is not None:
+            self._record_operation(ENUM_Operation_Type.DELETE, event_id, rtn)
+        return rtn
+
+
+    def _take_event(self, event_id: int) -> Base_Event or None:
+        """
+        Take an event of any type out of the Schedule
+        :param event_id:
+        :return: the removed event if it existed, otherwise None
+        """
+        if event_id in self.__recurring_events:
+            return self._drop_recurring_event(event_id)
+        return self._unplace_event(event_id)
+
+
+    def _put_event(self, event_id: int, event):
+        """
+        Put an event of any type back into the Schedule under its old id, the inverse of
+                "_take_event"
+        :param event_id: an id not currently held by any event in the Schedule
+        :param event: (type is a subclass of Event)
+        :return: void
+        """
+        if event.event_type == ENUM_Event_Type.RCUR:
+            self._hold_recurring_event(event_id, event)
+        else:
+            self._place_event(event_id, event)
+
+
+    def _hold_recurring_event(self, event_id: int, event):
+        """
+        Put a recurring event into the Schedule under the given id
+        :param event_id: an id not currently held by any event in the Schedule
+        :param event: a Recurring_Event
+        :return: void
+        """
+        self._preserve_recurring_events()
+        self.__recurring_events[event_id] = event
+        self.__description_index.add(event_id, event.template.description + " " +
+                event.template.tag)
+        self.__occurrence_cache.clear()
+        self._note_change(event_id, None)
+
+
+    def _drop_recurring_event(self, event_id: int) -> Recurring_Event:
+        """
+        Take a recurring event out of the Schedule, the inverse of "_hold_recurring_event"
+        :param event_id: id of a recurring event in the Schedule
+        :return: the removed event
+        """
+        self._preserve_recurring_events()
+        event = self.__recurring_events.pop(event_id)
+        self.__description_index.remove(event_id, event.template.description + " " +
+                event.template.tag)
+        self.__occurrence_cache.clear()
+        self._note_change(event_id, event)
+        return event
+
+
+    def _record_operation(self, operation_type: str, event_id: int, operand):
+        """
+        Add an operation to the undo history, any operations undone before it can no longer be
+                redone
+        :param operation_type: an ENUM_Operation_Type value
+        :param event_id:
+        :param operand: for ADD and DELETE the event, for MODIFY {field name:value before}
+        :return: void
+        """
+        self.__undo_log.append((operation_type, event_id, operand))
+        self.__redo_log.clear()
+
+
+    def _invert_operation(self, operation: tuple) -> tuple:
+        """
+        Apply the inverse of an operation, each kind of which only places, unplaces or modifies a
+                single event and so costs a few sorted container updates
+        :param operation: (ENUM_Operation_Type value, id, event or {field name:value})
+        :return: the operation that inverts the inverse, to be recorded in the other log
+        """
+        operation_type, event_id, operand = operation
+        if operation_type == ENUM_Operation_Type.ADD:
+            return ENUM_Operation_Type.DELETE, event_id, self._take_event(event_id)
+        if operation_type == ENUM_Operation_Type.DELETE:
+            self._put_event(event_id, operand)
+            return ENUM_Operation_Type.ADD, event_id, operand
+        event = self._get_event(event_id)
+        inverse_operand = {field_name: getattr(event, field_name) for field_name in operand}
+        self._modify_event(event_id, operand)
+        return ENUM_Operation_Type.MODIFY, event_id, inverse_operand
+
+
+    def undo(self, count: int=1) -> list:
+        """
+        Undo the latest adds, deletes and modifications, latest first
+        :param count: the most operations undone
+        :return: [(ENUM_Operation_Type value, id), ...] of the operations undone, in the order they
+                were undone, fewer than the count if the history ran out
+        """
+        undone = []
+        while self.__undo_log and len(undone) < count:
+            operation = self.__undo_log.pop()
+            self.__redo_log.append(self._invert_operation(operation))
+            undone.append(operation[:2])
+        return undone
+
+
+    def redo(self, count: int=1) -> list:
+        """
+        Redo the latest undone operations, the reverse of "undo"
+        :param count: the most operations redone
+        :return: [(ENUM_Operation_Type value, id), ...] of the operations redone, in the order they
+                were redone, fewer than the count if there were fewer to redo
+        """
+        redone = []
+        while self.__redo_log and len(redone) < count:
+            self.__undo_log.append(self._invert_operation(self.__redo_log.pop()))
+            redone.append(self.__undo_log[-1][:2])
+        return redone
+
+
+    def clear_history(self):
+        """
+        Forget every operation that could be undone or redone
+        :return: void
+        """
+        self.__undo_log.clear()
+        self.__redo_log.clear()
+
+
+    def archive_events(self, before_date: str) -> list:
+        """
+        Take every event before a date out of the Schedule, so that it can be put in cold storage
+                and the Schedule only holds the active events. The events taken are a prefix of the
+                event order, so each ordered index is cut at a single bisected position rather
+                than having its events removed one by one. Recurring events are kept. The undo
+                history is cleared if any events are taken
+        :param before_date: events on or after this date are kept
+        :return: [load in string, ...] of the taken events, in chronological order
+        """
+        before_day = get_day_ordinal(before_date)
+        keyed_events = [(self.__event_locations[event_id] + (event_id,),
+                self.__event_store.get(event_id)) for event_id in
+                self.__event_keys.iter_ids(end_day=before_day - 1)]
+        if not keyed_events:
+            return []
+        self.clear_history()  # the history may refer to the taken events
+        self._before_days_change({key[0] for key, _ in keyed_events})
+
+        self.__event_keys.remove_before(before_day)
+        for index in (self.__tag_index, self.__type_index):
+            for index_value, keys in list(index.items()):
+                del keys[:keys.bisect_left((before_day,))]
+                if not keys:
+                    del index[index_value]
+
+        # the occupancies of the days before are only from taken events, spans running past them
+        # are cleared from the interval indexes first so the days they run into can be rebuilt
+        before_start = before_day * MINUTES_PER_DAY
+        spans_running_past = []
+        totals = {}  # {(tag, event type, day ordinal):[count, total span length]}
+        for key, event in keyed_events:
+            self.__description_index.remove(key[2], event.description)
+            interval_index, interval = self._get_interval_index_and_interval(event, key)
+            totals_entry = totals.setdefault((event.tag, event.event_type, key[0]), [0, 0])
+            totals_entry[0] -= 1
+            if interval is not None:
+                interval_index.remove(key[2], *interval)
+                totals_entry[1] -= interval[1] - interval[0]
+                if interval[1] > before_start:
+                    spans_running_past.append(interval)
+            self.__event_store.remove(key[2])
+            del self.__event_locations[key[2]]
+            self._note_change(key[2], event)
+        for day in [day for day in self.__day_occupancies if day < before_day]:
+            del self.__day_occupancies[day]
+        for _, end in spans_running_past:
+            self._update_day_occupancies(before_start, end, added=False)
+        for (tag, event_type, day_ordinal), (count, span_length) in totals.items():
+            self._update_totals(tag, event_type, day_ordinal, count, span_length)
+        return [event.to_load_in_string() + '\n' for _, event in keyed_events]
+
+
+    def restore_events(self, load_in_strings) -> list:
+        """
+        Add events back from load in strings, such as those returned by "archive_events", the
+                events are given new ids
+        :param load_in_strings: iterable of load in strings
+        :return: [id, ...] of the restored events, in the order given
+        """
+        return self.add_many(self._event_from_load_in_str(event_str=load_in_string.strip('\n'))
+                for load_in_string in load_in_strings)
+
+
+    def pop_unsaved_changes(self) -> list:
+        """
+        Take the changes made since the last call, or since the Schedule was loaded, so that a save
+                only needs to write the events that changed rather than the whole Schedule
+        :return: [(id, load in string, or None if deleted), ...] sorted by id, of each event added,
+                deleted or modified since, as it is now
+        """
+        changes = []
+        for event_id in sorted(self.__unsaved_event_ids):
+            event = self._get_event(event_id)
+            changes.append((event_id, None if event is None else event.to_load_in_string()))
+        self.__unsaved_event_ids.clear()
+        return changes
+
+
+    def pop_backup_changes(self) -> (list, list):
+        """
+        Take the changes made since the last call, or since the Schedule was loaded, as changes to
+                its load in strings, so that a backup only needs to hold the events that changed
+                rather than the whole Schedule, see Backup.write_changes_backup
+        :return: First Return Element: [load in string, ...] of the events as they were before they
+                were deleted or modified
+        Second Return Element: [load in string, ...] of the events added or modified, as they are
+                now
+        """
+        removed_load_in_strings = []
+        added_load_in_strings = []
+        for event_id, event in self.__unbacked_up_events.items():
+            load_in_string = None if event is None else event.to_load_in_string()
+            current_event = self._get_event(event_id)
+            current_load_in_string = None if current_event is None else \
+                    current_event.to_load_in_string()
+            if load_in_string != current_load_in_string:
+                if load_in_string is not None:
+                    removed_load_in_strings.append(load_in_string)
+                if current_load_in_string is not None:
+                    added_load_in_strings.append(current_load_in_string)
+        self.__unbacked_up_events.clear()
+        return removed_load_in_strings, added_load_in_strings
+
+
+    def _note_change(self, event_id: int, event):
+        """
+        Note that an event has been added, deleted or modified, for the next save and the next
+                backup
+        :param event_id:
+        :param event: the event of the id before the change, None if there was none
+        :return: void
+        """
+        self.__unsaved_event_ids.add(event_id)
+        self.__unbacked_up_events.setdefault(event_id, event)  # only the first change since the
+                # last backup holds the event as it was backed up
+
+
+    def apply_changes(self, changes):
+        """
+        Apply changes as returned by "pop_unsaved_changes", such as ones read back from a journal,
+                each event is put under, or replaces the event of, the id given. The changes are
+                taken as already saved and are not added to the undo history
+        :param changes: iterable of (id, load in string, or None if deleted)
+        :return: void
+        """
+        latest_changes = dict(changes)  # each change replaces the event of its id whole, so only
+                # the latest change of an id counts
+        keyed_events = []  # [((day ordinal, minutes, id), event), ...] of the events put, placed
+                # together as in "add_many"
+        day_ordinals = {}  # {date:day ordinal}, as dates repeat across many events
+        minutes_by_time = {}  # {time:minutes}, as do times
+        for event_id, load_in_string in latest_changes.items():
+            self._take_event(event_id)
+            if load_in_string is None:
+                continue
+            event = self._event_from_load_in_str(load_in_string)
+            if event.event_type == ENUM_Event_Type.RCUR:
+                self._put_event(event_id, event)
+                continue
+            day = day_ordinals.get(event.date)
+            if day is None:
+                day = day_ordinals[event.date] = get_day_ordinal(event.date)
+            minutes = minutes_by_time.get(event.time)
+            if minutes is None:
+                minutes = minutes_by_time[event.time] = get_minutes(event.time)
+            keyed_events.append(((day, minutes, event_id), event))
+        if keyed_events:
+            self._place_events(keyed_events)
+        self.__highest_event_id = max(self.__highest_event_id, max(latest_changes, default=0))  #
+                # deleted ids are not given out again either
+        self.__unsaved_event_ids.clear()
+        self.__unbacked_up_events.clear()
+
+
+    def _modify_event(self, event_id: int, new_field_values: dict) -> Base_Event:
+        """
+        Modify the fields of an existing event, keeping its id. The event is only moved within
+                the Schedule if its date or time changes
+        :param event_id: id of an event that exists in the Schedule
+        :param new_field_values: {field name:new value}
+        :return: the modified event, a new event object
+        """
+        event = self._get_event(event_id)
+        modified_event = event.copy_with(**new_field_values)  # held events are never changed in
+                # place, as snapshots may share them
+        if modified_event.date == event.date and modified_event.time == event.time:  # stays in
+                # place
+            self._before_days_change((self.__event_locations[event_id][0],))
+            self._unindex_event(event_id, event)
+            self.__event_store.replace(event_id, modified_event)
+            self._index_event(event_id, modified_event)
+            self._note_change(event_id, event)
+        else:  # needs to be moved to another date and or time
+            self._unplace_event(event_id)
+            self._place_event(event_id, modified_event)
+        return modified_event
 
 
     def replace_attendance_event(self, replaced_event_id: int, date: str=None, time: str=None,
             set_end_time_to_none: bool=False, end_time: str=None, tag: str=None,
             description: str=None) -> (int, str):
         """
-        Replace an ATTENDANCE event, does not create the new event if the old fails to delete,
+        Modify an ATTENDANCE event in place, the event keeps its id,
                 pass in None for an Event arg to retain current value for that arg
         :param replaced_event_id:
         :param date:
@@ -198,8 +1591,8 @@ class Schedule:
         :param end_time:
         :param tag:
         :param description:
-        :return: First Return Element: -1 if failure, id of new event otherwise
-        Second Return Element: Failure message if deletion failed, otherwise the string
+        :return: First Return Element: -1 if failure, id of the modified event otherwise
+        Second Return Element: Failure message if modification failed, otherwise the string
                 representation of the modified event
         """
 
@@ -210,28 +1603,24 @@ class Schedule:
         if existing_event.event_type != ENUM_Event_Type.ATND:
             return -1, "Event Is Not An ATTENDANCE Event"
 
-        # try to delete event
-        deleted_event_instance = self.delete_event(event_id=replaced_event_id)
-        if deleted_event_instance is None:  # the deletion failed (really though this should only
-                # happen because the event does not exist, which should be determined by the above
-                # checking)
-            return -1, "Deletion Failed"
+        # get the fields to change
+        new_field_values = {field_name: value for field_name, value in
+                (("date", date), ("time", time), ("end_time", end_time), ("tag", tag),
+                ("description", description)) if value is not None}
+        if set_end_time_to_none:
+            new_field_values["end_time"] = None
 
-        # add new event
-        return self.add_attendance_event(
-            date=deleted_event_instance.date if date is None else date,
-            time=deleted_event_instance.time if time is None else time,
-            end_time=None if set_end_time_to_none else
-                (deleted_event_instance.end_time if end_time is None else end_time),
-            tag=deleted_event_instance.tag if tag is None else tag,
-            description=deleted_event_instance.description if description is None else description)
+        self._record_operation(ENUM_Operation_Type.MODIFY, replaced_event_id,
+                {field_name: getattr(existing_event, field_name) for field_name in
+                    new_field_values})
+        return replaced_event_id, str(self._modify_event(replaced_event_id, new_field_values))
 
 
     def replace_deadline_event(self, replaced_event_id: int, date: str=None, time: str=None,
             set_duration_to_none: bool=False, duration: int=None, tag: str=None,
             description: str=None) -> (int, str):
         """
-        Replace a DEADLINE event, does not create the new event if the old fails to delete,
+        Modify a DEADLINE event in place, the event keeps its id,
                 pass in None for an Event arg to retain current value for that arg
         :param replaced_event_id:
         :param date:
@@ -241,8 +1630,8 @@ class Schedule:
         :param duration:
         :param tag:
         :param description:
-        :return: First Return Element: -1 if failure, id of new event otherwise
-        Second Return Element: Failure message if deletion failed, otherwise the string
+        :return: First Return Element: -1 if failure, id of the modified event otherwise
+        Second Return Element: Failure message if modification failed, otherwise the string
                 representation of the modified event
         """
 
@@ -253,21 +1642,17 @@ class Schedule:
         if existing_event.event_type != ENUM_Event_Type.DDLN:
             return -1, "Event Is Not A DEADLINE Event"
 
-        # try to delete event
-        deleted_event_instance = self.delete_event(event_id=replaced_event_id)
-        if deleted_event_instance is None:  # the deletion failed (really though this should only
-                # happen because the event does not exist, which should be determined by the above
-                # checking)
-            return -1, "Deletion Failed"
+        # get the fields to change
+        new_field_values = {field_name: value for field_name, value in
+                (("date", date), ("time", time), ("duration", duration), ("tag", tag),
+                ("description", description)) if value is not None}
+        if set_duration_to_none:
+            new_field_values["duration"] = None
 
-        # add new event
-        return self.add_deadline_event(
-            date=deleted_event_instance.date if date is None else date,
-            time=deleted_event_instance.time if time is None else time,
-            duration=None if set_duration_to_none else
-                (deleted_event_instance.duration if duration is None else duration),
-            tag=deleted_event_instance.tag if tag is None else tag,
-            description=deleted_event_instance.description if description is None else description)
+        self._record_operation(ENUM_Operation_Type.MODIFY, replaced_event_id,
+                {field_name: getattr(existing_event, field_name) for field_name in
+                    new_field_values})
+        return replaced_event_id, str(self._modify_event(replaced_event_id, new_field_values))
 
 
     def list_of_load_in_strings_for_events(self) -> list:
@@ -275,5 +1660,114 @@ class Schedule:
         Get list of load in strings for all events held in the Schedule object
         :return:
         """
-        return [event.to_load_in_string() + '\n' for time_dict in self.__events.values()
-                for id_dict in time_dict.values() for event in id_dict.values()]
+        return [event.to_load_in_string() + '\n' for _, event in self.iter_events()] + \
+                [event.to_load_in_string() + '\n' for _, event in
+                    sorted(self.__recurring_events.items())]
+
+
+
+class Schedule_Snapshot:
+    """
+    A frozen view of the events of a Schedule at the moment it was taken, see Schedule.snapshot.
+            The days the Schedule has not changed since are read from the Schedule itself
+    """
+
+    def __init__(self, schedule: Schedule):
+        """
+        :param schedule: the Schedule viewed, which adds the snapshot to its snapshots
+        """
+        self.__schedule = schedule
+        self.__preserved_days = {}  # {day ordinal:((id, event), ...)}, the events of each day as
+                # they were when the snapshot was taken, for the days that have changed since
+        self.__preserved_day_order = SortedList()  # the day ordinals of self.__preserved_days
+        self.__preserved_recurring_events = None  # {id:Recurring_Event} as they were, once they
+                # have changed
+
+
+    def _has_day(self, day_ordinal: int) -> bool:
+        return day_ordinal in self.__preserved_days
+
+
+    def _preserve_day(self, day_ordinal: int, id_event_pairs: tuple):
+        """
+        :param day_ordinal:
+        :param id_event_pairs: ((id, event), ...) of the events on the day before it changes
+        :return: void
+        """
+        self.__preserved_days[day_ordinal] = id_event_pairs
+        self.__preserved_day_order.add(day_ordinal)
+
+
+    def _has_recurring_events(self) -> bool:
+        return self.__preserved_recurring_events is not None
+
+
+    def _preserve_recurring_events(self, recurring_events: dict):
+        """
+        :param recurring_events: {id:Recurring_Event} before they change, not shared
+        :return: void
+        """
+        self.__preserved_recurring_events = recurring_events
+
+
+    def iter_events(self, start_date: str=None, end_date: str=None):
+        """
+        Lazily iterate in chronological order over the events in a date range, as they were, a day
+                at a time, the Schedule can be changed during the iteration
+        :param start_date: if given, only events on or after this date are yielded
+        :param end_date: if given, only events on or before this date are yielded
+        :return: generator of (id, event)
+        """
+        day = 1 if start_date is None else get_day_ordinal(start_date)
+        end_day = DAY_ORDINAL_MAX if end_date is None else get_day_ordinal(end_date)
+        while day <= end_day:
+            live_day = self.__schedule._get_next_day(day)
+            preserved_day = next(self.__preserved_day_order.irange(minimum=day), None)
+            if live_day is None and preserved_day is None:
+                return
+            day = min(next_day for next_day in (live_day, preserved_day) if next_day is not None)
+            if day > end_day:
+                return
+            id_event_pairs = self.__preserved_days.get(day)
+            yield from self.__schedule._get_day_id_event_pairs(day) if id_event_pairs is None \
+                    else id_event_pairs
+            day += 1
+
+
+    def iter_recurring_events(self):
+        """
+        Iterate over the recurring events, as they were, in id order
+        :return: generator of (id, Recurring_Event)
+        """
+        recurring_events = self.__schedule._get_recurring_events() if \
+                self.__preserved_recurring_events is None else self.__preserved_recurring_events
+        yield from sorted(recurring_events.items())
+
+
+    def get_print_str(self) -> str:
+        """
+        Get the print string of the events, as Schedule.get_print_str with no args gives
+        :return:
+        """
+        return "".join(self.iter_print_chunks())
+
+
+    def iter_print_chunks(self):
+        """
+        Lazily get the print string of "get_print_str" a date at a time
+        :return: generator of str
+        """
+        yield from iter_schedule_print_chunks(self.iter_events())
+        recurring_events = list(self.iter_recurring_events())
+        if recurring_events:
+            yield get_recurring_print_str(recurring_events)
+
+
+    def list_of_load_in_strings_for_events(self) -> list:
+        """
+        Get list of load in strings for all events, as Schedule.list_of_load_in_strings_for_events
+                gives
+        :return:
+        """
+        return [event.to_load_in_string() + '\n' for _, event in self.iter_events()] + \
+                [event.to_load_in_string() + '\n' for _, event in self.iter_recurring_events()]
@@ -0,0 +1,374 @@
+"""
+Classfile
+
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from itertools import chain
+
+import Binary_Snapshot
+import Journal
+import Utility
+from Date_Time import get_day_ordinal, get_minutes
+from Event import ENUM_Event_Type
+from Mapped_Events_File import Mapped_Events_File
+from Schedule import Schedule
+
+
+# ENUMS
+class ENUM_Storage_Backend:
+    TEXT = "TEXT"  # events file of load in strings, with a journal
+    BINARY = "BINARY"  # binary snapshot events file, see Binary_Snapshot, with a journal
+    SQLITE = "SQLITE"  # SQLite database, a row per event
+
+
+# FUNCTIONS
+def _get_row(event_id: int, load_in_string: str) -> tuple:
+    """
+    :param event_id:
+    :param load_in_string:
+    :return: (id, type, day ordinal, minutes, tag, load in string), the row of the event, where
+            a recurring event is placed by its template
+    """
+    fields = load_in_string.split("|", 6)
+    if fields[0] == ENUM_Event_Type.RCUR:
+        fields = fields[6].split("|")
+        return event_id, ENUM_Event_Type.RCUR, get_day_ordinal(fields[1]), get_minutes(fields[2]), \
+                fields[4], load_in_string
+    return event_id, fields[0], get_day_ordinal(fields[1]), get_minutes(fields[2]), fields[4], \
+            load_in_string
+
+
+# ABSTRACT CLASS
+class Base_Storage(ABC):
+    """
+    Where a Schedule is kept between runs. A Schedule is loaded in whole with "load", and the
+            changes made to it since are written with "save"
+    """
+    saves_every_change = False  # if True, "save" is cheap and durable enough to be done after
+            # every change
+    answers_range_queries = False  # if True, "get_schedule" reads only the events asked for from
+            # an index of what is stored, which is always current as every change is saved, so
+            # date range prints are best answered by it even once the Schedule is loaded
+
+    @abstractmethod
+    def get_name(self) -> str:
+        """
+        :return: file name of the storage, for messages
+        """
+        pass
+
+    @abstractmethod
+    def exists(self) -> bool:
+        pass
+
+    @abstractmethod
+    def load(self, history_depth: int) -> Schedule:
+        """
+        :param history_depth: passed to the Schedule
+        :return: the Schedule stored, empty if nothing is stored
+        """
+        pass
+
+    @abstractmethod
+    def save(self, schedule: Schedule):
+        """
+        Write the changes made to a Schedule since it was loaded or last saved
+        :param schedule:
+        :return: void
+        """
+        pass
+
+    @abstractmethod
+    def compact(self, schedule: Schedule):
+        """
+        Write a Schedule in full, replacing what is stored, the ids of the events may change when
+                it is next loaded
+        :param schedule:
+        :return: the Schedule_Snapshot of the Schedule that was written, so that anything else
+                written from it, such as a backup, is of the same view
+        """
+        pass
+
+    @abstractmethod
+    def remove(self):
+        """
+        Remove everything stored
+        :return: void
+        """
+        pass
+
+    def needs_compaction(self) -> bool:
+        """
+        :return: True if what is stored has grown enough that it should be compacted
+        """
+        return False
+
+    def open_ranges(self) -> bool:
+        """
+        Get ready for "get_schedule" to be used before the Schedule is loaded
+        :return: True if it can be used
+        """
+        return False
+
+    @abstractmethod
+    def get_schedule(self, start_date: str=None, end_date: str=None, tag: str=None,
+            event_type: str=None) -> Schedule:
+        """
+        Read only the events of a date range, which must be bounded, under their ids, without
+                loading the whole Schedule, only after "open_ranges" returns True
+        :param start_date: only events on or after this date are read
+        :param end_date: only events on or before this date are read
+        :param tag: if given, other events may be left out
+        :param event_type: if given, other events may be left out
+        :return: a Schedule holding the events, and the recurring events, which prints the same as
+                the whole Schedule within the range
+        """
+        pass
+
+    def close(self):
+        """
+        Release any open files or connections
+        :return: void
+        """
+        pass
+
+
+# DERIVED CLASSES
+
+class Text_Storage(Base_Storage):
+    """
+    An events file, of load in strings or a binary snapshot, written in full only on compaction,
+            with the changes saved since kept in a journal, see Journal
+    """
+
+    def __init__(self, events_file_path: str, journal_file_path: str, index_file_path: str,
+            binary: bool=False, compaction_size: int=1 << 20):
+        """
+        :param events_file_path:
+        :param journal_file_path:
+        :param index_file_path: of the sidecar index of the events file, used by "open_ranges",
+                which is only possible if not binary
+        :param binary: if True, the events file is written as a binary snapshot, either format is
+                read
+        :param compaction_size: bytes the journal reaches before compaction is needed
+        """
+        self.__events_file_path = events_file_path
+        self.__journal_file_path = journal_file_path
+        self.__index_file_path = index_file_path
+        self.__binary = binary
+        self.__compaction_size = compaction_size
+        self.__mapped_events = None  # Mapped_Events_File, while open for "get_schedule"
+        self.__journal_changes = None  # changes in the journal, while open for "get_schedule"
+
+
+    def get_name(self) -> str:
+        return self.__events_file_path
+
+
+    def exists(self) -> bool:
+        return os.path.isfile(self.__events_file_path)
+
+
+    def load(self, history_depth: int) -> Schedule:
+        self.close()  # before the events file can be replaced
+        if not self.exists():
+            return Schedule(history_depth=history_depth)
+        if Binary_Snapshot.is_binary_snapshot(self.__events_file_path):
+            schedule = Schedule(events=Binary_Snapshot.read_events(self.__events_file_path),
+                    history_depth=history_depth)
+        else:
+            schedule = Schedule(load_in_events=Utility.read_in_txt_as_list(
+                    self.__events_file_path), history_depth=history_depth)
+        schedule.apply_changes(Journal.read_changes(self.__journal_file_path,
+                self.__events_file_path))
+        return schedule
+
+
+    def save(self, schedule: Schedule):
+        if not self.exists():  # the journal needs an events file to apply to
+            Journal.compact(self.__journal_file_path, self.__events_file_path,
+                    self._get_contents([]))
+        changes = schedule.pop_unsaved_changes()
+        if changes:
+            Journal.append_changes(self.__journal_file_path, self.__events_file_path, changes)
+
+
+    def compact(self, schedule: Schedule):
+        self.close()
+        snapshot = schedule.snapshot()
+        Journal.compact(self.__journal_file_path, self.__events_file_path, self._get_contents(
+                event for _, event in chain(snapshot.iter_events(),
+                    snapshot.iter_recurring_events())))
+        schedule.pop_unsaved_changes()  # all saved
+        return snapshot
+
+
+    def remove(self):
+        self.close()
+        for file_path in (self.__events_file_path, self.__journal_file_path,
+                self.__index_file_path):
+            if os.path.isfile(file_path):
+                os.remove(file_path)
+
+
+    def needs_compaction(self) -> bool:
+        return Journal.get_journal_size(self.__journal_file_path) >= self.__compaction_size
+
+
+    def open_ranges(self) -> bool:
+        if self.__mapped_events is not None:
+            return True
+        if not self.exists() or Binary_Snapshot.is_binary_snapshot(self.__events_file_path):
+            return False
+        mapped_events = Mapped_Events_File(self.__events_file_path, self.__index_file_path)
+        if not mapped_events.is_in_date_order():  # its dates cannot be read on their own
+            mapped_events.close()
+            return False
+        self.__mapped_events = mapped_events
+        self.__journal_changes = Journal.read_changes(self.__journal_file_path,
+                self.__events_file_path)
+        return True
+
+
+    def get_schedule(self, start_date: str=None, end_date: str=None, tag: str=None,
+            event_type: str=None) -> Schedule:
+        return self.__mapped_events.get_schedule(start_date, end_date, self.__journal_changes)
+
+
+    def close(self):
+        if self.__mapped_events is not None:
+            self.__mapped_events.close()
+            self.__mapped_events = None
+            self.__journal_changes = None
+
+
+    def _get_contents(self, events) -> bytes:
+        """
+        :param events: iterable of Event subclass instances
+        :return: the contents of an events file holding the events, in the format in use
+        """
+        if self.__binary:
+            return Binary_Snapshot.to_bytes(events)
+        return "".join(event.to_load_in_string() + '\n' for event in events).encode("utf-8")
+
+
+class SQLite_Storage(Base_Storage):
+    """
+    An SQLite database holding a row per event under its id, indexed by date and time, by tag and
+            by type, so that date range, tag and type queries are answered by the database. Each
+            save writes only the rows of the changed events, in one transaction
+    """
+    saves_every_change = True
+    answers_range_queries = True
+
+    def __init__(self, database_file_path: str):
+        """
+        :param database_file_path: created when first saved to
+        """
+        self.__database_file_path = database_file_path
+        self.__connection = None  # opened when first needed
+
+
+    def get_name(self) -> str:
+        return self.__database_file_path
+
+
+    def exists(self) -> bool:
+        return os.path.isfile(self.__database_file_path)
+
+
+    def load(self, history_depth: int) -> Schedule:
+        schedule = Schedule(history_depth=history_depth)
+        if self.exists():
+            schedule.apply_changes(self._get_connection().execute(
+                    "SELECT id, load_in_string FROM events ORDER BY day, minutes, id"))
+        return schedule
+
+
+    def save(self, schedule: Schedule):
+        changes = schedule.pop_unsaved_changes()
+        if not changes and self.exists():
+            return
+        with self._get_connection() as connection:  # one transaction
+            connection.executemany("DELETE FROM events WHERE id = ?",
+                    [(event_id,) for event_id, load_in_string in changes if
+                        load_in_string is None])
+            connection.executemany("INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?)",
+                    [_get_row(event_id, load_in_string) for event_id, load_in_string in changes
+                        if load_in_string is not None])
+
+
+    def compact(self, schedule: Schedule):
+        snapshot = schedule.snapshot()
+        with self._get_connection() as connection:  # one transaction
+            connection.execute("DELETE FROM events")
+            connection.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?, ?)",
+                    (_get_row(event_id, event.to_load_in_string()) for event_id, event in
+                        chain(snapshot.iter_events(), snapshot.iter_recurring_events())))
+        schedule.pop_unsaved_changes()  # all saved
+        return snapshot
+
+
+    def remove(self):
+        self.close()
+        if self.exists():
+            os.remove(self.__database_file_path)
+
+
+    def open_ranges(self) -> bool:
+        return self.exists()
+
+
+    def get_schedule(self, start_date: str=None, end_date: str=None, tag: str=None,
+            event_type: str=None) -> Schedule:
+        conditions = ["type != ?"]
+        parameters = [ENUM_Event_Type.RCUR]
+        for column, operator, value in (
+                ("day", ">=", None if start_date is None else get_day_ordinal(start_date)),
+                ("day", "<=", None if end_date is None else get_day_ordinal(end_date)),
+                ("tag", "=", tag), ("type", "=", event_type)):
+            if value is not None:
+                conditions.append(column + " " + operator + " ?")
+                parameters.append(value)
+        connection = self._get_connection()
+        schedule = Schedule()
+        schedule.apply_changes(chain(
+                connection.execute("SELECT id, load_in_string FROM events WHERE " +
+                    " AND ".join(conditions) + " ORDER BY day, minutes, id", parameters),
+                connection.execute("SELECT id, load_in_string FROM events WHERE type = ?",
+                    (ENUM_Event_Type.RCUR,))))
+        return schedule
+
+
+    def close(self):
+        if self.__connection is not None:
+            self.__connection.close()
+            self.__connection = None
+
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        :return: the connection to the database, opened, and the database set up, if not yet
+        """
+        if self.__connection is None:
+            self.__connection = sqlite3.connect(self.__database_file_path)
+            with self.__connection:
+                self.__connection.execute("CREATE TABLE IF NOT EXISTS events (id INTEGER PRIMARY "
+                        "KEY, type TEXT NOT NULL, day INTEGER NOT NULL, minutes INTEGER NOT NULL, "
+                        "tag TEXT NOT NULL, load_in_string TEXT NOT NULL)")
+                self.__connection.execute("CREATE INDEX IF NOT EXISTS events_by_date_and_time ON "
+                        "events (day, minutes)")
+                self.__connection.execute("CREATE INDEX IF NOT EXISTS events_by_tag ON events "
+                        "(tag, day, minutes)")
+                self.__connection.execute("CREATE INDEX IF NOT EXISTS events_by_type ON events "
+                        "(type, day, minutes)")
+        return self.__connection
+
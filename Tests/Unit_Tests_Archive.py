@@ -0,0 +1,78 @@
+"""
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+import os
+import tempfile
+import unittest
+
+import Archive as Module
+
+
+
+# TEST CASES
+class Test_Archive(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.archive_folder = os.path.join(self.temporary_directory.name, "archive")
+
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+
+    def test_write_by_year(self):
+        """
+        Events go to the file of their year, and the folder is created when first written to
+        """
+        self.assertEqual([], Module.get_archived_years(self.archive_folder))
+        self.assertEqual({"2019": 1, "2020": 2}, Module.write_archive(self.archive_folder, [
+                "ATND|2019-12-31 Tue|23:00|01:00|work|shift\n",
+                "DDLN|2020-03-01 Sun|09:00|60|school|essay\n",
+                "ATND|2020-06-01 Mon|10:00|11:00|work|review\n"]))
+        self.assertEqual(["2019", "2020"], Module.get_archived_years(self.archive_folder))
+        self.assertEqual(["DDLN|2020-03-01 Sun|09:00|60|school|essay",
+                "ATND|2020-06-01 Mon|10:00|11:00|work|review"],
+                Module.read_archive(self.archive_folder, "2020"))
+
+
+    def test_write_merges_in_order(self):
+        """
+        Events added to a year already archived are merged in chronologically
+        """
+        Module.write_archive(self.archive_folder, [
+                "DDLN|2020-03-01 Sun|09:00|60|school|essay\n",
+                "ATND|2020-06-01 Mon|10:00|11:00|work|review\n"])
+        Module.write_archive(self.archive_folder, [
+                "ATND|2020-01-15 Wed|12:00||home|lunch\n",
+                "ATND|2020-03-01 Sun|08:00||home|breakfast\n"])
+        self.assertEqual(["ATND|2020-01-15 Wed|12:00||home|lunch",
+                "ATND|2020-03-01 Sun|08:00||home|breakfast",
+                "DDLN|2020-03-01 Sun|09:00|60|school|essay",
+                "ATND|2020-06-01 Mon|10:00|11:00|work|review"],
+                Module.read_archive(self.archive_folder, "2020"))
+
+
+    def test_remove(self):
+        """
+        A removed year reads as empty, removing a year with no file does nothing
+        """
+        Module.write_archive(self.archive_folder, ["ATND|2020-01-15 Wed|12:00||home|lunch\n"])
+        Module.remove_archive(self.archive_folder, "2020")
+        Module.remove_archive(self.archive_folder, "2021")
+        self.assertEqual([], Module.read_archive(self.archive_folder, "2020"))
+        self.assertEqual([], Module.get_archived_years(self.archive_folder))
+
+
+
+
+
+
+# MAIN
+if __name__ == '__main__':
+    unittest.main()
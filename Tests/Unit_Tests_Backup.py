@@ -0,0 +1,193 @@
+"""
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+import os
+import tempfile
+import unittest
+
+import Backup as Module
+
+
+
+# TEST CASES
+class Test_Backup(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.backups_folder = os.path.join(self.temporary_directory.name, "backups")
+        self.load_in_strings = ["ATND|2020-01-15 Wed|12:00||home|lunch\n",
+                "DDLN|2020-03-01 Sun|09:00|60|school|essay\n",
+                "ATND|2020-06-01 Mon|10:00|11:00|work|review\n",
+                "RCUR|DAILY|2|||3|ATND|2021-01-04 Mon|08:00|08:30|gym|run\n"]
+
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+
+    def test_first_backup_is_full(self):
+        """
+        The first backup holds the whole schedule, and the folder is created when first written to
+        """
+        self.assertEqual([], Module.get_backup_file_names(self.backups_folder))
+        file_name = Module.write_backup(self.backups_folder, self.load_in_strings, "WIPE_SCHEDULE")
+        self.assertFalse(Module.is_delta_backup(file_name))
+        self.assertTrue(file_name.endswith(" WIPE_SCHEDULE.txt"))
+        self.assertEqual([file_name], Module.get_backup_file_names(self.backups_folder))
+        self.assertEqual([load_in_string[:-1] for load_in_string in self.load_in_strings],
+                Module.read_backup(self.backups_folder, file_name))
+
+
+    def test_delta_holds_only_changes(self):
+        """
+        A backup after the first holds only the events removed and added since the one before it
+        """
+        full_file_name = Module.write_backup(self.backups_folder, self.load_in_strings)
+        changed_load_in_strings = [self.load_in_strings[0], self.load_in_strings[2],
+                "ATND|2020-06-01 Mon|12:00||home|lunch\n", self.load_in_strings[3]]
+        delta_file_name = Module.write_backup(self.backups_folder, changed_load_in_strings)
+        self.assertTrue(Module.is_delta_backup(delta_file_name))
+        with open(os.path.join(self.backups_folder, delta_file_name)) as delta_file:
+            self.assertEqual([Module.PARENT_PREFIX + full_file_name + "\n",
+                    "-DDLN|2020-03-01 Sun|09:00|60|school|essay\n",
+                    "+ATND|2020-06-01 Mon|12:00||home|lunch\n"], delta_file.readlines())
+
+
+    def test_restore_any_backup(self):
+        """
+        Every backup reads back as the schedule it was taken of, replaying the deltas before it,
+                with added events merged in the order of an events file
+        """
+        states = [self.load_in_strings,
+                self.load_in_strings[1:] + ["RCUR|WEEKLY|1|0,2||4|DDLN|2021-01-04 Mon|12:00||home|"
+                    "plants\n"],
+                ["ATND|2019-12-31 Tue|23:00|01:00|work|shift\n"] + self.load_in_strings[1:],
+                [],
+                self.load_in_strings[:3] + self.load_in_strings[1:]]  # with duplicate events
+        file_names = [Module.write_backup(self.backups_folder, load_in_strings) for
+                load_in_strings in states]
+        self.assertEqual(file_names, Module.get_backup_file_names(self.backups_folder))
+        self.assertEqual(1, sum(not Module.is_delta_backup(file_name) for file_name in file_names))
+        for file_name, load_in_strings in zip(file_names, states[:4]):
+            self.assertEqual([load_in_string[:-1] for load_in_string in load_in_strings],
+                    Module.read_backup(self.backups_folder, file_name))
+        self.assertEqual(sorted(load_in_string[:-1] for load_in_string in states[4]),
+                sorted(Module.read_backup(self.backups_folder, file_names[4])))
+
+
+    def test_full_backup_every(self):
+        """
+        A full backup is written once the given number of deltas follow the latest full backup
+        """
+        file_names = [Module.write_backup(self.backups_folder,
+                self.load_in_strings[:backup_number % 4], full_backup_every=2) for backup_number in
+                range(7)]
+        self.assertEqual([False, True, True, False, True, True, False],
+                [Module.is_delta_backup(file_name) for file_name in file_names])
+        self.assertEqual([load_in_string[:-1] for load_in_string in self.load_in_strings[:1]],
+                Module.read_backup(self.backups_folder, file_names[5]))
+        self.assertFalse(Module.is_delta_backup(Module.write_backup(self.backups_folder,
+                self.load_in_strings, full_backup_every=0)))
+
+
+    def test_older_backups_listed(self):
+        """
+        Full backups named as they were before deltas, label first, are listed in time order and
+                deltas are taken on them
+        """
+        os.mkdir(self.backups_folder)
+        old_file_name = "WIPE_SCHEDULE 2001-02-03 04.05.06.txt"
+        with open(os.path.join(self.backups_folder, old_file_name), 'w') as old_file:
+            old_file.writelines(self.load_in_strings[:2])
+        with open(os.path.join(self.backups_folder, "notes.txt"), 'w') as notes_file:
+            notes_file.write("not a backup\n")
+        file_name = Module.write_backup(self.backups_folder, self.load_in_strings)
+        self.assertEqual([old_file_name, file_name],
+                Module.get_backup_file_names(self.backups_folder))
+        self.assertTrue(Module.is_delta_backup(file_name))
+        self.assertEqual([load_in_string[:-1] for load_in_string in self.load_in_strings],
+                Module.read_backup(self.backups_folder, file_name))
+
+
+    def test_missing_parent(self):
+        """
+        A delta whose backup is gone can not be read
+        """
+        full_file_name = Module.write_backup(self.backups_folder, self.load_in_strings)
+        delta_file_name = Module.write_backup(self.backups_folder, self.load_in_strings[1:])
+        os.remove(os.path.join(self.backups_folder, full_file_name))
+        with self.assertRaises(Exception):
+            Module.read_backup(self.backups_folder, delta_file_name)
+        self.assertFalse(Module.is_backup_readable(self.backups_folder, delta_file_name))
+
+
+    def test_missing_parent_starts_new_chain(self):
+        """
+        A backup taken after a backup its latest depends on is removed is written in full, and can
+                be restored
+        """
+        file_names = [Module.write_backup(self.backups_folder, self.load_in_strings[:length]) for
+                length in (1, 2, 3)]
+        os.remove(os.path.join(self.backups_folder, file_names[0]))
+        Module._latest_backups.clear()  # as in a new session
+        file_name = Module.write_backup(self.backups_folder, self.load_in_strings)
+        self.assertFalse(Module.is_delta_backup(file_name))
+        self.assertTrue(Module.is_backup_readable(self.backups_folder, file_name))
+        self.assertFalse(Module.is_backup_readable(self.backups_folder, file_names[2]))
+        self.assertEqual([load_in_string[:-1] for load_in_string in self.load_in_strings],
+                Module.read_backup(self.backups_folder, file_name))
+        delta_file_name = Module.write_backup(self.backups_folder, self.load_in_strings[1:])
+        self.assertTrue(Module.is_delta_backup(delta_file_name))
+        self.assertEqual([load_in_string[:-1] for load_in_string in self.load_in_strings[1:]],
+                Module.read_backup(self.backups_folder, delta_file_name))
+
+
+
+
+    def test_changes_backup(self):
+        """
+        A backup of only the changes since the latest backup reads back as the schedule changed,
+                and a later backup of the whole schedule is still taken on it correctly
+        """
+        full_file_name = Module.write_backup(self.backups_folder, self.load_in_strings)
+        added_load_in_string = "ATND|2020-02-01 Sat|12:00||home|lunch\n"
+        changes_file_name = Module.write_changes_backup(self.backups_folder, full_file_name,
+                [self.load_in_strings[1]], [added_load_in_string], "SAVE")
+        self.assertTrue(changes_file_name.endswith(" SAVE" + Module.DELTA_FILE_EXTENSION))
+        changed_load_in_strings = [self.load_in_strings[0], added_load_in_string] + \
+                self.load_in_strings[2:]
+        self.assertEqual([load_in_string[:-1] for load_in_string in changed_load_in_strings],
+                Module.read_backup(self.backups_folder, changes_file_name))
+        delta_file_name = Module.write_backup(self.backups_folder, changed_load_in_strings[1:])
+        with open(os.path.join(self.backups_folder, delta_file_name)) as delta_file:
+            self.assertEqual([Module.PARENT_PREFIX + changes_file_name + "\n",
+                    "-" + self.load_in_strings[0]], delta_file.readlines())
+
+
+    def test_changes_backup_not_written(self):
+        """
+        No backup of only the changes is written if they are not of the latest backup, or a full
+                backup is due
+        """
+        self.assertIsNone(Module.write_changes_backup(self.backups_folder, "none.txt", [],
+                self.load_in_strings))
+        full_file_name = Module.write_backup(self.backups_folder, self.load_in_strings)
+        Module.write_backup(self.backups_folder, self.load_in_strings[1:])
+        self.assertIsNone(Module.write_changes_backup(self.backups_folder, full_file_name,
+                self.load_in_strings[:1], []))
+        self.assertIsNone(Module.write_changes_backup(self.backups_folder,
+                Module.get_backup_file_names(self.backups_folder)[-1], self.load_in_strings[1:2],
+                [], full_backup_every=1))
+        self.assertEqual(2, len(Module.get_backup_file_names(self.backups_folder)))
+
+
+
+
+# MAIN
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+import os
+import tempfile
+import unittest
+
+import Binary_Snapshot as Module
+from Event import Base_Event
+from Schedule import Schedule
+
+
+
+# TEST CASES
+class Test_Binary_Snapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.load_in_events = [
+            "ATND|2021-01-05 Tue|09:00|10:00|work|standup",
+            "DDLN|2021-01-05 Tue|09:00|90|school|essay",
+            "ATND|2021-01-06 Wed|13:30||home|plumber, café",
+            "DDLN|2021-01-07 Thu|23:59||school|",
+            "RCUR|WEEKLY|2|0,4|2021-06-30 Wed|10|ATND|2021-01-04 Mon|09:00|09:15|work|sync"]
+        self.events = [Base_Event.from_load_in_string(load_in_event) for load_in_event in
+                self.load_in_events]
+
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+
+    def get_path(self, file_name):
+        return os.path.join(self.temporary_directory.name, file_name)
+
+
+    def test_round_trip(self):
+        """
+        Every field of every event type survives, None fields, empty and non ASCII strings included
+        """
+        self.assertEqual(self.load_in_events, [event.to_load_in_string() for event in
+                Module.from_bytes(Module.to_bytes(self.events))])
+        self.assertEqual([], Module.from_bytes(Module.to_bytes([])))
+
+
+    def test_many_blocks(self):
+        """
+        Events split across blocks are read back in order
+        """
+        block_event_count = Module.BLOCK_EVENT_COUNT
+        Module.BLOCK_EVENT_COUNT = 2
+        try:
+            contents = Module.to_bytes(self.events)
+        finally:
+            Module.BLOCK_EVENT_COUNT = block_event_count
+        self.assertEqual(self.load_in_events, [event.to_load_in_string() for event in
+                Module.from_bytes(contents)])
+
+
+    def test_damage_refused(self):
+        """
+        A changed byte, a cut short file and a file of another version are refused
+        """
+        contents = Module.to_bytes(self.events)
+        damaged = bytearray(contents)
+        damaged[-3] ^= 1
+        for bad_contents in (bytes(damaged), contents[:-1], contents[:8] + b"\x02\x00" +
+                contents[10:], b"ATND|2021-01-05 Tue|09:00|10:00|work|standup\n"):
+            with self.assertRaises(Exception):
+                Module.from_bytes(bad_contents)
+
+
+    def test_convert(self):
+        """
+        Converting to binary and back gives the same events file, and loads the same Schedule
+        """
+        with open(self.get_path("events.txt"), 'w') as text_file:
+            text_file.writelines(load_in_event + "\n" for load_in_event in self.load_in_events)
+        self.assertEqual(5, Module.convert_text_to_binary(self.get_path("events.txt"),
+                self.get_path("events.bin")))
+        self.assertTrue(Module.is_binary_snapshot(self.get_path("events.bin")))
+        self.assertFalse(Module.is_binary_snapshot(self.get_path("events.txt")))
+        self.assertEqual(Schedule(load_in_events=self.load_in_events).get_print_str(),
+                Schedule(events=Module.read_events(self.get_path("events.bin"))).get_print_str())
+        self.assertEqual(5, Module.convert_binary_to_text(self.get_path("events.bin"),
+                self.get_path("converted.txt")))
+        with open(self.get_path("converted.txt"), 'r') as text_file:
+            self.assertEqual([load_in_event + "\n" for load_in_event in self.load_in_events],
+                    text_file.readlines())
+
+
+
+
+
+
+# MAIN
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+import unittest
+
+import Event as Module
+from Date_Time import get_day_ordinal
+
+
+
+# TEST CASES
+class Test_Event_Slots(unittest.TestCase):
+
+    def test_repr(self):
+        """
+        The string representation lists the fields in constructor order, as it did when events
+                held their fields in an instance dict
+        """
+        self.assertEqual("{'date': '2021-01-05 Tue', 'time': '09:00', 'end_time': None, "
+                "'tag': 'work', 'description': 'standup'}", str(Module.Attendance_Event(
+                date="2021-01-05 Tue", time="09:00", end_time=None, tag="work",
+                description="standup")))
+        self.assertEqual("{'date': '2021-01-05 Tue', 'time': '09:00', 'duration': 90, "
+                "'tag': 'school', 'description': 'essay'}", str(Module.Deadline_Event(
+                date="2021-01-05 Tue", time="09:00", duration=90, tag="school",
+                description="essay")))
+
+
+    def test_no_instance_dict(self):
+        """
+        Events only hold their slotted fields
+        """
+        event = Module.Base_Event.from_load_in_string("DDLN|2021-01-05 Tue|09:00|90|school|essay")
+        self.assertFalse(hasattr(event, "__dict__"))
+        with self.assertRaises(AttributeError):
+            event.location = "library"
+
+
+    def test_strings_interned(self):
+        """
+        Loaded events share a single copy of each date, time and tag string
+        """
+        first = Module.Base_Event.from_load_in_string("ATND|2021-01-05 Tue|09:00|10:00|work|a")
+        second = Module.Base_Event.from_load_in_string("ATND|2021-01-05 Tue|09:00|10:00|work|b")
+        self.assertIs(first.date, second.date)
+        self.assertIs(first.time, second.time)
+        self.assertIs(first.end_time, second.end_time)
+        self.assertIs(first.tag, second.tag)
+
+
+    def test_copy_with(self):
+        """
+        A copy takes the given fields and leaves the original unchanged
+        """
+        event = Module.Deadline_Event(date="2021-01-05 Tue", time="09:00", duration=90,
+                tag="school", description="essay")
+        copy = event.copy_with(duration=None, tag="work")
+        self.assertIsInstance(copy, Module.Deadline_Event)
+        self.assertEqual("{'date': '2021-01-05 Tue', 'time': '09:00', 'duration': None, "
+                "'tag': 'work', 'description': 'essay'}", str(copy))
+        self.assertEqual(90, event.duration)
+
+
+
+class Test_Recurring_Event(unittest.TestCase):
+
+    def setUp(self):
+        self.template = Module.Attendance_Event(date="2021-01-04 Mon", time="09:00",
+                end_time="09:15", tag="work", description="standup")
+
+
+    def get_occurrence_dates(self, event, start_date, end_date):
+        return [occurrence.date for _, occurrence in event.iter_occurrences(
+                get_day_ordinal(start_date), get_day_ordinal(end_date))]
+
+
+    def test_daily(self):
+        """
+        Occurrences keep to the interval from the first date, also when starting mid window
+        """
+        event = Module.Recurring_Event(frequency=Module.ENUM_Recurrence_Frequency.DAILY,
+                interval=3, weekdays=(), until=None, count=None, template=self.template)
+        self.assertEqual(["2021-01-07 Thu", "2021-01-10 Sun", "2021-01-13 Wed"],
+                self.get_occurrence_dates(event, "2021-01-06", "2021-01-15"))
+        self.assertEqual([], self.get_occurrence_dates(event, "2020-12-01", "2021-01-03"))
+
+
+    def test_weekly_on_weekdays_with_count(self):
+        """
+        The count is of occurrences from the first date, whatever the window
+        """
+        event = Module.Recurring_Event(frequency=Module.ENUM_Recurrence_Frequency.WEEKLY,
+                interval=1, weekdays=(2, 0), until=None, count=5, template=self.template)
+        self.assertEqual(["2021-01-04 Mon", "2021-01-06 Wed", "2021-01-11 Mon", "2021-01-13 Wed",
+                "2021-01-18 Mon"], self.get_occurrence_dates(event, "2021-01-01", "2021-12-31"))
+        self.assertEqual(["2021-01-13 Wed", "2021-01-18 Mon"],
+                self.get_occurrence_dates(event, "2021-01-12", "2021-12-31"))
+
+
+    def test_every_other_week_until(self):
+        """
+        With no weekdays given the rule occurs on the day of the week of the first date
+        """
+        event = Module.Recurring_Event(frequency=Module.ENUM_Recurrence_Frequency.WEEKLY,
+                interval=2, weekdays=(), until="2021-02-01 Mon", count=None,
+                template=self.template)
+        self.assertEqual(["2021-01-18 Mon", "2021-02-01 Mon"],
+                self.get_occurrence_dates(event, "2021-01-05", "2021-03-01"))
+
+
+    def test_monthly_skips_short_months(self):
+        """
+        Months without the day of the month of the first date have no occurrence
+        """
+        event = Module.Recurring_Event(frequency=Module.ENUM_Recurrence_Frequency.MONTHLY,
+                interval=1, weekdays=(), until=None, count=None, template=Module.Deadline_Event(
+                date="2021-01-31 Sun", time="23:59", duration=None, tag="home",
+                description="rent"))
+        self.assertEqual(["2021-03-31 Wed", "2021-05-31 Mon"],
+                self.get_occurrence_dates(event, "2021-02-01", "2021-06-30"))
+
+
+    def test_far_window(self):
+        """
+        Windows far from the first date are reached without generating the days before them
+        """
+        event = Module.Recurring_Event(frequency=Module.ENUM_Recurrence_Frequency.WEEKLY,
+                interval=1, weekdays=(), until=None, count=None, template=self.template)
+        self.assertEqual(["9999-12-27 Mon"],
+                self.get_occurrence_dates(event, "9999-12-25", "9999-12-31"))
+
+
+    def test_load_in_string(self):
+        """
+        Recurring events survive a round trip through their load in string
+        """
+        event = Module.Recurring_Event(frequency=Module.ENUM_Recurrence_Frequency.WEEKLY,
+                interval=2, weekdays=(0, 4), until="2021-06-30 Wed", count=10,
+                template=self.template)
+        load_in_string = event.to_load_in_string()
+        self.assertEqual("RCUR|WEEKLY|2|0,4|2021-06-30 Wed|10|ATND|2021-01-04 Mon|09:00|09:15|work|"
+                "standup", load_in_string)
+        self.assertEqual(load_in_string,
+                Module.Base_Event.from_load_in_string(load_in_string).to_load_in_string())
+
+
+
+
+
+
+# MAIN
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+import unittest
+
+import Event_Store as Module
+from Event import Attendance_Event, Deadline_Event
+
+
+
+# TEST CASES
+class Test_Columnar_Event_Store(unittest.TestCase):
+
+    def setUp(self):
+        self.store = Module.Columnar_Event_Store()
+        self.store.add(1, Attendance_Event(date="2021-01-05 Tue", time="09:00", end_time="10:30",
+                tag="work", description="standup"))
+        self.store.add(2, Deadline_Event(date="2021-01-06 Wed", time="23:59", duration=None,
+                tag="school", description="essay"))
+        self.store.add(4, Attendance_Event(date="2021-01-07 Thu", time="00:00", end_time=None,
+                tag="work", description="café trip"))
+
+
+    def test_get_rebuilds_events(self):
+        """
+        Events come back with the same fields they were added with, including None fields and
+                non ascii descriptions
+        """
+        event = self.store.get(1)
+        self.assertIsInstance(event, Attendance_Event)
+        self.assertEqual(("2021-01-05 Tue", "09:00", "10:30", "work", "standup"),
+                (event.date, event.time, event.end_time, event.tag, event.description))
+        event = self.store.get(2)
+        self.assertIsInstance(event, Deadline_Event)
+        self.assertEqual(("2021-01-06 Wed", "23:59", None, "school", "essay"),
+                (event.date, event.time, event.duration, event.tag, event.description))
+        event = self.store.get(4)
+        self.assertEqual((None, "café trip"), (event.end_time, event.description))
+
+
+    def test_contains_and_len(self):
+        """
+        Only the added ids are held, the gaps in between are not
+        """
+        self.assertEqual(3, len(self.store))
+        self.assertEqual([False, True, True, False, True, False],
+                [event_id in self.store for event_id in range(6)])
+        self.assertIsNone(self.store.get(3))
+        self.assertIsNone(self.store.get(100))
+
+
+    def test_remove_and_replace(self):
+        """
+        A removed event is returned and no longer held, a replaced event takes the new fields
+        """
+        self.assertEqual("essay", self.store.remove(2).description)
+        self.assertNotIn(2, self.store)
+        self.assertEqual(2, len(self.store))
+        self.store.replace(1, Deadline_Event(date="2021-01-08 Fri", time="12:00", duration=30,
+                tag="home", description="rent"))
+        event = self.store.get(1)
+        self.assertIsInstance(event, Deadline_Event)
+        self.assertEqual(("2021-01-08 Fri", 30, "rent"),
+                (event.date, event.duration, event.description))
+        self.assertEqual("café trip", self.store.get(4).description)
+
+
+    def test_descriptions_survive_compaction(self):
+        """
+        Removing most events compacts the description heap without losing the others
+        """
+        for event_id in range(10, 40):
+            self.store.add(event_id, Deadline_Event(date="2021-02-01 Mon", time="08:00",
+                    duration=5, tag="bulk", description="event " + str(event_id)))
+        for event_id in range(10, 39):
+            self.store.remove(event_id)
+        self.assertEqual("event 39", self.store.get(39).description)
+        self.assertEqual("standup", self.store.get(1).description)
+        self.assertEqual("café trip", self.store.get(4).description)
+
+
+
+
+
+# MAIN
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,309 @@
+"""
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+import unittest
+
+import Indexes as Module
+
+
+
+# TEST CASES
+class Test_Tokenize(unittest.TestCase):
+
+    def test_tokenize(self):
+        self.assertEqual(["call", "re", "dr", "smith", "2nd", "visit"],
+                Module.tokenize("Call re: Dr. Smith (2nd visit)"))
+        self.assertEqual([], Module.tokenize(" -- "))
+
+
+class Test_Token_Index(unittest.TestCase):
+
+    def setUp(self):
+        self.indexes = (Module.Token_Index(), Module.Array_Token_Index())
+        for index in self.indexes:
+            index.add(1, "dentist appointment")
+            index.add(2, "team meeting about the deadline")
+            index.add(3, "meet the dentist again, dentist")
+
+
+    def test_search_single_term(self):
+        for index in self.indexes:
+            self.assertEqual({1, 3}, index.search("dentist"))
+            self.assertEqual(set(), index.search("doctor"))
+
+
+    def test_search_prefix(self):
+        """
+        Terms match any token that they start
+        """
+        for index in self.indexes:
+            self.assertEqual({2, 3}, index.search("meet"))
+            self.assertEqual({1, 2, 3}, index.search("d"))
+
+
+    def test_search_all_terms(self):
+        """
+        Every term must be matched
+        """
+        for index in self.indexes:
+            self.assertEqual({3}, index.search("Meet DENT"))
+            self.assertEqual(set(), index.search("appointment team"))
+            self.assertEqual(set(), index.search(""))
+
+
+    def test_remove(self):
+        """
+        Removed texts are no longer found, and their tokens are dropped when no longer held
+        """
+        for index in self.indexes:
+            index.remove(3, "meet the dentist again, dentist")
+            self.assertEqual({1}, index.search("dentist"))
+            self.assertEqual(set(), index.search("again"))
+            self.assertEqual({2}, index.search("meet"))
+
+
+    def test_add_many(self):
+        """
+        Texts indexed in bulk are found the same as texts indexed one by one, alongside them
+        """
+        for index in self.indexes:
+            index.add_many([(4, "dentist bill"), (5, "bill the team"), (6, "")])
+            self.assertEqual({1, 3, 4}, index.search("dentist"))
+            self.assertEqual({4, 5}, index.search("bill"))
+            self.assertEqual({5}, index.search("bill team"))
+
+
+class Test_Interval_Index(unittest.TestCase):
+
+    def setUp(self):
+        self.indexes = (Module.Interval_Index(), Module.Array_Interval_Index())
+        for index in self.indexes:
+            index.add(1, 0, 10)
+            index.add(2, 5, 15)
+            index.add(3, 15, 20)
+            index.add(4, 100, 400)
+            index.add(5, 30, 30)  # empty
+
+
+    def test_overlapping(self):
+        """
+        Intervals are half open, so touching intervals do not overlap
+        """
+        for index in self.indexes:
+            self.assertEqual([(0, 10, 1), (5, 15, 2)], index.overlapping(8, 12))
+            self.assertEqual([(15, 20, 3)], index.overlapping(15, 16))
+            self.assertEqual([], index.overlapping(20, 100))
+            self.assertEqual([(100, 400, 4)], index.overlapping(300, 301))
+            self.assertEqual([], index.overlapping(9, 9))
+
+
+    def test_add_many(self):
+        """
+        Intervals added in bulk are held the same as intervals added one by one
+        """
+        for index in self.indexes:
+            index.add_many([(6, 1000, 1100), (7, 12, 13), (8, 50, 50)])
+            self.assertEqual(6, len(index))
+            self.assertEqual([(5, 15, 2), (12, 13, 7)], index.overlapping(12, 13))
+            self.assertEqual([(1000, 1100, 6)], index.overlapping(500, 1001))
+
+
+    def test_add_many_merged(self):
+        """
+        Many intervals out of order are merged in, for the array backed index
+        """
+        for index in self.indexes:
+            index.add_many([(key_id, key_id, key_id + 2) for key_id in range(6, 2006)])
+            self.assertEqual(2004, len(index))
+            self.assertEqual([(0, 10, 1), (5, 15, 2), (7, 9, 7), (8, 10, 8), (9, 11, 9)],
+                    index.overlapping(8, 10)[:5])
+            self.assertEqual([(2005, 2007, 2005)], index.overlapping(2006, 3000))
+
+
+    def test_remove(self):
+        for index in self.indexes:
+            index.remove(4, 100, 400)
+            index.remove(5, 30, 30)
+            self.assertEqual([], index.overlapping(300, 301))
+            self.assertEqual(3, len(index))
+
+
+    def test_overlapping_pairs(self):
+        for index in self.indexes:
+            index.add(6, 120, 130)
+            index.add(7, 125, 135)
+            self.assertEqual([((0, 10, 1), (5, 15, 2)),
+                              ((100, 400, 4), (120, 130, 6)),
+                              ((100, 400, 4), (125, 135, 7)),
+                              ((120, 130, 6), (125, 135, 7))],
+                             index.overlapping_pairs(float("-inf"), float("inf")))
+            self.assertEqual([((100, 400, 4), (120, 130, 6)),
+                              ((100, 400, 4), (125, 135, 7)),
+                              ((120, 130, 6), (125, 135, 7))],
+                             index.overlapping_pairs(128, 129))
+
+class Test_Fenwick_Tree(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = Module.Fenwick_Tree(1000)
+        self.tree.add(1, 5)
+        self.tree.add(10, 2)
+        self.tree.add(10, 3)
+        self.tree.add(999, 7)
+        self.tree.add(1000, 1)
+
+
+    def test_sums(self):
+        self.assertEqual(0, self.tree.prefix_sum(0))
+        self.assertEqual(5, self.tree.prefix_sum(9))
+        self.assertEqual(10, self.tree.prefix_sum(10))
+        self.assertEqual(18, self.tree.prefix_sum(1000))
+        self.assertEqual(12, self.tree.range_sum(10, 999))
+        self.assertEqual(0, self.tree.range_sum(11, 998))
+        self.assertEqual(0, self.tree.range_sum(10, 9))
+
+
+    def test_removal(self):
+        """
+        Values added back out leave the sums as if never added
+        """
+        self.tree.add(10, -5)
+        self.tree.add(1000, -1)
+        self.assertEqual(5, self.tree.range_sum(1, 998))
+        self.assertEqual(12, self.tree.prefix_sum(1000))
+
+class Test_Key_Indexes(unittest.TestCase):
+
+    def setUp(self):
+        self.indexes = (Module.Nested_Key_Index(), Module.Flat_Key_Index(),
+                Module.Array_Key_Index())
+        for index in self.indexes:
+            index.add(737800, 540, 3)
+            index.add(737800, 540, 1)
+            index.add(737799, 1439, 2)
+            index.add(737801, 0, 4)
+            index.add(737800, 0, 5)
+
+
+    def test_iter_ids(self):
+        """
+        Ids come out ordered by day, then minutes, then id, with inclusive day bounds
+        """
+        for index in self.indexes:
+            self.assertEqual([2, 5, 1, 3, 4], list(index.iter_ids()))
+            self.assertEqual([5, 1, 3], list(index.iter_ids(start_day=737800, end_day=737800)))
+            self.assertEqual([5, 1, 3, 4], list(index.iter_ids(start_day=737800)))
+            self.assertEqual([2], list(index.iter_ids(end_day=737799)))
+            self.assertEqual([], list(index.iter_ids(start_day=737802)))
+
+
+    def test_remove(self):
+        """
+        Removed ids are no longer iterated over
+        """
+        for index in self.indexes:
+            index.remove(737800, 540, 1)
+            index.remove(737799, 1439, 2)
+            self.assertEqual([5, 3, 4], list(index.iter_ids()))
+
+
+    def test_add_sorted(self):
+        """
+        Ids added in bulk are ordered among those already held
+        """
+        for index in self.indexes:
+            index.add_sorted([(737799, 0, 6), (737800, 540, 0), (737800, 540, 7)])
+            self.assertEqual([6, 2, 5, 0, 1, 3, 7, 4], list(index.iter_ids()))
+
+
+    def test_remove_before(self):
+        """
+        Every id before the day is removed, and only those
+        """
+        for index in self.indexes:
+            index.remove_before(737800)
+            self.assertEqual([5, 1, 3, 4], list(index.iter_ids()))
+            index.remove_before(737802)
+            self.assertEqual([], list(index.iter_ids()))
+
+
+class Test_Packed_Key_Array(unittest.TestCase):
+
+    def setUp(self):
+        self.keys = Module.Packed_Key_Array()
+        self.keys.update([(737800, 540, 3), (737799, 1439, 2), (737801, 0, 4)])
+
+
+    def test_update(self):
+        """
+        Keys are kept sorted whether appended, inserted one at a time or merged in bulk
+        """
+        self.keys.update([(737802, 0, 5)])
+        self.keys.update([(737800, 0, 6)])
+        self.keys.update([(737800, 540, 1), (737799, 0, 7)])
+        self.assertEqual([(737799, 0, 7), (737799, 1439, 2), (737800, 0, 6), (737800, 540, 1),
+                (737800, 540, 3), (737801, 0, 4), (737802, 0, 5)], list(self.keys.islice()))
+        self.assertEqual([6, 1, 3], list(self.keys.islice_ids(2, 5)))
+
+
+    def test_update_merged(self):
+        """
+        Many keys out of order are merged in
+        """
+        self.keys.update([(737800, 0, key_id) for key_id in range(5, 2005)])
+        self.assertEqual(2003, len(self.keys))
+        self.assertEqual([2, 5, 6], list(self.keys.islice_ids(0, 3)))
+        self.assertEqual([2004, 3, 4], list(self.keys.islice_ids(2000)))
+
+
+    def test_bisect_left(self):
+        """
+        Keys shorter than three elements sort before all the keys they start
+        """
+        self.assertEqual(1, self.keys.bisect_left((737800,)))
+        self.assertEqual(1, self.keys.bisect_left((737800, 540)))
+        self.assertEqual(2, self.keys.bisect_left((737800, 540, 4)))
+        self.assertEqual(3, self.keys.bisect_left((737802,)))
+
+
+    def test_remove(self):
+        self.keys.remove((737800, 540, 3))
+        del self.keys[:self.keys.bisect_left((737801,))]
+        self.assertEqual([(737801, 0, 4)], list(self.keys.islice()))
+        with self.assertRaises(ValueError):
+            self.keys.remove((737801, 0, 5))
+
+
+
+class Test_Array_Location_Map(unittest.TestCase):
+
+    def test_as_dict(self):
+        """
+        Locations are set, gotten and deleted by id as in a dict
+        """
+        locations = Module.Array_Location_Map()
+        locations[3] = (737800, 540)
+        locations[1] = (737799, 0)
+        self.assertEqual((737800, 540), locations[3])
+        self.assertTrue(1 in locations)
+        self.assertFalse(2 in locations)
+        self.assertIsNone(locations.get(2))
+        self.assertIsNone(locations.get(100))
+        del locations[3]
+        self.assertIsNone(locations.get(3))
+        with self.assertRaises(KeyError):
+            locations[3]
+
+
+
+
+
+
+# MAIN
+if __name__ == '__main__':
+    unittest.main()
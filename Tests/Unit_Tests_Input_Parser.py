@@ -611,6 +611,60 @@ class Test_Parse(unittest.TestCase):
                          "\ndemanded_input_form: " + str(demanded_input_form))
 
 
+class Test_Parse_Keyword_Args(unittest.TestCase):
+
+    def test_success_no_args(self):
+        self.assertEqual({}, Module.parse_keyword_args([], ["tag", "type"]))
+
+
+    def test_success_any_order(self):
+        self.assertEqual({"tag": "work", "type": "atnd"},
+                Module.parse_keyword_args(["type=atnd", "tag=work"], ["tag", "type"]))
+        self.assertEqual({"tag": "a=b"}, Module.parse_keyword_args(["tag=a=b"], ["tag", "type"]))
+
+
+    def test_failure_not_keyword_form(self):
+        self.assertIsInstance(Module.parse_keyword_args(["work"], ["tag", "type"]), str)
+        self.assertIsInstance(Module.parse_keyword_args(["tag="], ["tag", "type"]), str)
+
+
+    def test_failure_unknown_keyword(self):
+        self.assertIsInstance(Module.parse_keyword_args(["kind=atnd"], ["tag", "type"]), str)
+
+
+    def test_failure_repeated_keyword(self):
+        self.assertIsInstance(Module.parse_keyword_args(["tag=a", "tag=b"], ["tag", "type"]), str)
+
+
+class Test_Parse_Recurrence(unittest.TestCase):
+
+    def test_success(self):
+        self.assertEqual(("DAILY", 1, (), None, None), Module.parse_recurrence({"repeat": "daily"}))
+        self.assertEqual(("WEEKLY", 2, (0, 2, 4), None, 6), Module.parse_recurrence(
+                {"repeat": "weekly", "every": "2", "on": "m,wed,f", "count": "6"}))
+        self.assertEqual(("MONTHLY", 1, (), "2021-06-30 Wed", None), Module.parse_recurrence(
+                {"repeat": "monthly", "until": "2021-06-30"}))
+
+
+    def test_documented_day_names(self):
+        """
+        The examples of the help text for the 'on' arg parse
+        """
+        for on in ("m,w,f", "mon,wed,fri"):
+            self.assertEqual(("WEEKLY", 1, (0, 2, 4), None, None), Module.parse_recurrence(
+                    {"repeat": "weekly", "on": on}))
+
+
+    def test_failure(self):
+        self.assertIsInstance(Module.parse_recurrence({"every": "2"}), str)
+        self.assertIsInstance(Module.parse_recurrence({"repeat": "yearly"}), str)
+        self.assertIsInstance(Module.parse_recurrence({"repeat": "daily", "every": "0"}), str)
+        self.assertIsInstance(Module.parse_recurrence({"repeat": "daily", "on": "m"}), str)
+        self.assertIsInstance(Module.parse_recurrence({"repeat": "weekly", "on": "m,x"}), str)
+        self.assertIsInstance(Module.parse_recurrence({"repeat": "daily", "until": "soon"}), str)
+        self.assertIsInstance(Module.parse_recurrence({"repeat": "daily", "count": "-1"}), str)
+
+
 class Test__Parse_Unsigned_Int(unittest.TestCase):
 
     def test_failure_empty_input(self):
@@ -0,0 +1,99 @@
+"""
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+import os
+import tempfile
+import unittest
+
+import Journal as Module
+
+
+
+# TEST CASES
+class Test_Journal(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.journal_path = os.path.join(self.temporary_directory.name, "events_journal.txt")
+        self.events_path = os.path.join(self.temporary_directory.name, "events.txt")
+        with open(self.events_path, 'w') as events_file:
+            events_file.write("ATND|2021-01-05 Tue|09:00|10:00|work|standup\n")
+        self.changes = [(1, "ATND|2021-01-05 Tue|09:30|10:00|work|standup"), (2, None),
+                (3, "RCUR|DAILY|1|||2|ATND|2021-01-04 Mon|08:00|08:30|gym|run")]
+
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+
+    def test_append_and_read(self):
+        """
+        Changes are read back in the order appended, across appends
+        """
+        self.assertEqual([], Module.read_changes(self.journal_path, self.events_path))
+        Module.append_changes(self.journal_path, self.events_path, self.changes[:2])
+        Module.append_changes(self.journal_path, self.events_path, self.changes[2:])
+        self.assertEqual(self.changes, Module.read_changes(self.journal_path, self.events_path))
+        self.assertLess(0, Module.get_journal_size(self.journal_path))
+
+
+    def test_stale_journal_ignored(self):
+        """
+        A journal is not read onto an events file other than the one it was started for
+        """
+        Module.append_changes(self.journal_path, self.events_path, self.changes)
+        with open(self.events_path, 'a') as events_file:
+            events_file.write("DDLN|2021-01-06 Wed|17:00|30|school|essay\n")
+        self.assertEqual([], Module.read_changes(self.journal_path, self.events_path))
+
+
+    def test_rewritten_events_file_ignored(self):
+        """
+        A journal is not read onto an events file rewritten since it was started, even at the same
+                size
+        """
+        Module.append_changes(self.journal_path, self.events_path, self.changes)
+        modified = os.stat(self.events_path).st_mtime_ns
+        with open(self.events_path, 'w') as events_file:
+            events_file.write("ATND|2021-01-05 Tue|09:00|10:00|work|review!\n")
+        os.utime(self.events_path, ns=(modified + 1000, modified + 1000))
+        self.assertEqual([], Module.read_changes(self.journal_path, self.events_path))
+
+
+    def test_partly_written_record_ignored(self):
+        """
+        A record cut short by an interruption is dropped, the records before it are kept
+        """
+        Module.append_changes(self.journal_path, self.events_path, self.changes[:2])
+        with open(self.journal_path, 'a') as journal_file:
+            journal_file.write("PUT|3|RCUR|DAI")
+        self.assertEqual(self.changes[:2],
+                Module.read_changes(self.journal_path, self.events_path))
+
+
+    def test_compact(self):
+        """
+        Compacting replaces the events file and removes the journal
+        """
+        Module.append_changes(self.journal_path, self.events_path, self.changes)
+        Module.compact(self.journal_path, self.events_path,
+                b"DDLN|2021-01-06 Wed|17:00|30|school|essay\n")
+        with open(self.events_path, 'r') as events_file:
+            self.assertEqual("DDLN|2021-01-06 Wed|17:00|30|school|essay\n", events_file.read())
+        self.assertEqual(0, Module.get_journal_size(self.journal_path))
+        self.assertEqual([], Module.read_changes(self.journal_path, self.events_path))
+        self.assertEqual(["events.txt"], os.listdir(self.temporary_directory.name))
+
+
+
+
+
+
+# MAIN
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+import os
+import tempfile
+import unittest
+
+import Mapped_Events_File as Module
+from Schedule import Schedule
+
+
+
+# TEST CASES
+class Test_Mapped_Events_File(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.events_path = os.path.join(self.temporary_directory.name, "events.txt")
+        self.index_path = os.path.join(self.temporary_directory.name, "events_index.bin")
+        self.load_in_events = [
+            "ATND|2021-01-04 Mon|09:00|10:00|work|standup",
+            "DDLN|2021-01-05 Tue|09:00|90|school|essay",
+            "ATND|2021-01-05 Tue|13:30||home|plumber",
+            "DDLN|2021-01-07 Thu|23:59||school|problem set",
+            "ATND|2021-01-12 Tue|12:00|13:00|home|lunch",
+            "RCUR|DAILY|2|||3|ATND|2021-01-04 Mon|08:00|08:30|gym|run"]
+        self.write_events(self.load_in_events)
+        self.mapped_events = None
+
+
+    def tearDown(self):
+        if self.mapped_events is not None:
+            self.mapped_events.close()
+        self.temporary_directory.cleanup()
+
+
+    def write_events(self, load_in_events):
+        with open(self.events_path, 'w') as events_file:
+            events_file.writelines(load_in_event + "\n" for load_in_event in load_in_events)
+
+
+    def open_mapped_events(self):
+        if self.mapped_events is not None:
+            self.mapped_events.close()
+        self.mapped_events = Module.Mapped_Events_File(self.events_path, self.index_path)
+        return self.mapped_events
+
+
+    def test_same_as_loaded(self):
+        """
+        Ranges read from the file hold the events, under the ids, and print as the whole Schedule
+        """
+        schedule = Schedule(load_in_events=self.load_in_events)
+        mapped_events = self.open_mapped_events()
+        self.assertTrue(mapped_events.is_in_date_order())
+        for start_date, end_date in (("2021-01-05 Tue", "2021-01-07 Thu"),
+                ("2021-01-06 Wed", "2021-01-06 Wed"), (None, "2021-01-05 Tue"),
+                ("2021-01-06 Wed", None), ("2020-01-01 Wed", "2020-12-31 Thu"),
+                ("2021-01-13 Wed", "2021-12-31 Fri"), (None, None)):
+            self.assertEqual([(event_id, event.to_load_in_string()) for event_id, event in
+                    schedule.iter_events(start_date=start_date, end_date=end_date)],
+                    list(mapped_events.iter_load_in_strings(start_date, end_date)))
+            self.assertEqual(schedule.get_print_str(start_date=start_date, end_date=end_date),
+                    mapped_events.get_schedule(start_date, end_date).get_print_str(
+                    start_date=start_date, end_date=end_date))
+        self.assertEqual([(6, self.load_in_events[5])],
+                list(mapped_events.iter_recurring_load_in_strings()))
+
+
+    def test_changes_applied(self):
+        """
+        Changes made since the file was written show in the ranges read
+        """
+        schedule = Schedule(load_in_events=self.load_in_events)
+        schedule.delete_event(2)
+        schedule.replace_attendance_event(5, date="2021-01-06 Wed")
+        schedule.add_deadline_event("2021-01-06 Wed", "17:00", None, "work", "report")
+        self.assertEqual(schedule.get_print_str(start_date="2021-01-05 Tue",
+                end_date="2021-01-07 Thu"), self.open_mapped_events().get_schedule(
+                "2021-01-05 Tue", "2021-01-07 Thu", schedule.pop_unsaved_changes()).get_print_str(
+                start_date="2021-01-05 Tue", end_date="2021-01-07 Thu"))
+
+
+    def test_index_rebuilt_if_stale(self):
+        """
+        The index is kept while it matches the events file and rebuilt once the file changes
+        """
+        self.open_mapped_events().close()
+        self.mapped_events = None
+        with open(self.index_path, 'rb') as index_file:
+            index_contents = index_file.read()
+        self.assertEqual(["ATND|2021-01-04 Mon|09:00|10:00|work|standup"],
+                [load_in_string for _, load_in_string in self.open_mapped_events(
+                    ).iter_load_in_strings("2021-01-04 Mon", "2021-01-04 Mon")])
+        with open(self.index_path, 'rb') as index_file:
+            self.assertEqual(index_contents, index_file.read())
+        self.mapped_events.close()
+        self.mapped_events = None
+        self.write_events(["DDLN|2021-01-03 Sun|09:00||home|rent"] + self.load_in_events)
+        self.assertEqual([(1, "DDLN|2021-01-03 Sun|09:00||home|rent"),
+                (2, "ATND|2021-01-04 Mon|09:00|10:00|work|standup")],
+                list(self.open_mapped_events().iter_load_in_strings(end_date="2021-01-04 Mon")))
+
+
+    def test_not_in_date_order(self):
+        """
+        Files whose dates are not each in one run of lines, before the recurring events, are found
+                out
+        """
+        for load_in_events in (self.load_in_events[1:3] + self.load_in_events[:1],
+                self.load_in_events[:1] + self.load_in_events[5:] + self.load_in_events[1:2]):
+            self.write_events(load_in_events)
+            self.assertFalse(self.open_mapped_events().is_in_date_order())
+            with self.assertRaises(Exception):
+                list(self.mapped_events.iter_load_in_strings())
+
+
+    def test_empty(self):
+        """
+        An empty events file maps to no events
+        """
+        self.write_events([])
+        mapped_events = self.open_mapped_events()
+        self.assertEqual([], list(mapped_events.iter_load_in_strings()))
+        self.assertEqual("SCHEDULE:\n\nSchedule is empty.",
+                mapped_events.get_schedule().get_print_str())
+
+
+
+
+
+
+# MAIN
+if __name__ == '__main__':
+    unittest.main()
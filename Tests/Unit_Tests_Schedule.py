@@ -0,0 +1,1204 @@
+"""
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+import unittest
+from array import array
+from itertools import islice
+
+import Schedule as Module
+from Schedule import ENUM_Operation_Type
+from Event import Base_Event, Attendance_Event, Deadline_Event, ENUM_Event_Type
+
+
+
+# FUNCTIONS
+def get_comparable(result):
+    """
+    :param result: of a Schedule query, holding events in any lists and tuples
+    :return: the result with each event as its load in string, as events rebuilt by a columnar
+            Schedule are new objects
+    """
+    if isinstance(result, Base_Event):
+        return result.to_load_in_string()
+    if isinstance(result, (list, tuple)):
+        return [get_comparable(element) for element in result]
+    return result
+
+
+
+# TEST CASES
+class Test_Schedule_Event_Ids(unittest.TestCase):
+
+    def setUp(self):
+        self.schedule = Module.Schedule(load_in_events=[
+            "ATND|2021-01-05 Tue|09:00|10:00|work|standup",
+            "DDLN|2021-01-05 Tue|09:00|90|school|essay",
+            "ATND|2021-01-06 Wed|13:30||home|plumber",
+            "DDLN|2021-01-07 Thu|23:59||school|problem set"])
+
+
+    def test_get_event_by_id(self):
+        """
+        Every loaded event can be found by its id, ids being given in load order
+        """
+        event = self.schedule._get_event(2)
+        self.assertIsInstance(event, Deadline_Event)
+        self.assertEqual("essay", event.description)
+        event = self.schedule._get_event(3)
+        self.assertIsInstance(event, Attendance_Event)
+        self.assertEqual("plumber", event.description)
+
+
+    def test_get_event_nonexistent_id(self):
+        """
+        Ids that were never given out are not found
+        """
+        self.assertIsNone(self.schedule._get_event(0))
+        self.assertIsNone(self.schedule._get_event(5))
+
+
+    def test_delete_event(self):
+        """
+        A deleted event is returned and can no longer be found, other events are unaffected
+        """
+        deleted_event = self.schedule.delete_event(1)
+        self.assertEqual("standup", deleted_event.description)
+        self.assertIsNone(self.schedule._get_event(1))
+        self.assertIsNone(self.schedule.delete_event(1), "\nAn event was deleted twice")
+        self.assertEqual("essay", self.schedule._get_event(2).description)
+
+
+    def test_delete_event_removes_empty_dates(self):
+        """
+        Deleting the last event of a date removes that date from the schedule
+        """
+        self.schedule.delete_event(3)
+        self.assertNotIn("2021-01-06 Wed", repr(self.schedule))
+        self.assertEqual(3, len(self.schedule.list_of_load_in_strings_for_events()))
+
+
+    def test_ids_not_reused_after_delete(self):
+        """
+        Ids of deleted events are not given to new events
+        """
+        self.schedule.delete_event(4)
+        event_id, _ = self.schedule.add_attendance_event(date="2021-01-08 Fri", time="08:00",
+                end_time=None, tag="work", description="review")
+        self.assertEqual(5, event_id)
+        self.assertEqual("review", self.schedule._get_event(5).description)
+
+
+class Test_Schedule_Modify_Event(unittest.TestCase):
+
+    def setUp(self):
+        self.schedule = Module.Schedule(load_in_events=[
+            "ATND|2021-01-05 Tue|09:00|10:00|work|standup",
+            "DDLN|2021-01-05 Tue|09:00|90|school|essay",
+            "ATND|2021-01-06 Wed|13:30||home|plumber"])
+
+
+    def test_modify_in_place_keeps_id(self):
+        """
+        Modifying fields other than the date and time keeps the id, the event is replaced by a
+                modified copy so that the old one is left unchanged
+        """
+        old_event = self.schedule._get_event(1)
+        output = self.schedule.replace_attendance_event(1, end_time="10:30", tag="team")
+        self.assertEqual(1, output[0])
+        self.assertEqual("10:00", old_event.end_time)
+        event = self.schedule._get_event(1)
+        self.assertEqual("10:30", event.end_time)
+        self.assertEqual("team", event.tag)
+        self.assertEqual("standup", event.description)
+
+
+    def test_modify_date_and_time_moves_event(self):
+        """
+        Modifying the date and time moves the event under the same id
+        """
+        output = self.schedule.replace_deadline_event(2, date="2021-01-07 Thu", time="17:00")
+        self.assertEqual(2, output[0])
+        self.assertEqual(["ATND|2021-01-05 Tue|09:00|10:00|work|standup\n",
+                          "ATND|2021-01-06 Wed|13:30||home|plumber\n",
+                          "DDLN|2021-01-07 Thu|17:00|90|school|essay\n"],
+                         self.schedule.list_of_load_in_strings_for_events())
+        self.assertEqual("17:00", self.schedule._get_event(2).time)
+
+
+    def test_modify_set_to_none(self):
+        """
+        End times and durations can be set to None
+        """
+        self.schedule.replace_attendance_event(1, set_end_time_to_none=True)
+        self.assertIsNone(self.schedule._get_event(1).end_time)
+        self.schedule.replace_deadline_event(2, set_duration_to_none=True)
+        self.assertIsNone(self.schedule._get_event(2).duration)
+
+
+    def test_modify_failures(self):
+        """
+        Nonexistent events and events of the wrong type are not modified
+        """
+        self.assertEqual(-1, self.schedule.replace_attendance_event(4, tag="x")[0])
+        self.assertEqual(-1, self.schedule.replace_attendance_event(2, tag="x")[0])
+        self.assertEqual(-1, self.schedule.replace_deadline_event(1, tag="x")[0])
+        self.assertEqual("school", self.schedule._get_event(2).tag)
+
+class Test_Schedule_Filtered_Events(unittest.TestCase):
+
+    def setUp(self):
+        self.schedule = Module.Schedule(load_in_events=[
+            "DDLN|2021-01-07 Thu|23:59||school|problem set",
+            "ATND|2021-01-05 Tue|09:00|10:00|work|standup",
+            "DDLN|2021-01-05 Tue|09:00|90|school|essay",
+            "ATND|2021-01-06 Wed|13:30||school|lecture"])
+
+
+    def test_filter_by_tag(self):
+        """
+        Events with a tag are given in chronological order
+        """
+        self.assertEqual([3, 4, 1], [event_id for event_id, _ in
+                self.schedule.iter_filtered_events(tag="school")])
+        self.assertEqual([], list(self.schedule.iter_filtered_events(tag="home")))
+
+
+    def test_filter_by_type_and_tag(self):
+        """
+        Both filters apply together
+        """
+        self.assertEqual([2, 4], [event_id for event_id, _ in
+                self.schedule.iter_filtered_events(event_type=ENUM_Event_Type.ATND)])
+        self.assertEqual([4], [event_id for event_id, _ in self.schedule.iter_filtered_events(
+                tag="school", event_type=ENUM_Event_Type.ATND)])
+
+
+    def test_filters_follow_modification_and_deletion(self):
+        """
+        The filters reflect modified tags, dates and deleted events
+        """
+        self.schedule.replace_attendance_event(2, tag="school")
+        self.schedule.replace_deadline_event(1, date="2021-01-04 Mon")
+        self.schedule.delete_event(4)
+        self.assertEqual([1, 2, 3], [event_id for event_id, _ in
+                self.schedule.iter_filtered_events(tag="school")])
+        self.assertEqual([], list(self.schedule.iter_filtered_events(tag="work")))
+
+
+    def test_filtered_print(self):
+        """
+        The filtered print only includes the matching events
+        """
+        print_str = self.schedule.get_print_str(tag="work")
+        self.assertIn("standup", print_str)
+        self.assertNotIn("essay", print_str)
+        self.assertNotIn("2021-01-06 Wed", print_str)
+        self.assertIn("No events match the filters.", self.schedule.get_print_str(tag="home"))
+
+class Test_Schedule_Search_Events(unittest.TestCase):
+
+    def setUp(self):
+        self.schedule = Module.Schedule(load_in_events=[
+            "DDLN|2021-01-07 Thu|23:59||school|history essay draft",
+            "ATND|2021-01-05 Tue|09:00|10:00|work|standup",
+            "DDLN|2021-01-05 Tue|09:00|90|school|essay outline"])
+
+
+    def test_search_chronological(self):
+        """
+        Matching events are given in chronological order
+        """
+        self.assertEqual([3, 1], [event_id for event_id, _ in
+                self.schedule.search_events("essay")])
+        self.assertEqual([1], [event_id for event_id, _ in
+                self.schedule.search_events("ess hist")])
+
+
+    def test_search_follows_modification_and_deletion(self):
+        """
+        The search reflects modified descriptions and deleted events
+        """
+        self.schedule.replace_deadline_event(3, description="reading")
+        self.assertEqual([1], [event_id for event_id, _ in self.schedule.search_events("essay")])
+        self.assertEqual([3], [event_id for event_id, _ in self.schedule.search_events("read")])
+        self.schedule.delete_event(1)
+        self.assertEqual([], self.schedule.search_events("essay"))
+
+
+    def test_search_head(self):
+        """
+        Only the first matching events are given when a head is given, in the same order, whether
+                few or most of the events match
+        """
+        for _ in range(6):
+            self.schedule.add_attendance_event("2021-01-04 Mon", "09:00", None, "work", "standup")
+        self.assertEqual([3], [event_id for event_id, _ in
+                self.schedule.search_events("essay", head=1)])
+        self.assertEqual([4, 5, 6], [event_id for event_id, _ in
+                self.schedule.search_events("standup", head=3)])
+        self.assertEqual([event_id for event_id, _ in self.schedule.search_events("standup")],
+                [event_id for event_id, _ in self.schedule.search_events("standup", head=10)])
+
+
+
+class Test_Schedule_Date_Range(unittest.TestCase):
+
+    def setUp(self):
+        self.schedule = Module.Schedule(load_in_events=[
+            "DDLN|2021-01-07 Thu|23:59||school|problem set",
+            "ATND|2021-01-05 Tue|09:00|10:00|work|standup",
+            "DDLN|2021-01-05 Tue|09:00|90|school|essay",
+            "ATND|2021-01-06 Wed|13:30||school|lecture",
+            "ATND|2021-01-09 Sat|10:00||home|market"])
+
+
+    def test_iter_events_range(self):
+        """
+        Date bounds are inclusive and either may be left out
+        """
+        self.assertEqual([2, 3, 4, 1, 5], [event_id for event_id, _ in self.schedule.iter_events()])
+        self.assertEqual([4, 1], [event_id for event_id, _ in
+                self.schedule.iter_events(start_date="2021-01-06 Wed", end_date="2021-01-07 Thu")])
+        self.assertEqual([1, 5], [event_id for event_id, _ in
+                self.schedule.iter_events(start_date="2021-01-07 Thu")])
+        self.assertEqual([2, 3], [event_id for event_id, _ in
+                self.schedule.iter_events(end_date="2021-01-05 Tue")])
+        self.assertEqual([], list(self.schedule.iter_events(start_date="2021-01-08 Fri",
+                end_date="2021-01-08 Fri")))
+
+
+    def test_range_bounds_compare_by_day(self):
+        """
+        Bounds are compared as days, so the day name part of a bound does not matter
+        """
+        self.assertEqual([4, 1], [event_id for event_id, _ in
+                self.schedule.iter_events(start_date="2021-01-06", end_date="2021-01-07")])
+        self.assertEqual([1], [event_id for event_id, _ in self.schedule.iter_filtered_events(
+                tag="school", start_date="2021-01-07", end_date="2021-01-07")])
+
+
+    def test_iter_filtered_events_range(self):
+        """
+        Date bounds apply together with the filters
+        """
+        self.assertEqual([3, 4], [event_id for event_id, _ in self.schedule.iter_filtered_events(
+                tag="school", end_date="2021-01-06 Wed")])
+        self.assertEqual([4], [event_id for event_id, _ in self.schedule.iter_filtered_events(
+                tag="school", event_type=ENUM_Event_Type.ATND, start_date="2021-01-06 Wed",
+                end_date="2021-01-09 Sat")])
+
+
+    def test_print_range(self):
+        """
+        The print only includes the dates in the range
+        """
+        print_str = self.schedule.get_print_str(start_date="2021-01-06 Wed",
+                end_date="2021-01-07 Thu")
+        self.assertNotIn("2021-01-05 Tue", print_str)
+        self.assertIn("2021-01-06 Wed", print_str)
+        self.assertIn("2021-01-07 Thu", print_str)
+        self.assertNotIn("2021-01-09 Sat", print_str)
+
+class Test_Schedule_Attendance_Conflicts(unittest.TestCase):
+
+    def setUp(self):
+        self.schedule = Module.Schedule(load_in_events=[
+            "ATND|2021-01-05 Tue|09:00|10:00|work|standup",
+            "ATND|2021-01-05 Tue|09:30|11:00|work|review",
+            "DDLN|2021-01-05 Tue|09:45|90|school|essay",
+            "ATND|2021-01-05 Tue|10:00||work|no end time",
+            "ATND|2021-01-05 Tue|23:00|01:00|home|party",
+            "ATND|2021-01-06 Wed|00:30|02:00|home|movie",
+            "ATND|2021-01-06 Wed|10:00|11:00|work|demo"])
+
+
+    def test_get_attendance_conflicts(self):
+        """
+        Only ATTENDANCE events with end times conflict, spans can run past midnight
+        """
+        self.assertEqual([2], [event_id for event_id, _ in
+                self.schedule.get_attendance_conflicts(1)])
+        self.assertEqual([6], [event_id for event_id, _ in
+                self.schedule.get_attendance_conflicts(5)])
+        self.assertEqual([], self.schedule.get_attendance_conflicts(3))
+        self.assertEqual([], self.schedule.get_attendance_conflicts(4))
+        self.assertEqual([], self.schedule.get_attendance_conflicts(7))
+
+
+    def test_conflicts_follow_modification(self):
+        """
+        Modified spans are checked against
+        """
+        self.schedule.replace_attendance_event(7, date="2021-01-05 Tue", time="10:30")
+        self.assertEqual([2], [event_id for event_id, _ in
+                self.schedule.get_attendance_conflicts(7)])
+        self.schedule.replace_attendance_event(2, set_end_time_to_none=True)
+        self.assertEqual([], self.schedule.get_attendance_conflicts(7))
+
+
+    def test_get_all_attendance_conflicts(self):
+        """
+        Pairs are found among the spans overlapping the date range, including spans running into it
+        """
+        self.assertEqual([(1, 2), (5, 6)], [(first[0], second[0]) for first, second in
+                self.schedule.get_all_attendance_conflicts()])
+        self.assertEqual([(5, 6)], [(first[0], second[0]) for first, second in
+                self.schedule.get_all_attendance_conflicts(start_date="2021-01-06 Wed")])
+        self.assertEqual([(1, 2)], [(first[0], second[0]) for first, second in
+                self.schedule.get_all_attendance_conflicts(end_date="2021-01-05 Tue")])
+
+class Test_Schedule_Free_Slots(unittest.TestCase):
+
+    def setUp(self):
+        self.schedule = Module.Schedule(load_in_events=[
+            "ATND|2021-01-05 Tue|09:00|10:00|work|standup",
+            "ATND|2021-01-05 Tue|09:30|11:00|work|review",
+            "DDLN|2021-01-05 Tue|13:00|60|school|essay",
+            "DDLN|2021-01-05 Tue|15:00||school|no duration",
+            "ATND|2021-01-05 Tue|16:00||work|no end time",
+            "ATND|2021-01-05 Tue|22:00|08:00|home|sleep"])
+
+
+    def test_free_slots(self):
+        """
+        Gaps between the spans of events are free, events without spans take no time
+        """
+        self.assertEqual([("2021-01-05 Tue", "00:00", "2021-01-05 Tue", "09:00"),
+                          ("2021-01-05 Tue", "11:00", "2021-01-05 Tue", "13:00"),
+                          ("2021-01-05 Tue", "14:00", "2021-01-05 Tue", "22:00"),
+                          ("2021-01-06 Wed", "08:00", None, None)],
+                         list(self.schedule.iter_free_slots(60, "2021-01-05 Tue")))
+
+
+    def test_free_slots_duration_and_bounds(self):
+        """
+        Gaps shorter than the duration are skipped, the search starts and ends at the bounds
+        """
+        self.assertEqual([("2021-01-05 Tue", "14:00", "2021-01-05 Tue", "22:00"),
+                          ("2021-01-06 Wed", "08:00", "2021-01-07 Thu", "00:00")],
+                         list(self.schedule.iter_free_slots(150, "2021-01-05 Tue",
+                            start_time="09:45", end_date="2021-01-06 Wed")))
+
+
+    def test_free_slots_between_times(self):
+        """
+        Only the time between the given times of each day is free, the search can pass the last
+                event
+        """
+        free_slots = self.schedule.iter_free_slots(120, "2021-01-05 Tue",
+                between_times=("07:00", "17:00"))
+        self.assertEqual([("2021-01-05 Tue", "07:00", "2021-01-05 Tue", "09:00"),
+                          ("2021-01-05 Tue", "11:00", "2021-01-05 Tue", "13:00"),
+                          ("2021-01-05 Tue", "14:00", "2021-01-05 Tue", "17:00"),
+                          ("2021-01-06 Wed", "08:00", "2021-01-06 Wed", "17:00"),
+                          ("2021-01-07 Thu", "07:00", "2021-01-07 Thu", "17:00")],
+                         [next(free_slots) for _ in range(5)])
+
+class Test_Schedule_Occupancy(unittest.TestCase):
+
+    def setUp(self):
+        self.schedule = Module.Schedule(load_in_events=[
+            "ATND|2021-01-05 Tue|09:00|10:00|work|standup",
+            "ATND|2021-01-05 Tue|09:30|11:00|work|review",
+            "DDLN|2021-01-05 Tue|13:00|30|school|essay",
+            "ATND|2021-01-05 Tue|23:00|01:00|home|party"])
+
+
+    def test_day_occupancy(self):
+        """
+        Overlapping spans are merged, spans past midnight mark the next day
+        """
+        self.assertEqual(120 + 30 + 60, Module.get_booked_minutes(
+                self.schedule.get_day_occupancy("2021-01-05 Tue")))
+        self.assertEqual(60, Module.get_booked_minutes(
+                self.schedule.get_day_occupancy("2021-01-06 Wed")))
+        self.assertEqual(0, self.schedule.get_day_occupancy("2021-01-04 Mon"))
+        self.assertEqual(75, Module.get_booked_minutes(
+                self.schedule.get_day_occupancy("2021-01-05 Tue"), 8 * 60 + 30, 10 * 60 + 15))
+
+
+    def test_occupancy_follows_deletion_and_modification(self):
+        """
+        Only the minutes of the removed span that no other span covers are freed
+        """
+        self.schedule.delete_event(1)
+        self.assertFalse(self.schedule.is_time_free("2021-01-05 Tue", "09:30", "09:31"))
+        self.assertTrue(self.schedule.is_time_free("2021-01-05 Tue", "09:00", "09:30"))
+        self.schedule.replace_attendance_event(4, date="2021-01-07 Thu")
+        self.assertEqual(0, self.schedule.get_day_occupancy("2021-01-06 Wed"))
+        self.assertEqual(60, Module.get_booked_minutes(
+                self.schedule.get_day_occupancy("2021-01-08 Fri")))
+
+
+    def test_is_time_free(self):
+        self.assertTrue(self.schedule.is_time_free("2021-01-05 Tue", "11:00", "13:00"))
+        self.assertFalse(self.schedule.is_time_free("2021-01-05 Tue", "10:59", "13:00"))
+        self.assertFalse(self.schedule.is_time_free("2021-01-05 Tue", "11:00", "13:01"))
+        self.assertTrue(self.schedule.is_time_free("2021-01-06 Wed", "01:00", "23:59"))
+
+
+    def test_occupancy_print(self):
+        print_str = self.schedule.get_occupancy_print_str("2021-01-05 Tue", "2021-01-06 Wed")
+        self.assertIn("2021-01-05 Tue  .  .  .  .  .  .  .  .  .  #  #  .  .  +", print_str)
+        self.assertIn("Booked: 9% of 2 days", print_str)
+
+class Test_Schedule_Totals(unittest.TestCase):
+
+    def setUp(self):
+        self.schedule = Module.Schedule(load_in_events=[
+            "ATND|2021-01-05 Tue|09:00|10:00|work|standup",
+            "ATND|2021-01-05 Tue|22:00|01:30|home|party",
+            "ATND|2021-01-06 Wed|13:30||work|lunch",
+            "DDLN|2021-01-06 Wed|17:00|90|school|essay",
+            "DDLN|2021-01-08 Fri|17:00||work|report"])
+
+
+    def test_totals(self):
+        """
+        Events count towards their own date, with the length of their spans
+        """
+        self.assertEqual({ENUM_Event_Type.ATND: (3, 60 + 210), ENUM_Event_Type.DDLN: (2, 90)},
+                self.schedule.get_totals())
+        self.assertEqual({ENUM_Event_Type.ATND: (1, 0), ENUM_Event_Type.DDLN: (1, 90)},
+                self.schedule.get_totals(start_date="2021-01-06 Wed", end_date="2021-01-07 Thu"))
+        self.assertEqual({ENUM_Event_Type.ATND: (2, 60), ENUM_Event_Type.DDLN: (1, 0)},
+                self.schedule.get_totals(tag="work"))
+        self.assertEqual({ENUM_Event_Type.ATND: (0, 0), ENUM_Event_Type.DDLN: (0, 0)},
+                self.schedule.get_totals(tag="gym"))
+
+
+    def test_totals_follow_modification_and_deletion(self):
+        self.schedule.replace_attendance_event(1, end_time="11:00", tag="team")
+        self.schedule.replace_deadline_event(4, date="2021-01-08 Fri")
+        self.schedule.delete_event(2)
+        self.assertEqual({ENUM_Event_Type.ATND: (1, 0), ENUM_Event_Type.DDLN: (1, 0)},
+                self.schedule.get_totals(tag="work"))
+        self.assertEqual({ENUM_Event_Type.ATND: (0, 0), ENUM_Event_Type.DDLN: (2, 90)},
+                self.schedule.get_totals(start_date="2021-01-07 Thu"))
+        self.assertEqual({ENUM_Event_Type.ATND: (2, 120), ENUM_Event_Type.DDLN: (2, 90)},
+                self.schedule.get_totals())
+
+
+class Test_Schedule_Add_Many(unittest.TestCase):
+
+    def setUp(self):
+        self.load_in_events = [
+            "DDLN|2021-01-07 Thu|23:59||school|problem set",
+            "ATND|2021-01-05 Tue|09:00|10:00|work|standup",
+            "DDLN|2021-01-05 Tue|09:00|90|school|essay",
+            "ATND|2021-01-06 Wed|13:30|15:00|work|review essay"]
+        self.schedule = Module.Schedule()
+        for load_in_event in self.load_in_events:
+            self.schedule._add_event_from_load_in_str(load_in_event)
+
+
+    def test_same_as_adding_one_by_one(self):
+        """
+        Unsorted input is given ids in input order, and every index matches adding one by one
+        """
+        schedule = Module.Schedule()
+        self.assertEqual([1, 2, 3, 4], schedule.add_many(
+                Base_Event.from_load_in_string(load_in_event) for load_in_event in
+                self.load_in_events))
+        for each_schedule in (self.schedule, schedule):
+            each_schedule.delete_event(3)
+        self.assertEqual(self.schedule.get_print_str(), schedule.get_print_str())
+        self.assertEqual(self.schedule.get_print_str(tag="work"),
+                schedule.get_print_str(tag="work"))
+        self.assertEqual(self.schedule.search_events("essay")[0][0],
+                schedule.search_events("essay")[0][0])
+        self.assertEqual(self.schedule.get_totals(), schedule.get_totals())
+        self.assertEqual(self.schedule.get_day_occupancy("2021-01-06 Wed"),
+                schedule.get_day_occupancy("2021-01-06 Wed"))
+
+
+    def test_add_to_existing_events(self):
+        """
+        Events added in bulk are placed among the events already held, under new ids
+        """
+        event_ids = self.schedule.add_many([
+            Attendance_Event(date="2021-01-06 Wed", time="08:00", end_time="09:00", tag="gym",
+                    description="run"),
+            Deadline_Event(date="2021-01-04 Mon", time="12:00", duration=None, tag="home",
+                    description="rent")])
+        self.assertEqual([5, 6], event_ids)
+        self.assertEqual([6, 2, 3, 5, 4, 1], [event_id for event_id, _ in
+                self.schedule.iter_events()])
+        self.assertEqual([], self.schedule.add_many([]))
+        event_id, _ = self.schedule.add_deadline_event(date="2021-01-08 Fri", time="08:00",
+                duration=None, tag="home", description="bins")
+        self.assertEqual(7, event_id)
+
+
+class Test_Schedule_Columnar(unittest.TestCase):
+
+    def setUp(self):
+        load_in_events = [
+            "ATND|2021-01-05 Tue|09:00|10:00|work|standup",
+            "DDLN|2021-01-05 Tue|09:00|90|school|essay",
+            "ATND|2021-01-06 Wed|13:30||home|plumber",
+            "DDLN|2021-01-07 Thu|23:59||school|problem set"]
+        self.schedule = Module.Schedule(load_in_events=load_in_events)
+        self.columnar_schedule = Module.Schedule(load_in_events=load_in_events, columnar=True)
+
+
+    def test_same_as_object_store(self):
+        """
+        A Schedule holding its events in columns behaves the same through modifications and
+                deletions
+        """
+        for schedule in (self.schedule, self.columnar_schedule):
+            schedule.replace_attendance_event(1, end_time="11:00", tag="team")
+            schedule.replace_deadline_event(4, date="2021-01-08 Fri")
+            schedule.delete_event(3)
+        self.assertEqual(self.schedule.get_print_str(), self.columnar_schedule.get_print_str())
+        self.assertEqual(self.schedule.list_of_load_in_strings_for_events(),
+                self.columnar_schedule.list_of_load_in_strings_for_events())
+        self.assertEqual(self.schedule.get_totals(tag="team"),
+                self.columnar_schedule.get_totals(tag="team"))
+        self.assertEqual("11:00", self.columnar_schedule._get_event(1).end_time)
+
+
+    def test_same_queries_as_object_store(self):
+        """
+        The array backed indexes of a columnar Schedule answer every query the same, through
+                adds out of order and archiving
+        """
+        for schedule in (self.schedule, self.columnar_schedule):
+            schedule.add_attendance_event("2021-01-05 Tue", "09:30", "12:00", "work",
+                    "standup overflow")
+            schedule.add_attendance_event("2021-01-04 Mon", "08:00", "09:00", "school",
+                    "essay draft")
+            schedule.delete_event(2)
+        for query in (lambda schedule: list(schedule.iter_filtered_events(tag="work")),
+                lambda schedule: list(schedule.iter_filtered_events(event_type="ATND",
+                    start_date="2021-01-05 Tue", end_date="2021-01-06 Wed")),
+                lambda schedule: schedule.search_events("standup"),
+                lambda schedule: schedule.get_all_attendance_conflicts(),
+                lambda schedule: list(islice(schedule.iter_free_slots(60, "2021-01-05 Tue"), 3)),
+                lambda schedule: schedule.archive_events("2021-01-06 Wed"),
+                lambda schedule: schedule.list_of_load_in_strings_for_events()):
+            self.assertEqual(get_comparable(query(self.schedule)),
+                    get_comparable(query(self.columnar_schedule)))
+
+
+    def test_next_day_reads_only_first_key(self):
+        """
+        Finding the next day with events reads the keys from that day on one at a time rather than
+                copying every key after it, so doing so for each printed day does not take time in
+                the number of events after the day
+        """
+        class Counting_Array(array):
+            read_count = 0
+
+            def __getitem__(self, index):
+                item = super().__getitem__(index)
+                Counting_Array.read_count += len(item) if isinstance(index, slice) else 1
+                return item
+
+        schedule = Module.Schedule(load_in_events=["ATND|" + Module.get_date_str(day_ordinal) +
+                "|09:00||work|standup" for day_ordinal in range(737800, 738800)], columnar=True)
+        packed_key_array = schedule._Schedule__event_keys._Array_Key_Index__keys
+        packed_key_array._Packed_Key_Array__keys = Counting_Array('Q',
+                packed_key_array._Packed_Key_Array__keys)
+        self.assertEqual(737900, schedule._get_next_day(737900))
+        self.assertGreater(20, Counting_Array.read_count)  # the bisect to the day, then one key
+
+
+
+class Test_Schedule_Nested(unittest.TestCase):
+
+    def test_same_as_flat(self):
+        """
+        A Schedule keeping its event order in nested containers gives the same order
+        """
+        load_in_events = [
+            "DDLN|2021-01-07 Thu|23:59||school|problem set",
+            "ATND|2021-01-05 Tue|09:00|10:00|work|standup",
+            "DDLN|2021-01-05 Tue|09:00|90|school|essay",
+            "ATND|2021-01-06 Wed|13:30||school|lecture"]
+        schedule = Module.Schedule(load_in_events=load_in_events)
+        nested_schedule = Module.Schedule(load_in_events=load_in_events, nested=True)
+        for each_schedule in (schedule, nested_schedule):
+            each_schedule.replace_attendance_event(2, date="2021-01-08 Fri")
+            each_schedule.delete_event(4)
+        self.assertEqual(schedule.list_of_load_in_strings_for_events(),
+                nested_schedule.list_of_load_in_strings_for_events())
+        self.assertEqual([event_id for event_id, _ in
+                schedule.iter_events(start_date="2021-01-06 Wed")], [event_id for event_id, _ in
+                nested_schedule.iter_events(start_date="2021-01-06 Wed")])
+
+
+
+class Test_Schedule_Recurring(unittest.TestCase):
+
+    def setUp(self):
+        self.schedule = Module.Schedule(load_in_events=[
+            "ATND|2021-01-05 Tue|09:00|10:00|work|planning",
+            "RCUR|WEEKLY|1|0,2||4|ATND|2021-01-04 Mon|09:30|09:45|work|standup",
+            "RCUR|MONTHLY|1||||DDLN|2021-01-06 Wed|23:59||home|rent"])
+
+
+    def test_occurrences(self):
+        """
+        Occurrences of all recurring events in a range come in chronological order
+        """
+        self.assertEqual([(2, "2021-01-04 Mon"), (2, "2021-01-06 Wed"), (3, "2021-01-06 Wed"),
+                (2, "2021-01-11 Mon"), (2, "2021-01-13 Wed")], [(event_id, occurrence.date) for
+                event_id, occurrence in self.schedule.get_occurrences(end_date="2021-01-31 Sun")])
+        self.assertEqual([(3, "2021-02-06 Sat")], [(event_id, occurrence.date) for
+                event_id, occurrence in self.schedule.get_occurrences(
+                start_date="2021-01-14 Thu", end_date="2021-02-28 Sun")])
+
+
+    def test_print_merges_occurrences(self):
+        """
+        A print with an end date merges the occurrences in with the stored events, filtered the
+                same way
+        """
+        print_str = self.schedule.get_print_str(start_date="2021-01-05 Tue",
+                end_date="2021-01-06 Wed")
+        self.assertLess(print_str.index("planning"), print_str.index("standup"))
+        self.assertLess(print_str.index("standup"), print_str.index("rent"))
+        self.assertNotIn("rent", self.schedule.get_print_str(tag="work",
+                start_date="2021-01-05 Tue", end_date="2021-01-06 Wed"))
+
+
+    def test_print_lists_rules(self):
+        """
+        A print without an end date lists the recurring events by their rules instead
+        """
+        print_str = self.schedule.get_print_str()
+        self.assertIn("RECURRING:", print_str)
+        self.assertEqual(1, print_str.count("standup"))
+        self.assertNotIn("rent", self.schedule.get_print_str(event_type=ENUM_Event_Type.ATND))
+
+
+    def test_add_and_delete_refresh_occurrences(self):
+        """
+        Cached occurrences are dropped when a recurring event is added or deleted
+        """
+        self.assertEqual(5, len(self.schedule.get_occurrences(end_date="2021-01-31 Sun")))
+        event_id, _ = self.schedule.add_recurring_deadline_event("DAILY", 1, (), "2021-01-03 Sun",
+                None, "2021-01-01 Fri", "08:00", None, "home", "bins")
+        self.assertEqual(8, len(self.schedule.get_occurrences(end_date="2021-01-31 Sun")))
+        self.schedule.delete_event(2)
+        self.assertEqual(4, len(self.schedule.get_occurrences(end_date="2021-01-31 Sun")))
+        self.assertIsNone(self.schedule._get_event(2))
+
+
+    def test_save_strings(self):
+        """
+        Recurring events are saved by their rules after the stored events, and are not part of
+                the stored event queries
+        """
+        load_in_strings = self.schedule.list_of_load_in_strings_for_events()
+        self.assertEqual(3, len(load_in_strings))
+        self.assertTrue(load_in_strings[1].startswith("RCUR|WEEKLY|1|0,2||4|"))
+        self.assertEqual([1], [event_id for event_id, _ in self.schedule.iter_events()])
+
+
+    def test_search_finds_recurring(self):
+        """
+        Recurring events are found by the description and tag of their template, after the stored
+                events, until they are deleted
+        """
+        self.schedule.add_attendance_event("2021-01-07 Thu", "10:00", "10:30", "work",
+                "standup notes")
+        self.assertEqual([4, 2], [event_id for event_id, _ in
+                self.schedule.search_events("standup")])
+        self.assertEqual([3], [event_id for event_id, _ in self.schedule.search_events("rent home")])
+        self.schedule.delete_event(2)
+        self.assertEqual([4], [event_id for event_id, _ in self.schedule.search_events("standup")])
+
+
+    def test_conflicts_with_occurrences(self):
+        """
+        Occurrences conflict with the ATTENDANCE events their spans overlap
+        """
+        event_id, _ = self.schedule.add_attendance_event("2021-01-06 Wed", "09:40", "10:00", "home",
+                "call")
+        self.assertEqual([(2, "2021-01-06 Wed")], [(conflict_id, conflict.date) for
+                conflict_id, conflict in self.schedule.get_attendance_conflicts(event_id)])
+        self.assertEqual([((2, "2021-01-06 Wed"), (event_id, "2021-01-06 Wed"))],
+                [((first[0], first[1].date), (second[0], second[1].date)) for first, second in
+                self.schedule.get_all_attendance_conflicts()])
+        self.assertEqual([], self.schedule.get_all_attendance_conflicts(
+                start_date="2021-01-07 Thu"))
+
+
+    def test_free_slots_around_occurrences(self):
+        """
+        The spans of occurrences are busy, occurrences without spans take no time
+        """
+        self.assertEqual([("2021-01-04 Mon", "09:00", "2021-01-04 Mon", "09:30"),
+                          ("2021-01-04 Mon", "09:45", "2021-01-04 Mon", "11:00")],
+                         list(self.schedule.iter_free_slots(30, "2021-01-04 Mon",
+                            end_date="2021-01-04 Mon", between_times=("09:00", "11:00"))))
+        self.assertEqual(("2021-01-13 Wed", "09:45", None, None),
+                list(self.schedule.iter_free_slots(60, "2021-01-05 Tue"))[-1])
+
+
+    def test_occupancy_of_occurrences(self):
+        """
+        The spans of occurrences mark the days they are on
+        """
+        self.assertEqual(15, Module.get_booked_minutes(
+                self.schedule.get_day_occupancy("2021-01-11 Mon")))
+        self.assertFalse(self.schedule.is_time_free("2021-01-13 Wed", "09:30", "09:31"))
+        self.assertTrue(self.schedule.is_time_free("2021-01-18 Mon", "09:30", "09:45"))
+        self.assertIn("Booked: 3% of 2 days", self.schedule.get_occupancy_print_str(
+                "2021-01-04 Mon", "2021-01-05 Tue"))
+
+
+    def test_totals_count_occurrences(self):
+        """
+        Occurrences count towards their own dates, without an end date only up to the last date of
+                a stored event or of an occurrence of a recurring event that ends
+        """
+        self.assertEqual({ENUM_Event_Type.ATND: (1 + 4, 60 + 4 * 15), ENUM_Event_Type.DDLN: (1, 0)},
+                self.schedule.get_totals())
+        self.assertEqual({ENUM_Event_Type.ATND: (0, 0), ENUM_Event_Type.DDLN: (3, 0)},
+                self.schedule.get_totals(end_date="2021-03-31 Wed", tag="home"))
+        self.assertEqual({ENUM_Event_Type.ATND: (2, 30), ENUM_Event_Type.DDLN: (0, 0)},
+                self.schedule.get_totals(start_date="2021-01-07 Thu", end_date="2021-03-31 Wed",
+                    tag="work"))
+
+
+
+
+class Test_Schedule_Archive(unittest.TestCase):
+
+    def setUp(self):
+        self.load_in_events = [
+            "ATND|2020-12-30 Wed|09:00|10:00|work|planning",
+            "DDLN|2020-12-30 Wed|17:00|30|school|essay",
+            "ATND|2020-12-31 Thu|23:00|01:00|home|new year party",
+            "ATND|2021-01-01 Fri|00:30|02:00|home|party cleanup",
+            "DDLN|2021-01-04 Mon|23:59||school|problem set",
+            "RCUR|DAILY|1|||2|ATND|2020-12-01 Tue|08:00|08:30|gym|run"]
+        self.schedule = Module.Schedule(load_in_events=self.load_in_events)
+
+
+    def test_same_as_deleting(self):
+        """
+        Archiving leaves the Schedule as deleting each of the archived events would
+        """
+        deleted_schedule = Module.Schedule(load_in_events=self.load_in_events)
+        for event_id in (1, 2, 3):
+            deleted_schedule.delete_event(event_id)
+        self.assertEqual(self.load_in_events[:3], [load_in_string.strip("\n") for
+                load_in_string in self.schedule.archive_events("2021-01-01 Fri")])
+        self.assertEqual(deleted_schedule.get_print_str(), self.schedule.get_print_str())
+        for schedule in (self.schedule, deleted_schedule):
+            self.assertEqual({ENUM_Event_Type.ATND: (1 + 2, 90 + 2 * 30),
+                    ENUM_Event_Type.DDLN: (1, 0)}, schedule.get_totals())  # with the two runs
+            self.assertEqual({ENUM_Event_Type.ATND: (0, 0), ENUM_Event_Type.DDLN: (0, 0)},
+                    schedule.get_totals(tag="work"))
+            self.assertEqual(0, schedule.get_day_occupancy("2020-12-31 Thu"))
+            self.assertEqual(((1 << 90) - 1) << 30, schedule.get_day_occupancy("2021-01-01 Fri"))
+            self.assertEqual([], schedule.search_events("essay"))
+            self.assertEqual([], list(schedule.iter_filtered_events(tag="school",
+                    end_date="2021-01-03 Sun")))
+            self.assertEqual(("2020-12-30 Wed", "00:00", "2021-01-01 Fri", "00:30"),
+                    next(schedule.iter_free_slots(60, "2020-12-30 Wed")))
+
+
+    def test_nothing_to_archive(self):
+        """
+        Archiving before the first event changes nothing
+        """
+        print_str = self.schedule.get_print_str()
+        self.assertEqual([], self.schedule.archive_events("2020-12-30 Wed"))
+        self.assertEqual(print_str, self.schedule.get_print_str())
+
+
+    def test_restore(self):
+        """
+        Restored events are back in the Schedule and its indexes under new ids
+        """
+        archived = self.schedule.archive_events("2021-01-05 Tue")
+        self.assertEqual(1, len(self.schedule.list_of_load_in_strings_for_events()))
+        self.assertEqual([7, 8, 9, 10, 11], self.schedule.restore_events(archived))
+        self.assertEqual([load_in_event + "\n" for load_in_event in self.load_in_events],
+                self.schedule.list_of_load_in_strings_for_events())
+        self.assertEqual([9, 10],
+                [event_id for event_id, _ in self.schedule.search_events("party")])
+
+
+
+
+class Test_Schedule_Undo(unittest.TestCase):
+
+    def setUp(self):
+        self.load_in_events = [
+            "ATND|2021-01-05 Tue|09:00|10:00|work|standup",
+            "DDLN|2021-01-06 Wed|17:00|30|school|essay",
+            "RCUR|DAILY|1|||2|ATND|2021-01-04 Mon|08:00|08:30|gym|run"]
+        self.schedule = Module.Schedule(load_in_events=self.load_in_events, history_depth=3)
+
+
+    def get_state(self, schedule):
+        return schedule.get_print_str(end_date="2021-01-31 Sun"), schedule.get_totals(), \
+                schedule.get_day_occupancy("2021-01-05 Tue"), \
+                [(event_id, str(event)) for event_id, event in schedule.search_events("standup")]
+
+
+    def test_undo_and_redo(self):
+        """
+        Undoing every change gives back the loaded Schedule, redoing them gives back the changed one
+        """
+        loaded_state = self.get_state(self.schedule)
+        self.schedule.add_attendance_event("2021-01-05 Tue", "09:30", "11:00", "home", "plumber")
+        self.schedule.replace_attendance_event(1, time="13:00", description="retro")
+        self.schedule.delete_event(3)
+        changed_state = self.get_state(self.schedule)
+        self.assertEqual([(ENUM_Operation_Type.DELETE, 3), (ENUM_Operation_Type.MODIFY, 1),
+                (ENUM_Operation_Type.ADD, 4)], self.schedule.undo(5))
+        self.assertEqual(loaded_state, self.get_state(self.schedule))
+        self.assertEqual([(ENUM_Operation_Type.ADD, 4), (ENUM_Operation_Type.MODIFY, 1)],
+                self.schedule.redo(2))
+        self.assertEqual([(ENUM_Operation_Type.DELETE, 3)], self.schedule.redo())
+        self.assertEqual(changed_state, self.get_state(self.schedule))
+        self.assertEqual([], self.schedule.redo())
+
+
+    def test_new_change_clears_redo(self):
+        """
+        Undone changes can no longer be redone once a new change is made
+        """
+        self.schedule.delete_event(2)
+        self.schedule.undo()
+        self.schedule.add_deadline_event("2021-01-08 Fri", "12:00", None, "home", "rent")
+        self.assertEqual([], self.schedule.redo())
+
+
+    def test_history_depth(self):
+        """
+        Only the latest changes, as many as the history depth, can be undone
+        """
+        for _ in range(5):
+            self.schedule.replace_deadline_event(2, duration=self.schedule._get_event(2).duration
+                    + 1)
+        self.assertEqual(3, len(self.schedule.undo(5)))
+        self.assertEqual(32, self.schedule._get_event(2).duration)
+
+
+    def test_columnar(self):
+        """
+        Undo works the same when events are rebuilt from columns on every access
+        """
+        schedule = Module.Schedule(load_in_events=self.load_in_events, columnar=True)
+        schedule.replace_attendance_event(1, set_end_time_to_none=True, tag="team")
+        schedule.delete_event(1)
+        schedule.undo(2)
+        self.assertEqual(self.load_in_events[0] + "\n",
+                schedule.list_of_load_in_strings_for_events()[0])
+
+
+
+
+class Test_Schedule_Snapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.load_in_events = [
+            "ATND|2021-01-04 Mon|09:00|10:00|work|standup",
+            "DDLN|2021-01-05 Tue|17:00|30|school|essay",
+            "ATND|2021-01-05 Tue|13:30||home|plumber",
+            "DDLN|2021-01-07 Thu|23:59||school|problem set",
+            "RCUR|DAILY|1|||2|ATND|2021-01-04 Mon|08:00|08:30|gym|run"]
+        self.schedule = Module.Schedule(load_in_events=self.load_in_events)
+
+
+    def change_schedule(self, schedule):
+        schedule.add_attendance_event("2021-01-05 Tue", "08:00", None, "home", "breakfast")
+        schedule.add_deadline_event("2021-01-09 Sat", "12:00", None, "home", "rent")
+        schedule.replace_attendance_event(1, tag="team")
+        schedule.replace_deadline_event(2, date="2021-01-06 Wed")
+        schedule.delete_event(4)
+        schedule.delete_event(5)
+        schedule.add_recurring_deadline_event("DAILY", 1, (), None, 1, "2021-01-01 Fri", "08:00",
+                None, "home", "bins")
+
+
+    def test_unchanged_by_later_changes(self):
+        """
+        A snapshot keeps showing the events as they were when it was taken
+        """
+        snapshot = self.schedule.snapshot()
+        load_in_strings = self.schedule.list_of_load_in_strings_for_events()
+        print_str = self.schedule.get_print_str()
+        self.change_schedule(self.schedule)
+        self.schedule.archive_events("2021-01-06 Wed")
+        self.assertEqual(load_in_strings, snapshot.list_of_load_in_strings_for_events())
+        self.assertEqual(print_str, snapshot.get_print_str())
+        self.assertEqual([(3, "plumber"), (2, "essay")], [(event_id, event.description) for
+                event_id, event in snapshot.iter_events(start_date="2021-01-05 Tue",
+                end_date="2021-01-06 Wed")])
+
+
+    def test_matches_schedule_when_taken(self):
+        """
+        Snapshots taken at different times each match the Schedule at their time
+        """
+        first_snapshot = self.schedule.snapshot()
+        self.change_schedule(self.schedule)
+        second_snapshot = self.schedule.snapshot()
+        changed_load_in_strings = self.schedule.list_of_load_in_strings_for_events()
+        changed_print_str = self.schedule.get_print_str()
+        self.schedule.undo(7)
+        self.assertEqual(changed_load_in_strings,
+                second_snapshot.list_of_load_in_strings_for_events())
+        self.assertEqual(changed_print_str, second_snapshot.get_print_str())
+        self.assertEqual(self.schedule.list_of_load_in_strings_for_events(),
+                first_snapshot.list_of_load_in_strings_for_events())
+
+
+    def test_changed_during_iteration(self):
+        """
+        Changing the Schedule while iterating over a snapshot does not disturb the iteration
+        """
+        snapshot = self.schedule.snapshot()
+        iterated_ids = []
+        for event_id, _ in snapshot.iter_events():
+            iterated_ids.append(event_id)
+            self.schedule.delete_event(event_id + 1)
+            self.schedule.add_deadline_event("2021-01-08 Fri", "09:00", None, "home", "extra")
+        self.assertEqual([1, 3, 2, 4], iterated_ids)
+
+
+    def test_columnar(self):
+        """
+        Snapshots of a Schedule holding its events in columns keep the events as they were too
+        """
+        schedule = Module.Schedule(load_in_events=self.load_in_events, columnar=True)
+        snapshot = schedule.snapshot()
+        self.change_schedule(schedule)
+        self.assertEqual(self.schedule.list_of_load_in_strings_for_events(),
+                snapshot.list_of_load_in_strings_for_events())
+
+
+
+
+class Test_Schedule_Print_Chunks(unittest.TestCase):
+
+    def setUp(self):
+        self.schedule = Module.Schedule(load_in_events=[
+            "ATND|2021-01-05 Tue|09:00|10:00|work|standup",
+            "DDLN|2021-01-05 Tue|17:00|30|school|essay",
+            "ATND|2021-01-06 Wed|13:30||home|plumber",
+            "RCUR|DAILY|1|||2|ATND|2021-01-04 Mon|08:00|08:30|gym|run"])
+
+
+    def test_chunk_per_date(self):
+        """
+        The chunks are the heading, one per date, and the recurring rules, and make up the print
+        """
+        chunks = list(self.schedule.iter_print_chunks())
+        self.assertEqual(4, len(chunks))
+        self.assertTrue(chunks[1].startswith("\n2021-01-05 Tue:"))
+        self.assertEqual(2, chunks[1].count("\n\t\t"))
+        self.assertEqual(self.schedule.get_print_str(), "".join(chunks))
+        self.assertEqual(self.schedule.get_print_str(start_date="2021-01-05 Tue",
+                end_date="2021-01-05 Tue"), "".join(self.schedule.iter_print_chunks(
+                start_date="2021-01-05 Tue", end_date="2021-01-05 Tue")))
+
+
+    def test_head(self):
+        """
+        Only the first events are printed, with a note if there were more
+        """
+        print_str = "".join(self.schedule.iter_print_chunks(end_date="2021-01-31 Sun", head=2))
+        self.assertEqual(["run", "run"], [line.rsplit(": ", 1)[1] for line in
+                print_str.split("\n") if line.startswith("\t\t") and ": " in line])
+        self.assertIn("only the first 2 events are shown", print_str)
+        self.assertNotIn("only the first", "".join(self.schedule.iter_print_chunks(
+                end_date="2021-01-31 Sun", head=5)))
+
+
+    def test_lazy(self):
+        """
+        Events past the chunks taken are never read
+        """
+        read_dates = []
+        chunks = Module.iter_schedule_print_chunks(read_dates.append(event.date) or
+                (event_id, event) for event_id, event in self.schedule.iter_events())
+        next(chunks)
+        next(chunks)
+        self.assertEqual(["2021-01-05 Tue", "2021-01-05 Tue", "2021-01-06 Wed"], read_dates)
+
+
+
+
+class Test_Schedule_Print_Cache(unittest.TestCase):
+
+    def setUp(self):
+        self.schedule = Module.Schedule(load_in_events=[
+            "ATND|2021-01-05 Tue|09:00|10:00|work|standup",
+            "DDLN|2021-01-05 Tue|17:00|30|school|essay",
+            "ATND|2021-01-06 Wed|13:30||home|plumber",
+            "DDLN|2021-01-07 Thu|23:59||school|problem set"])
+
+
+    def assert_print_up_to_date(self):
+        self.assertEqual(Module.get_schedule_print_str(self.schedule.iter_events()),
+                self.schedule.get_print_str())
+
+
+    def test_changed_days_reprinted(self):
+        """
+        Only the days whose events changed are printed again, the others reuse their chunks
+        """
+        chunks = list(self.schedule.iter_print_chunks())
+        self.schedule.replace_deadline_event(2, tag="home")
+        new_chunks = list(self.schedule.iter_print_chunks())
+        self.assertIsNot(chunks[1], new_chunks[1])
+        self.assertIs(chunks[2], new_chunks[2])
+        self.assertIs(chunks[3], new_chunks[3])
+        self.assertIn("home: essay", new_chunks[1])
+
+
+    def test_up_to_date_after_changes(self):
+        """
+        Prints show every kind of change made since the last print
+        """
+        self.assert_print_up_to_date()
+        self.schedule.add_attendance_event("2021-01-06 Wed", "08:00", None, "home", "breakfast")
+        self.assert_print_up_to_date()
+        self.schedule.replace_attendance_event(1, date="2021-01-07 Thu")
+        self.assert_print_up_to_date()
+        self.schedule.delete_event(3)
+        self.assert_print_up_to_date()
+        self.schedule.undo(3)
+        self.assert_print_up_to_date()
+        self.schedule.archive_events("2021-01-06 Wed")
+        self.assert_print_up_to_date()
+        self.schedule.delete_event(3)
+        self.schedule.delete_event(4)
+        self.assertEqual("SCHEDULE:\n\nSchedule is empty.", self.schedule.get_print_str())
+
+
+    def test_head_and_range(self):
+        """
+        Cached chunks are cut short and bounded the same as printing without the cache
+        """
+        self.schedule.get_print_str()
+        for head in (1, 2, 3, 4, 5):
+            self.assertEqual("".join(Module.iter_schedule_print_chunks(
+                    self.schedule.iter_events(), head=head)),
+                    "".join(self.schedule.iter_print_chunks(head=head)))
+        self.assertEqual(Module.get_schedule_print_str(self.schedule.iter_events(
+                start_date="2021-01-06 Wed", end_date="2021-01-06 Wed"),
+                empty_message="No events in the date range."), self.schedule.get_print_str(
+                start_date="2021-01-06 Wed", end_date="2021-01-06 Wed"))
+        self.assertTrue(self.schedule.get_print_str(start_date="2021-01-08 Fri").endswith(
+                "No events in the date range."))
+
+
+
+class Test_Schedule_Unsaved_Changes(unittest.TestCase):
+
+    def setUp(self):
+        self.load_in_events = [
+            "ATND|2021-01-05 Tue|09:00|10:00|work|standup",
+            "DDLN|2021-01-06 Wed|17:00|30|school|essay",
+            "ATND|2021-01-07 Thu|12:00||home|lunch",
+            "RCUR|DAILY|1|||2|ATND|2021-01-04 Mon|08:00|08:30|gym|run"]
+        self.schedule = Module.Schedule(load_in_events=self.load_in_events)
+
+
+    def change_schedule(self):
+        self.schedule.add_deadline_event("2021-01-08 Fri", "23:59", None, "school",
+                "problem set")
+        self.schedule.replace_attendance_event(1, time="09:30")
+        self.schedule.replace_attendance_event(3, description="long lunch")
+        self.schedule.delete_event(2)
+        self.schedule.delete_event(4)
+        self.schedule.add_attendance_event("2021-01-09 Sat", "10:00", None, "home", "brunch")
+        self.schedule.delete_event(6)
+
+
+    def test_loaded_events_saved(self):
+        """
+        Loading events is not a change
+        """
+        self.assertEqual([], self.schedule.pop_unsaved_changes())
+
+
+    def test_changes_as_they_are_now(self):
+        """
+        Each changed event is given once, as it is now, and is only given until taken
+        """
+        self.change_schedule()
+        self.assertEqual([
+            (1, "ATND|2021-01-05 Tue|09:30|10:00|work|standup"),
+            (2, None),
+            (3, "ATND|2021-01-07 Thu|12:00||home|long lunch"),
+            (4, None),
+            (5, "DDLN|2021-01-08 Fri|23:59||school|problem set"),
+            (6, None)], self.schedule.pop_unsaved_changes())
+        self.assertEqual([], self.schedule.pop_unsaved_changes())
+        self.schedule.undo()
+        self.assertEqual([(6, "ATND|2021-01-09 Sat|10:00||home|brunch")],
+                self.schedule.pop_unsaved_changes())
+
+
+    def test_apply_to_loaded(self):
+        """
+        Applying the changes to the events loaded again gives the same Schedule, ids included
+        """
+        self.change_schedule()
+        changes = self.schedule.pop_unsaved_changes()
+        applied_schedule = Module.Schedule(load_in_events=self.load_in_events)
+        applied_schedule.apply_changes(changes)
+        self.assertEqual(self.schedule.get_print_str(end_date="2021-01-31 Sun"),
+                applied_schedule.get_print_str(end_date="2021-01-31 Sun"))
+        self.assertEqual([], applied_schedule.pop_unsaved_changes())
+        self.assertEqual([], applied_schedule.undo())
+        self.assertEqual(self.schedule.add_deadline_event("2021-01-10 Sun", "12:00", None,
+                "home", "rent")[0], applied_schedule.add_deadline_event("2021-01-10 Sun",
+                "12:00", None, "home", "rent")[0])
+
+
+    def test_archive(self):
+        """
+        Archived events are changes
+        """
+        self.schedule.archive_events("2021-01-07 Thu")
+        self.assertEqual([(1, None), (2, None)], self.schedule.pop_unsaved_changes())
+
+
+    def test_backup_changes(self):
+        """
+        The changes since the last backup are given as the events as they were and as they are
+                now, leaving out events added and deleted in between, and are only given until taken
+        """
+        self.assertEqual(([], []), self.schedule.pop_backup_changes())
+        self.change_schedule()
+        self.schedule.pop_unsaved_changes()  # saving does not take them
+        removed_load_in_strings, added_load_in_strings = self.schedule.pop_backup_changes()
+        self.assertEqual(sorted(self.load_in_events), sorted(removed_load_in_strings))
+        self.assertEqual(sorted(["ATND|2021-01-05 Tue|09:30|10:00|work|standup",
+                "ATND|2021-01-07 Thu|12:00||home|long lunch",
+                "DDLN|2021-01-08 Fri|23:59||school|problem set"]), sorted(added_load_in_strings))
+        self.assertEqual(([], []), self.schedule.pop_backup_changes())
+        self.schedule.replace_attendance_event(3, description="lunch")
+        self.schedule.replace_attendance_event(3, description="long lunch")
+        self.assertEqual(([], []), self.schedule.pop_backup_changes())
+        self.schedule.archive_events("2021-01-06 Wed")
+        self.assertEqual((["ATND|2021-01-05 Tue|09:30|10:00|work|standup"], []),
+                self.schedule.pop_backup_changes())
+
+
+
+
+
+
+# MAIN
+if __name__ == '__main__':
+    unittest.main()
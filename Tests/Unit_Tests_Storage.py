@@ -0,0 +1,177 @@
+"""
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+import os
+import tempfile
+import unittest
+
+import Storage as Module
+from Schedule import Schedule
+
+
+
+# TEST CASES
+class Test_Storage(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.load_in_events = [
+            "ATND|2021-01-04 Mon|09:00|10:00|work|standup",
+            "DDLN|2021-01-05 Tue|09:00|90|school|essay",
+            "ATND|2021-01-05 Tue|13:30||home|plumber",
+            "DDLN|2021-01-07 Thu|23:59||school|problem set",
+            "RCUR|DAILY|2|||3|ATND|2021-01-04 Mon|08:00|08:30|gym|run"]
+        self.storages = []
+
+
+    def tearDown(self):
+        for storage in self.storages:
+            storage.close()
+        self.temporary_directory.cleanup()
+
+
+    def get_path(self, file_name):
+        return os.path.join(self.temporary_directory.name, file_name)
+
+
+    def get_storages(self):
+        self.storages = [
+            Module.Text_Storage(self.get_path("events.txt"), self.get_path("events_journal.txt"),
+                self.get_path("events_index.bin")),
+            Module.Text_Storage(self.get_path("events.bin"), self.get_path("events_journal.bin"),
+                self.get_path("events_index.bin"), binary=True),
+            Module.SQLite_Storage(self.get_path("events.db"))]
+        return self.storages
+
+
+    def change_schedule(self, schedule):
+        schedule.delete_event(2)
+        schedule.replace_attendance_event(3, date="2021-01-06 Wed")
+        schedule.add_deadline_event("2021-01-06 Wed", "17:00", None, "work", "report")
+
+
+    def test_saved_changes_loaded(self):
+        """
+        Saved changes are loaded back under the same ids, unsaved ones are not
+        """
+        for storage in self.get_storages():
+            self.assertFalse(storage.exists())
+            schedule = Schedule(load_in_events=self.load_in_events)
+            storage.compact(schedule)
+            self.assertTrue(storage.exists())
+            self.change_schedule(schedule)
+            storage.save(schedule)
+            schedule.delete_event(1)
+            loaded_schedule = storage.load(history_depth=10)
+            schedule.undo()
+            self.assertEqual(schedule.get_print_str(end_date="2021-01-31 Sun"),
+                    loaded_schedule.get_print_str(end_date="2021-01-31 Sun"))
+
+
+    def test_get_schedule(self):
+        """
+        Date ranges read without loading print as the loaded Schedule does within the range,
+                filters included
+        """
+        for storage in self.get_storages():
+            schedule = Schedule(load_in_events=self.load_in_events)
+            storage.compact(schedule)
+            self.change_schedule(schedule)
+            storage.save(schedule)
+            if not storage.open_ranges():  # binary
+                continue
+            for start_date, end_date, tag in (("2021-01-05 Tue", "2021-01-06 Wed", None),
+                    ("2021-01-06 Wed", None, "work"), (None, "2021-01-05 Tue", "gym")):
+                self.assertEqual(schedule.get_print_str(tag=tag, start_date=start_date,
+                        end_date=end_date), storage.get_schedule(start_date, end_date,
+                        tag=tag).get_print_str(tag=tag, start_date=start_date, end_date=end_date))
+
+
+    def test_remove(self):
+        """
+        Nothing is left once removed
+        """
+        for storage in self.get_storages():
+            schedule = Schedule(load_in_events=self.load_in_events)
+            storage.compact(schedule)
+            schedule.delete_event(1)
+            storage.save(schedule)
+            storage.remove()
+            self.assertFalse(storage.exists())
+            self.assertEqual("SCHEDULE:\n\nSchedule is empty.",
+                    storage.load(history_depth=10).get_print_str())
+        self.assertEqual([], os.listdir(self.temporary_directory.name))
+
+
+
+class Test_SQLite_Storage(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.storage = Module.SQLite_Storage(os.path.join(self.temporary_directory.name,
+                "events.db"))
+        self.load_in_events = [
+            "ATND|2021-01-04 Mon|09:00|10:00|work|standup",
+            "DDLN|2021-01-05 Tue|09:00|90|school|essay",
+            "RCUR|WEEKLY|1|0,2||4|DDLN|2021-01-04 Mon|12:00||home|plants",
+            "ATND|2021-01-05 Tue|13:30||home|plumber"]
+
+
+    def tearDown(self):
+        self.storage.close()
+        self.temporary_directory.cleanup()
+
+
+    def test_ids_kept(self):
+        """
+        Ids are stored, so they are kept across compaction and loading
+        """
+        schedule = Schedule(load_in_events=self.load_in_events)
+        schedule.delete_event(1)
+        self.storage.compact(schedule)
+        self.assertEqual(schedule.get_print_str(), self.storage.load(
+                history_depth=10).get_print_str())
+
+
+    def test_ranges_follow_saves(self):
+        """
+        A date range is read as saved, so it can be read in place of the loaded Schedule
+        """
+        self.storage.compact(Schedule(load_in_events=self.load_in_events))
+        schedule = self.storage.load(history_depth=10)
+        schedule.replace_attendance_event(4, date="2021-01-04 Mon")
+        self.storage.save(schedule)
+        self.assertTrue(self.storage.answers_range_queries and self.storage.open_ranges())
+        self.assertEqual(schedule.get_print_str(start_date="2021-01-04 Mon",
+                end_date="2021-01-05 Tue"), self.storage.get_schedule("2021-01-04 Mon",
+                "2021-01-05 Tue").get_print_str(start_date="2021-01-04 Mon",
+                end_date="2021-01-05 Tue"))
+
+
+    def test_filters_pushed_down(self):
+        """
+        Only the rows in the range, of the tag and type, and the recurring events are read
+        """
+        self.storage.compact(Schedule(load_in_events=self.load_in_events))
+        self.storage.open_ranges()
+        self.assertEqual([(4, "ATND|2021-01-05 Tue|13:30||home|plumber")],
+                [(event_id, event.to_load_in_string()) for event_id, event in
+                    self.storage.get_schedule("2021-01-05 Tue", "2021-01-05 Tue", tag="home",
+                    event_type="ATND").iter_events()])
+        self.assertEqual(["RCUR|WEEKLY|1|0,2||4|DDLN|2021-01-04 Mon|12:00||home|plants\n"],
+                self.storage.get_schedule("2021-01-05 Tue", "2021-01-05 Tue", tag="home",
+                    event_type="ATND").list_of_load_in_strings_for_events()[1:])
+
+
+
+
+
+
+# MAIN
+if __name__ == '__main__':
+    unittest.main()
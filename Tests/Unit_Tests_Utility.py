@@ -0,0 +1,63 @@
+"""
+Written by Cole Anderson
+"""
+__author__ = "Cole Anderson"
+
+
+
+# IMPORTS
+import io
+import unittest
+
+import Utility as Module
+
+
+
+# TEST CASES
+class Test_Write_Chunks(unittest.TestCase):
+
+    def test_write(self):
+        stream = io.StringIO()
+        Module.write_chunks(iter(["SCHEDULE:\n", "\n2021-01-05 Tue:", "\n\t\tevent"]), stream)
+        self.assertEqual("SCHEDULE:\n\n2021-01-05 Tue:\n\t\tevent", stream.getvalue())
+
+
+
+class Test_Page_Chunks(unittest.TestCase):
+
+    def setUp(self):
+        self.chunks = ["SCHEDULE:\n", "\n2021-01-05 Tue:\n\t\tfirst\n\t\tsecond",
+                "\n2021-01-06 Wed:\n\t\tthird"]
+        self.prompts = []
+
+
+    def test_pages(self):
+        """
+        The user is prompted after each full page, and the rest is written after the response
+        """
+        stream = io.StringIO()
+        Module.page_chunks(self.chunks, 3, stream, read_input=lambda prompt:
+                self.prompts.append(prompt) or "")
+        self.assertEqual(2, len(self.prompts))
+        self.assertEqual("SCHEDULE:\n\n2021-01-05 Tue:\n\t\tfirst\n\t\tsecond\n2021-01-06 Wed:\n"
+                "\t\tthird", stream.getvalue())
+
+
+    def test_quit(self):
+        """
+        Nothing more is written, or made, after the user quits
+        """
+        stream = io.StringIO()
+        chunks = iter(self.chunks)
+        Module.page_chunks(chunks, 2, stream, read_input=lambda prompt: "q")
+        self.assertEqual("SCHEDULE:\n\n", stream.getvalue())
+        self.assertEqual("\n2021-01-06 Wed:\n\t\tthird", next(chunks))
+
+
+
+
+
+
+# MAIN
+if __name__ == '__main__':
+    unittest.main()
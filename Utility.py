@@ -5,6 +5,16 @@ __author__ = "Cole Anderson"
 
 
 
+# IMPORTS
+import sys
+
+
+# CONSTANTS
+OUTPUT_FLUSH_SIZE = 1 << 16  # number of characters written to a stream between flushes
+PAGER_PROMPT = "-- more: enter for the next page, q to stop --"
+
+
+
 # TXT FILE OPERATIONS
 def output_list_to_txt(output: list, output_file_absolute_path: str, overwrite: bool):
     """
@@ -34,3 +44,54 @@ def read_in_txt_as_list(input_file_absolute_path: str) -> list:
     """
     with open(input_file_absolute_path, 'r') as txt_file:
         return [line.strip('\n') for line in txt_file.readlines()]
+
+
+
+# CONSOLE OUTPUT
+def write_chunks(chunks, stream=None):
+    """
+    Write text chunks to a stream as they are made, flushing the first chunk straight away so that
+            output starts before the rest are made, and then only every OUTPUT_FLUSH_SIZE characters
+    :param chunks: iterable of str
+    :param stream: sys.stdout if not given
+    :return: void
+    """
+    stream = sys.stdout if stream is None else stream
+    unflushed_size = OUTPUT_FLUSH_SIZE
+    for chunk in chunks:
+        stream.write(chunk)
+        unflushed_size += len(chunk)
+        if unflushed_size >= OUTPUT_FLUSH_SIZE:
+            stream.flush()
+            unflushed_size = 0
+    stream.flush()
+
+
+def page_chunks(chunks, page_lines: int, stream=None, read_input=input):
+    """
+    Write text chunks to a stream a page of lines at a time, waiting for the user between pages,
+            chunks are only made as they are reached
+    :param chunks: iterable of str
+    :param page_lines: number of lines on a page, at least 1
+    :param stream: sys.stdout if not given
+    :param read_input: called with PAGER_PROMPT between pages, returns the user's response, the
+            rest of the chunks are not written if the response is 'q'
+    :return: void
+    """
+    stream = sys.stdout if stream is None else stream
+    lines_on_page = 1  # the lines started on the current page
+    for chunk in chunks:
+        first_line, *other_lines = chunk.split("\n")
+        stream.write(first_line)
+        for line in other_lines:
+            if lines_on_page == page_lines:
+                stream.write("\n")
+                stream.flush()
+                if read_input(PAGER_PROMPT).strip().lower() == "q":
+                    return
+                stream.write(line)  # the response ended with a newline
+                lines_on_page = 1
+            else:
+                stream.write("\n" + line)
+                lines_on_page += 1
+    stream.flush()